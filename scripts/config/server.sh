@@ -3,6 +3,11 @@ set -euo pipefail
 
 SERVER_BIND_HOST="${SERVER_BIND_HOST:-0.0.0.0}"
 SERVER_PORT="${SERVER_PORT:-8000}"
+export SERVER_BIND_HOST SERVER_PORT
+
+# >1 runs that many WebSocket frontend processes in front of one shared vLLM engine.
+STT_FRONTEND_WORKERS="${STT_FRONTEND_WORKERS:-1}"
+export STT_FRONTEND_WORKERS
 
 HEALTH_URL="${HEALTH_URL:-http://127.0.0.1:${SERVER_PORT}/healthz}"
 HEALTH_TIMEOUT_S="${HEALTH_TIMEOUT_S:-600}"
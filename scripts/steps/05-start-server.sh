@@ -23,7 +23,7 @@ fi
 rm -f "${pid_file}" || true
 
 log_section "[start] Starting server"
-log_info "[start] bind=${SERVER_BIND_HOST}:${SERVER_PORT}"
+log_info "[start] bind=${SERVER_BIND_HOST}:${SERVER_PORT} frontend_workers=${STT_FRONTEND_WORKERS}"
 
 # Ensure log directory exists (SERVER_LOG_FILE may be overridden to a subdir path).
 mkdir -p "$(dirname "${SERVER_LOG_FILE}")" >/dev/null 2>&1 || true
@@ -40,11 +40,18 @@ fi
 rm -f "${LOG_TRIM_PID_FILE}" >/dev/null 2>&1 || true
 
 # Start as a new session so it can be killed via process group.
-setsid nohup "${VENV_DIR}/bin/python" -m uvicorn src.server:app \
-  --app-dir "${ROOT_DIR}" \
-  --host "${SERVER_BIND_HOST}" \
-  --port "${SERVER_PORT}" \
-  --workers 1 </dev/null >>"${SERVER_LOG_FILE}" 2>&1 &
+if [[ ${STT_FRONTEND_WORKERS} =~ ^[0-9]+$ ]] && [[ ${STT_FRONTEND_WORKERS} -gt 1 ]]; then
+  # One engine process plus STT_FRONTEND_WORKERS frontends on a shared socket (src/frontends.py).
+  PYTHONPATH="${ROOT_DIR}${PYTHONPATH:+:${PYTHONPATH}}" setsid nohup "${VENV_DIR}/bin/python" -m src.frontends \
+    </dev/null >>"${SERVER_LOG_FILE}" 2>&1 &
+else
+  # The engine is built in-process, so a single uvicorn worker serves everything.
+  setsid nohup "${VENV_DIR}/bin/python" -m uvicorn src.server:app \
+    --app-dir "${ROOT_DIR}" \
+    --host "${SERVER_BIND_HOST}" \
+    --port "${SERVER_PORT}" \
+    --workers 1 </dev/null >>"${SERVER_LOG_FILE}" 2>&1 &
+fi
 
 pid=$!
 echo "${pid}" >"${pid_file}"
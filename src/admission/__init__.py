@@ -0,0 +1,7 @@
+"""Admission control shared by the realtime path and the HTTP handlers.
+
+Utterance slots, engine-aware load shedding and replica routing sit below both
+``src.realtime`` and ``src.handlers``; keep this package free of imports from either.
+"""
+
+__all__: list[str] = []
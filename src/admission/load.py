@@ -0,0 +1,154 @@
+"""Engine-aware load shedding (backlog bound, utterance admission, client advisories)."""
+
+from __future__ import annotations
+
+import math
+import asyncio
+import logging
+import contextlib
+from typing import Any
+from dataclasses import dataclass
+from collections.abc import Callable
+
+from src.audio.scheduler import FeedScheduler
+from src.config.limits import ASR_SAMPLE_RATE_HZ
+
+from .utterances import UtteranceSlots
+
+logger = logging.getLogger(__name__)
+
+# Pressure (1.0 = at a budget) where shedding starts, and where it reaches its floor.
+_ELEVATED_PRESSURE: float = 0.8
+_OVERLOADED_PRESSURE: float = 1.0
+# Share of the slots the utterance limit may climb back per poll once load eases.
+_UTTERANCE_RAMP_SHARE: float = 0.1
+# Longest one status advisory may take to send; a slower socket just misses it.
+_ADVISORY_TIMEOUT_S: float = 1.0
+
+
+@dataclass(frozen=True, slots=True)
+class EngineLoad:
+    """One reading of the engine's scheduler state."""
+
+    running: int
+    waiting: int
+    kv_cache_usage: float
+
+
+class LoadController:
+    """Poll engine load and degrade gracefully before latency collapses.
+
+    Pressure is the worst of three ratios: requests waiting for a sequence per running
+    request against ``waiting_high``, KV cache usage against ``kv_high``, and audio queued
+    in vLLM per active utterance against ``lag_budget_s`` (it grows once engine steps fall
+    behind realtime). Between the elevated and overloaded pressures
+    the controller scales linearly towards its floors:
+
+    - ``backlog_scale`` (read by every connection) shrinks the per-connection backlog
+      bound to ``min_backlog_scale``;
+    - the utterance-slot limit drops to ``min_utterance_scale`` of the slots at once,
+      but climbs back only a few slots per poll, pacing new utterances in recovery;
+    - on each level change, connections holding an utterance get a ``slow_down``
+      (or, on recovery, ``load_normal``) status frame. Each is sent from its own task with
+      a timeout, so a slow socket delays neither the other holders nor the next reading.
+    """
+
+    def __init__(
+        self,
+        *,
+        read_load: Callable[[], EngineLoad],
+        utterance_slots: UtteranceSlots,
+        feed_scheduler: FeedScheduler,
+        poll_s: float,
+        kv_high: float,
+        waiting_high: float,
+        lag_budget_s: float,
+        min_backlog_scale: float,
+        min_utterance_scale: float,
+    ) -> None:
+        self._read_load = read_load
+        self._slots = utterance_slots
+        self._feed_scheduler = feed_scheduler
+        self._poll_s = float(poll_s)
+        self._kv_high = max(1e-3, float(kv_high))
+        self._waiting_high = max(1e-3, float(waiting_high))
+        self._lag_budget_s = max(1e-3, float(lag_budget_s))
+        self._min_backlog_scale = float(min_backlog_scale)
+        self._min_utterance_scale = float(min_utterance_scale)
+        self._ramp = max(1, math.ceil(utterance_slots.capacity * _UTTERANCE_RAMP_SHARE))
+        self._backlog_scale: float = 1.0
+        self._level: str = "normal"
+        self._task: asyncio.Task | None = None
+        self._advisories: set[asyncio.Task] = set()
+
+    @property
+    def backlog_scale(self) -> float:
+        return self._backlog_scale
+
+    @property
+    def level(self) -> str:
+        return self._level
+
+    def start(self) -> None:
+        if self._poll_s > 0 and self._task is None:
+            self._task = asyncio.create_task(self._poll_loop())
+
+    async def stop(self) -> None:
+        for advisory in list(self._advisories):
+            advisory.cancel()
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(BaseException):
+            await self._task
+        self._task = None
+
+    def pressure(self, load: EngineLoad) -> tuple[float, str]:
+        """Return (pressure, reason); 1.0 means some budget is exactly used up."""
+        active = max(1, self._slots.get_active_count())
+        lag_s = self._feed_scheduler.inflight_samples / float(ASR_SAMPLE_RATE_HZ) / active
+        candidates = [
+            (load.kv_cache_usage / self._kv_high, "kv_cache"),
+            (lag_s / self._lag_budget_s, "engine_lag"),
+            (max(0, load.waiting) / max(1, load.running) / self._waiting_high, "requests_waiting"),
+        ]
+        return max(candidates)
+
+    def apply(self, load: EngineLoad) -> None:
+        pressure, reason = self.pressure(load)
+        shed = min(1.0, max(0.0, (pressure - _ELEVATED_PRESSURE) / (_OVERLOADED_PRESSURE - _ELEVATED_PRESSURE)))
+        self._backlog_scale = 1.0 - shed * (1.0 - self._min_backlog_scale)
+
+        capacity = self._slots.capacity
+        target = max(1, round(capacity * (1.0 - shed * (1.0 - self._min_utterance_scale))))
+        self._slots.set_limit(min(target, self._slots.limit + self._ramp))
+
+        level = "normal" if shed <= 0 else ("overloaded" if shed >= 1 else "elevated")
+        if level == self._level:
+            return
+        logger.info("load: %s -> %s (pressure=%.2f, reason=%s)", self._level, level, pressure, reason)
+        self._level = level
+        payload: dict[str, Any] = {"kind": "load_normal"}
+        if level != "normal":
+            payload = {"kind": "slow_down", "level": level, "reason": reason, "pressure": round(pressure, 2)}
+        for owner in self._slots.holders():
+            advisory = asyncio.create_task(self._send_advisory(owner, payload))
+            self._advisories.add(advisory)
+            advisory.add_done_callback(self._advisories.discard)
+
+    @staticmethod
+    async def _send_advisory(owner: Any, payload: dict[str, Any]) -> None:
+        with contextlib.suppress(Exception):
+            async with asyncio.timeout(_ADVISORY_TIMEOUT_S):
+                await owner.send_status(payload)
+
+    async def _poll_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._poll_s)
+            try:
+                self.apply(self._read_load())
+            except Exception:
+                logger.debug("load controller poll failed", exc_info=True)
+
+
+__all__ = ["EngineLoad", "LoadController"]
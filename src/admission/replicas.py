@@ -0,0 +1,121 @@
+"""Least-loaded routing of utterances across data-parallel engine replicas."""
+
+from __future__ import annotations
+
+import time
+import logging
+from typing import Any
+from dataclasses import dataclass
+from collections.abc import Callable
+
+from src.config.load import STT_LOAD_POLL_S
+from src.config.limits import ASR_SAMPLE_RATE_HZ
+from src.config.streaming import STT_FEED_INFLIGHT_SECONDS_PER_UTTERANCE
+
+from .load import EngineLoad
+
+logger = logging.getLogger(__name__)
+
+_IDLE_LOAD = EngineLoad(running=0, waiting=0, kv_cache_usage=0.0)
+
+
+@dataclass(slots=True)
+class RouteTicket:
+    """One vLLM request routed to a replica; released when the request finishes."""
+
+    rank: int
+    serving: Any
+    backlog: Callable[[], int]
+
+
+class ReplicaRouter:
+    """Send each new vLLM request to the least-loaded engine replica.
+
+    A replica's load is its active sequences (the larger of the requests routed here and
+    the engine's own running count), plus requests waiting in its scheduler, plus the audio
+    still queued for its requests in units of ``backlog_unit_samples`` (the inflight
+    budget of one utterance). Engine readings come from ``read_loads`` (keyed by
+    data-parallel rank) and are refreshed at most every ``refresh_s``; between readings
+    the local counts keep the choice current. Ties go to the lowest rank.
+    """
+
+    def __init__(
+        self,
+        servings: list[Any],
+        *,
+        read_loads: Callable[[], dict[int, EngineLoad]] | None = None,
+        refresh_s: float = STT_LOAD_POLL_S,
+        backlog_unit_samples: int = int(STT_FEED_INFLIGHT_SECONDS_PER_UTTERANCE * ASR_SAMPLE_RATE_HZ),
+        now_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not servings:
+            raise ValueError("ReplicaRouter needs at least one replica")
+        self._servings = list(servings)
+        self._read_loads = read_loads
+        self._refresh_s = max(0.0, float(refresh_s))
+        self._backlog_unit = max(1, int(backlog_unit_samples))
+        self._now_fn = now_fn
+        self._tickets: list[list[RouteTicket]] = [[] for _ in self._servings]
+        self._routed: list[int] = [0 for _ in self._servings]
+        self._loads: dict[int, EngineLoad] = {}
+        self._loads_at: float | None = None
+
+    @property
+    def replicas(self) -> int:
+        return len(self._servings)
+
+    def acquire(self, backlog: Callable[[], int]) -> RouteTicket:
+        """Route a request whose queued audio ``backlog()`` reports (in samples)."""
+        self._refresh_loads()
+        rank = min(range(self.replicas), key=lambda r: (self._score(r), r))
+        ticket = RouteTicket(rank=rank, serving=self._servings[rank], backlog=backlog)
+        self._tickets[rank].append(ticket)
+        self._routed[rank] += 1
+        return ticket
+
+    def release(self, ticket: RouteTicket) -> None:
+        tickets = self._tickets[ticket.rank]
+        for i, held in enumerate(tickets):
+            if held is ticket:
+                del tickets[i]
+                return
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Per-replica load, as last read from the engines plus local routing state."""
+        replicas: list[dict[str, Any]] = []
+        for rank in range(self.replicas):
+            load = self._loads.get(rank, _IDLE_LOAD)
+            replicas.append({
+                "rank": rank,
+                "active_requests": len(self._tickets[rank]),
+                "backlog_s": round(self._backlog_samples(rank) / float(ASR_SAMPLE_RATE_HZ), 3),
+                "running": load.running,
+                "waiting": load.waiting,
+                "kv_cache_usage": round(load.kv_cache_usage, 4),
+                "routed_total": self._routed[rank],
+                "score": round(self._score(rank), 3),
+            })
+        return replicas
+
+    def _score(self, rank: int) -> float:
+        load = self._loads.get(rank, _IDLE_LOAD)
+        active = max(len(self._tickets[rank]), load.running)
+        return active + load.waiting + self._backlog_samples(rank) / self._backlog_unit
+
+    def _backlog_samples(self, rank: int) -> int:
+        return sum(max(0, int(ticket.backlog())) for ticket in self._tickets[rank])
+
+    def _refresh_loads(self) -> None:
+        if self._read_loads is None or self.replicas == 1:
+            return
+        now = self._now_fn()
+        if self._loads_at is not None and now - self._loads_at < self._refresh_s:
+            return
+        self._loads_at = now
+        try:
+            self._loads = self._read_loads()
+        except Exception:
+            logger.debug("replica load read failed", exc_info=True)
+
+
+__all__ = ["ReplicaRouter", "RouteTicket"]
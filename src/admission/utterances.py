@@ -0,0 +1,130 @@
+"""Utterance admission control (one vLLM sequence per active utterance)."""
+
+from __future__ import annotations
+
+import math
+import asyncio
+from typing import Any
+
+from src.config.limits import PRIORITY_RANKS, PRIORITY_DEFAULT
+
+_LOWEST_RANK: int = min(PRIORITY_RANKS.values())
+
+
+class UtteranceSlots:
+    """Count active utterances against the engine's sequence capacity.
+
+    A connection holds a slot from ``commit final=false`` until its utterance is done,
+    errors, is cancelled or the socket closes. Idle connections hold none, so the
+    connection cap can be far larger than the number of slots.
+
+    Holders of the lowest priority class may take at most ``low_priority_share`` of the
+    slots. When all slots are taken, ``preempt`` hands a lower-priority holder's slot
+    straight to a higher-priority owner; the victim only has to tear its utterance down.
+
+    ``set_limit`` admits new utterances only up to a lower limit (load shedding);
+    utterances already holding a slot keep it.
+
+    Slots are also counted per API key (``key_count``) for per-key utterance quotas.
+
+    Work that queues instead of being refused (batch segments) waits in ``acquire`` until
+    a release or a raised limit lets it in.
+    """
+
+    def __init__(self, *, capacity: int, low_priority_share: float = 1.0) -> None:
+        self._capacity = max(1, int(capacity))
+        self._limit = self._capacity
+        self._low_priority_capacity = max(1, math.floor(self._capacity * min(1.0, max(0.0, low_priority_share))))
+        # Holder key -> (owner, priority rank, API key), in acquisition order.
+        self._holders: dict[int, tuple[Any, int, str]] = {}
+        self._key_counts: dict[str, int] = {}
+        # Set whenever a slot may have come free; ``acquire`` waiters re-check on it.
+        self._freed = asyncio.Event()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def set_limit(self, limit: int) -> None:
+        self._limit = min(self._capacity, max(1, int(limit)))
+        self._freed.set()
+
+    def holders(self) -> list[Any]:
+        return [owner for owner, _, _ in self._holders.values()]
+
+    def holds(self, owner: Any) -> bool:
+        return id(owner) in self._holders
+
+    def key_count(self, api_key: str) -> int:
+        return self._key_counts.get(api_key, 0)
+
+    def try_acquire(self, owner: Any, *, priority: str = PRIORITY_DEFAULT, api_key: str = "") -> bool:
+        """Take a slot for ``owner``; True if it holds one (already or now)."""
+        key = id(owner)
+        if key in self._holders:
+            return True
+        if len(self._holders) >= self._limit:
+            return False
+        rank = PRIORITY_RANKS.get(priority, PRIORITY_RANKS[PRIORITY_DEFAULT])
+        if rank == _LOWEST_RANK and self._count_rank(rank) >= self._low_priority_capacity:
+            return False
+        self._holders[key] = (owner, rank, api_key)
+        self._key_counts[api_key] = self._key_counts.get(api_key, 0) + 1
+        return True
+
+    async def acquire(self, owner: Any, *, priority: str = PRIORITY_DEFAULT, api_key: str = "") -> None:
+        """Wait until ``owner`` holds a slot (``try_acquire`` until one comes free)."""
+        while not self.try_acquire(owner, priority=priority, api_key=api_key):
+            self._freed.clear()
+            await self._freed.wait()
+
+    def preemption_victim(self, priority: str) -> Any | None:
+        """The newest holder of the lowest class below ``priority``, if the slots are full."""
+        if len(self._holders) != self._limit:
+            # Free slots need no preemption; over a lowered limit, one preemption is not enough.
+            return None
+        rank = PRIORITY_RANKS.get(priority, PRIORITY_RANKS[PRIORITY_DEFAULT])
+        victim: Any | None = None
+        victim_rank = rank
+        # Newest first: cancelling the most recent utterance throws away the least work.
+        for owner, holder_rank, _ in reversed(self._holders.values()):
+            if holder_rank < victim_rank:
+                victim, victim_rank = owner, holder_rank
+        return victim
+
+    def preempt(self, owner: Any, *, priority: str = PRIORITY_DEFAULT, api_key: str = "") -> Any | None:
+        """Move the ``preemption_victim``'s slot to ``owner``; return the victim (None if there is none).
+
+        Both happen in one synchronous step, so no other caller can take the freed slot.
+        """
+        victim = self.preemption_victim(priority)
+        if victim is None:
+            return None
+        self.release(victim)
+        # Cannot fail: one slot is free, and owner outranks the victim (so it is not lowest class).
+        self.try_acquire(owner, priority=priority, api_key=api_key)
+        return victim
+
+    def release(self, owner: Any) -> None:
+        holder = self._holders.pop(id(owner), None)
+        if holder is None:
+            return
+        self._freed.set()
+        remaining = self._key_counts[holder[2]] - 1
+        if remaining:
+            self._key_counts[holder[2]] = remaining
+        else:
+            del self._key_counts[holder[2]]
+
+    def get_active_count(self) -> int:
+        return len(self._holders)
+
+    def _count_rank(self, rank: int) -> int:
+        return sum(1 for _, holder_rank, _ in self._holders.values() if holder_rank == rank)
+
+
+__all__ = ["UtteranceSlots"]
@@ -0,0 +1,6 @@
+"""Audio ingress helpers (decoding, buffering) shared by the realtime path.
+
+Keep this package free of vLLM imports so it can be unit tested on CPU-only hosts.
+"""
+
+__all__: list[str] = []
@@ -0,0 +1,90 @@
+"""Silence-first backlog compaction used before dropping audio under overload."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.config.limits import ASR_SAMPLE_RATE_HZ
+from src.config.streaming import STT_BACKLOG_SILENCE_DB, STT_MAX_BACKLOG_SECONDS
+
+from .ring import PcmRingBuffer
+from .vad import frame_levels_db
+
+
+@dataclass(frozen=True, slots=True)
+class BacklogPolicy:
+    max_backlog_seconds: float
+    frame_samples: int
+    # Frames at or below this level (dBFS) are silence; runs are cut to keep_frames.
+    silence_db: float
+    keep_frames: int
+
+
+def compact_silence(samples: np.ndarray, *, frame_samples: int, silence_db: float, keep_frames: int) -> np.ndarray:
+    """Shorten every run of silent frames to at most ``keep_frames`` frames.
+
+    Works on int16 or float32 samples; a trailing partial frame is kept as-is. Returns the
+    input unchanged when nothing is removed.
+    """
+    n_frames = len(samples) // frame_samples
+    if n_frames == 0:
+        return samples
+    body_len = n_frames * frame_samples
+    silent = frame_levels_db(samples[:body_len].reshape(n_frames, frame_samples)) <= silence_db
+    # Index of each frame within its silent run: distance from the most recent run start.
+    idx = np.arange(n_frames)
+    starts = silent & ~np.concatenate(([False], silent[:-1]))
+    run_pos = idx - np.maximum.accumulate(np.where(starts, idx, 0))
+    remove = silent & (run_pos >= keep_frames)
+    if not remove.any():
+        return samples
+    kept = samples[:body_len][np.repeat(~remove, frame_samples)]
+    return np.concatenate((kept, samples[body_len:]))
+
+
+def write_compacting(
+    ring: PcmRingBuffer, samples: np.ndarray, policy: BacklogPolicy, *, scale: float = 1.0
+) -> tuple[int, int]:
+    """Write into ``ring``, compacting silence in the backlog before any drop.
+
+    Returns ``(compacted_samples, dropped_samples)``; dropping (oldest first) only happens
+    when the backlog is still over capacity after compaction. ``scale < 1`` tightens the
+    bound to that share of the policy's backlog (load shedding).
+
+    Only audio not yet compacted (``ring.unmarked``) is scanned, plus ``keep_frames + 1``
+    frames before it so a pause spanning the boundary is still cut to ``keep_frames``;
+    each sample is scanned about once however long the ring stays over its bound.
+    """
+    limit = None
+    if scale < 1.0 and policy.max_backlog_seconds > 0:
+        limit = max(policy.frame_samples, int(policy.max_backlog_seconds * scale * ASR_SAMPLE_RATE_HZ))
+    if not ring.would_overflow(len(samples)) and (limit is None or len(ring) + len(samples) <= limit):
+        return 0, ring.write(samples)
+    lookback = (policy.keep_frames + 1) * policy.frame_samples
+    scan = min(len(ring), ring.unmarked + lookback)
+    tail = np.concatenate((ring.tail(scan), samples))
+    kept = compact_silence(
+        tail, frame_samples=policy.frame_samples, silence_db=policy.silence_db, keep_frames=policy.keep_frames
+    )
+    ring.drop_newest(scan)
+    dropped = ring.write(kept)
+    # A trailing partial frame was not compacted; leave it for the next scan.
+    ring.mark(unmarked=len(tail) % policy.frame_samples)
+    if limit is not None and len(ring) > limit:
+        dropped += ring.drop_oldest(len(ring) - limit)
+    return len(tail) - len(kept), dropped
+
+
+def build_backlog_policy(*, frame_samples: int, keep_frames: int, scale: float = 1.0) -> BacklogPolicy:
+    """Build the configured policy (STT_MAX_BACKLOG_SECONDS times ``scale``, STT_BACKLOG_SILENCE_DB)."""
+    return BacklogPolicy(
+        max_backlog_seconds=float(STT_MAX_BACKLOG_SECONDS) * max(0.0, float(scale)),
+        frame_samples=frame_samples,
+        silence_db=float(STT_BACKLOG_SILENCE_DB),
+        keep_frames=keep_frames,
+    )
+
+
+__all__ = ["BacklogPolicy", "build_backlog_policy", "compact_silence", "write_compacting"]
@@ -0,0 +1,39 @@
+"""G.711 mu-law / A-law decoding via 256-entry lookup tables."""
+
+from __future__ import annotations
+
+import numpy as np
+
+# G.711 telephony audio is always 8 kHz, one byte per sample.
+G711_SAMPLE_RATE_HZ: int = 8000
+
+
+def _ulaw_table() -> np.ndarray:
+    u: np.ndarray = ~np.arange(256, dtype=np.uint8)
+    exponent = (u >> 4) & 0x07
+    mantissa = (u & 0x0F).astype(np.int32)
+    magnitude = (((mantissa << 3) + 0x84) << exponent) - 0x84
+    return np.where(u & 0x80, -magnitude, magnitude).astype(np.int16)
+
+
+def _alaw_table() -> np.ndarray:
+    a = np.arange(256, dtype=np.uint8) ^ 0x55
+    exponent = ((a >> 4) & 0x07).astype(np.int32)
+    mantissa = (a & 0x0F).astype(np.int32)
+    magnitude = np.where(exponent == 0, (mantissa << 4) + 8, ((mantissa << 4) + 0x108) << np.maximum(exponent - 1, 0))
+    return np.where(a & 0x80, magnitude, -magnitude).astype(np.int16)
+
+
+_ULAW_TO_PCM16 = _ulaw_table()
+_ALAW_TO_PCM16 = _alaw_table()
+
+
+def ulaw_to_pcm16(data: bytes) -> np.ndarray:
+    return _ULAW_TO_PCM16[np.frombuffer(data, dtype=np.uint8)]
+
+
+def alaw_to_pcm16(data: bytes) -> np.ndarray:
+    return _ALAW_TO_PCM16[np.frombuffer(data, dtype=np.uint8)]
+
+
+__all__ = ["G711_SAMPLE_RATE_HZ", "alaw_to_pcm16", "ulaw_to_pcm16"]
@@ -0,0 +1,88 @@
+"""Silence gate that keeps long silent stretches away from the model."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from src.config.limits import ASR_SAMPLE_RATE_HZ
+from src.config.streaming import STT_VAD_ENABLED, STT_VAD_THRESHOLD_DB, STT_VAD_PADDING_SECONDS
+
+from .ring import PcmRingBuffer
+from .vad import EnergyVad, SpeechDetector
+
+_EMPTY: np.ndarray = np.zeros(0, dtype=np.int16)
+
+
+class SilenceGate:
+    """Forward speech frames plus ``padding_frames`` of silence on each side; skip the rest.
+
+    Silence after speech is forwarded for ``padding_frames`` (hangover), and the last
+    ``padding_frames`` of silence before speech are held and released at onset (pre-roll),
+    so word edges reach the model unchanged. Input must be whole frames; a trailing
+    partial frame (final flush) is forwarded as-is.
+    """
+
+    def __init__(self, detector: SpeechDetector, *, frame_samples: int, padding_frames: int) -> None:
+        self._detect = detector
+        self._frame = max(1, int(frame_samples))
+        self._padding_frames = max(0, int(padding_frames))
+        self._preroll = PcmRingBuffer(max(1, self._padding_frames * self._frame))
+        self._hangover: int = 0
+        self.skipped_samples: int = 0
+
+    def reset(self) -> None:
+        self._preroll.clear()
+        self._hangover = 0
+        self.skipped_samples = 0
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        n_frames = len(samples) // self._frame
+        body_len = n_frames * self._frame
+        if n_frames == 0:
+            return samples
+
+        speech = self._detect(samples[:body_len].reshape(n_frames, self._frame))
+        out: list[np.ndarray] = []
+        for i, is_speech in enumerate(speech.tolist()):
+            frame = samples[i * self._frame : (i + 1) * self._frame]
+            if is_speech:
+                if len(self._preroll) > 0:
+                    out.append(self._preroll.read(len(self._preroll)))
+                out.append(frame)
+                self._hangover = self._padding_frames
+            elif self._hangover > 0:
+                out.append(frame)
+                self._hangover -= 1
+            elif self._padding_frames > 0:
+                self.skipped_samples += self._preroll.write(frame)
+            else:
+                self.skipped_samples += len(frame)
+
+        if body_len < len(samples):
+            out.append(samples[body_len:])
+        if not out:
+            return _EMPTY
+        return out[0] if len(out) == 1 else np.concatenate(out)
+
+    def finish(self) -> int:
+        """Close the stream: held pre-roll silence counts as skipped. Return skipped samples."""
+        self.skipped_samples += len(self._preroll)
+        self._preroll.clear()
+        return self.skipped_samples
+
+
+def build_silence_gate(*, frame_samples: int) -> SilenceGate | None:
+    """Build the configured gate (STT_VAD_*), or None when VAD is disabled."""
+    if not STT_VAD_ENABLED:
+        return None
+    frame_seconds = float(frame_samples) / float(ASR_SAMPLE_RATE_HZ)
+    return SilenceGate(
+        EnergyVad(threshold_db=float(STT_VAD_THRESHOLD_DB)),
+        frame_samples=frame_samples,
+        padding_frames=math.ceil(float(STT_VAD_PADDING_SECONDS) / frame_seconds),
+    )
+
+
+__all__ = ["SilenceGate", "build_silence_gate"]
@@ -0,0 +1,137 @@
+"""Per-connection conversion of client audio payloads to 16 kHz PCM16."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+from collections.abc import Callable
+
+import numpy as np
+
+from src.config.limits import ASR_SAMPLE_RATE_HZ
+
+from .pcm import check_pcm16
+from .pool import AudioWorkerPool
+from .resample import PcmResampler
+from .opus import OPUS_AVAILABLE, OpusPacketDecoder
+from .g711 import G711_SAMPLE_RATE_HZ, alaw_to_pcm16, ulaw_to_pcm16
+
+PCM16_FORMAT = "pcm16"
+OPUS_FORMAT = "opus"
+G711_ULAW_FORMAT = "g711_ulaw"
+G711_ALAW_FORMAT = "g711_alaw"
+
+_G711_DECODERS: dict[str, Callable[[bytes], np.ndarray]] = {
+    G711_ULAW_FORMAT: ulaw_to_pcm16,
+    G711_ALAW_FORMAT: alaw_to_pcm16,
+}
+
+# PCM16 input rates clients may declare; anything but the model rate is resampled.
+SUPPORTED_INPUT_SAMPLE_RATES: tuple[int, ...] = (8000, 16000, 24000, 44100, 48000)
+
+
+def available_input_audio_formats() -> tuple[str, ...]:
+    formats = (PCM16_FORMAT, G711_ULAW_FORMAT, G711_ALAW_FORMAT)
+    return (*formats, OPUS_FORMAT) if OPUS_AVAILABLE else formats
+
+
+def _g711_to_pcm16(decode: Callable[[bytes], np.ndarray], resampler: PcmResampler, data: bytes) -> bytes:
+    return resampler.process(decode(data))
+
+
+def _timed(fn: Callable[..., bytes], *args: Any) -> tuple[bytes, float]:
+    start = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - start
+
+
+class AudioIngress:
+    """Turn raw client audio (PCM16, G.711 or Opus packets) into 16 kHz PCM16 for the feed path.
+
+    16 kHz PCM16 passes through on the event loop; compressed formats and other sample
+    rates are converted on the shared worker pool. Calls must be awaited in arrival order
+    (codec and filter state is per stream and survives segment rolls).
+    """
+
+    def __init__(self, *, pool: AudioWorkerPool, audio_format: str = PCM16_FORMAT) -> None:
+        self._pool = pool
+        self.audio_format = audio_format
+        self.sample_rate: int = ASR_SAMPLE_RATE_HZ
+        self._opus: OpusPacketDecoder | None = None
+        self._resampler: PcmResampler | None = None
+        self.decoded_packets: int = 0
+        self.decoded_samples: int = 0
+        self.decode_seconds: float = 0.0
+
+    def set_format(self, audio_format: str) -> None:
+        if audio_format not in available_input_audio_formats():
+            raise ValueError(f"unsupported input audio format: {audio_format}")
+        if audio_format != self.audio_format:
+            self.audio_format = audio_format
+            self.reset()
+
+    def set_sample_rate(self, sample_rate: int) -> None:
+        if sample_rate not in SUPPORTED_INPUT_SAMPLE_RATES:
+            raise ValueError(f"unsupported input sample rate: {sample_rate}")
+        if sample_rate != self.sample_rate:
+            self.sample_rate = int(sample_rate)
+            self.reset()
+
+    def reset(self) -> None:
+        """Start a fresh codec/filter stream (called at utterance boundaries)."""
+        self._opus = None
+        self._resampler = None
+
+    async def to_pcm16(self, data: bytes) -> bytes:
+        if self.audio_format == PCM16_FORMAT:
+            check_pcm16(data)
+            if self.sample_rate == ASR_SAMPLE_RATE_HZ:
+                return data
+            if self._resampler is None:
+                self._resampler = PcmResampler(self.sample_rate)
+            return await self._convert(self._resampler.process, data)
+        g711_decode = _G711_DECODERS.get(self.audio_format)
+        if g711_decode is not None:
+            # Table-lookup decode and 8 -> 16 kHz upsampling in one worker job.
+            if self._resampler is None:
+                self._resampler = PcmResampler(G711_SAMPLE_RATE_HZ)
+            return await self._convert(_g711_to_pcm16, g711_decode, self._resampler, data)
+        # Opus decodes straight to the model rate, whatever rate it was encoded at.
+        if self._opus is None:
+            self._opus = OpusPacketDecoder()
+        return await self._convert(self._opus.decode, data)
+
+    async def flush(self) -> bytes:
+        """Return audio still held in converter state at the end of an utterance."""
+        if self._resampler is None:
+            return b""
+        return await self._convert(self._resampler.flush)
+
+    async def _convert(self, fn: Callable[..., bytes], *args: Any) -> bytes:
+        pcm, elapsed = await self._pool.run(_timed, fn, *args)
+        self.decoded_packets += 1
+        self.decoded_samples += len(pcm) // 2
+        self.decode_seconds += elapsed
+        return pcm
+
+    def stats(self) -> dict[str, float | int | str]:
+        audio_s = float(self.decoded_samples) / float(ASR_SAMPLE_RATE_HZ)
+        return {
+            "format": self.audio_format,
+            "sample_rate": G711_SAMPLE_RATE_HZ if self.audio_format in _G711_DECODERS else self.sample_rate,
+            "packets": self.decoded_packets,
+            "audio_seconds": round(audio_s, 3),
+            "decode_seconds": round(self.decode_seconds, 6),
+            "realtime_factor": round(self.decode_seconds / audio_s, 6) if audio_s > 0 else 0.0,
+        }
+
+
+__all__ = [
+    "G711_ALAW_FORMAT",
+    "G711_ULAW_FORMAT",
+    "OPUS_FORMAT",
+    "PCM16_FORMAT",
+    "SUPPORTED_INPUT_SAMPLE_RATES",
+    "AudioIngress",
+    "available_input_audio_formats",
+]
@@ -0,0 +1,34 @@
+"""Opus packet decoding to 16 kHz PCM16 (optional: needs opuslib + libopus)."""
+
+from __future__ import annotations
+
+from src.config.limits import ASR_SAMPLE_RATE_HZ
+
+try:
+    import opuslib
+except Exception:  # pragma: no cover - opuslib raises a bare Exception when libopus is missing
+    opuslib = None
+
+OPUS_AVAILABLE: bool = opuslib is not None
+
+# Longest Opus frame is 120ms; libopus needs room for it when decoding.
+_MAX_FRAME_SAMPLES: int = ASR_SAMPLE_RATE_HZ * 120 // 1000
+
+
+class OpusPacketDecoder:
+    """Stateful mono Opus decoder; one instance per client stream, packets fed in order."""
+
+    def __init__(self) -> None:
+        if opuslib is None:
+            raise RuntimeError("opus decoding requires opuslib and libopus")
+        # libopus resamples internally, so we decode straight to the model rate.
+        self._decoder = opuslib.Decoder(ASR_SAMPLE_RATE_HZ, 1)
+
+    def decode(self, packet: bytes) -> bytes:
+        try:
+            return bytes(self._decoder.decode(packet, _MAX_FRAME_SAMPLES))
+        except opuslib.OpusError as exc:
+            raise ValueError(f"invalid opus packet: {exc}") from exc
+
+
+__all__ = ["OPUS_AVAILABLE", "OpusPacketDecoder"]
@@ -0,0 +1,36 @@
+"""PCM16 decoding helpers for the realtime audio ingress path."""
+
+from __future__ import annotations
+
+import binascii
+
+import numpy as np
+
+# vLLM's realtime audio queue carries float32 samples in [-1, 1).
+PCM16_TO_FLOAT32_SCALE = np.float32(1.0 / 32768.0)
+
+
+def decode_b64_audio(audio_b64: str) -> bytes:
+    """Decode a base64 audio payload once at ingress; raise ValueError on bad input."""
+    try:
+        data = binascii.a2b_base64(audio_b64)
+    except (binascii.Error, ValueError) as exc:
+        raise ValueError(f"invalid base64 audio: {exc}") from exc
+    if not data:
+        raise ValueError("audio chunk is empty")
+    return data
+
+
+def check_pcm16(pcm: bytes) -> bytes:
+    if len(pcm) % 2 != 0:
+        raise ValueError("audio chunk must contain whole PCM16 samples")
+    return pcm
+
+
+def pcm16_to_float32(pcm: bytes | np.ndarray) -> np.ndarray:
+    """Convert PCM16 LE samples to the float32 array vLLM consumes (single allocation)."""
+    samples = np.frombuffer(pcm, dtype="<i2") if isinstance(pcm, bytes | bytearray | memoryview) else pcm
+    return np.multiply(samples, PCM16_TO_FLOAT32_SCALE, dtype=np.float32)
+
+
+__all__ = ["PCM16_TO_FLOAT32_SCALE", "check_pcm16", "decode_b64_audio", "pcm16_to_float32"]
@@ -0,0 +1,71 @@
+"""Process-wide bounded worker pool for CPU-bound audio decoding."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any, TypeVar, cast
+from concurrent.futures import ThreadPoolExecutor
+
+_T = TypeVar("_T")
+_Job = tuple[Callable[..., Any], tuple[Any, ...], "asyncio.Future[Any]"]
+
+
+def _run_batch(calls: list[tuple[Callable[..., Any], tuple[Any, ...]]]) -> list[tuple[bool, Any]]:
+    results: list[tuple[bool, Any]] = []
+    for fn, args in calls:
+        try:
+            results.append((True, fn(*args)))
+        except Exception as exc:
+            results.append((False, exc))
+    return results
+
+
+class AudioWorkerPool:
+    """Run decode/resample jobs off the event loop on a fixed set of threads.
+
+    Jobs submitted by different connections within the same event-loop tick are
+    batched into a single executor call, so a burst of small chunks costs one thread
+    hand-off rather than one per chunk. The codec libraries release the GIL while
+    working, so threads scale across cores. At most ``max_pending`` jobs are queued or
+    running at once; callers beyond that wait, which backpressures the connections
+    producing audio.
+    """
+
+    def __init__(self, *, workers: int, max_pending: int) -> None:
+        self.workers = max(1, int(workers))
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="audio-decode")
+        self._slots = asyncio.Semaphore(max(1, int(max_pending)))
+        self._batch: list[_Job] = []
+
+    async def run(self, fn: Callable[..., _T], *args: Any) -> _T:
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            fut: asyncio.Future[Any] = loop.create_future()
+            self._batch.append((fn, args, fut))
+            if len(self._batch) == 1:
+                loop.call_soon(self._submit_batch, loop)
+            return cast(_T, await fut)
+
+    def _submit_batch(self, loop: asyncio.AbstractEventLoop) -> None:
+        batch, self._batch = self._batch, []
+        done = loop.run_in_executor(self._executor, _run_batch, [(fn, args) for fn, args, _ in batch])
+        done.add_done_callback(lambda f: self._deliver(batch, f))
+
+    @staticmethod
+    def _deliver(batch: list[_Job], done: asyncio.Future[list[tuple[bool, Any]]]) -> None:
+        exc = done.exception() if not done.cancelled() else asyncio.CancelledError()
+        results = done.result() if exc is None else [(False, exc)] * len(batch)
+        for (_, _, fut), (ok, value) in zip(batch, results, strict=True):
+            if fut.done():
+                continue
+            if ok:
+                fut.set_result(value)
+            else:
+                fut.set_exception(value)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+__all__ = ["AudioWorkerPool"]
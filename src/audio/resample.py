@@ -0,0 +1,29 @@
+"""Streaming PCM16 resampling to the model input rate (soxr)."""
+
+from __future__ import annotations
+
+import soxr
+import numpy as np
+
+from src.config.limits import ASR_SAMPLE_RATE_HZ
+
+_EMPTY: np.ndarray = np.zeros(0, dtype=np.int16)
+
+
+class PcmResampler:
+    """Mono PCM16 resampler that keeps filter state across chunks (one per client stream)."""
+
+    def __init__(self, in_rate: int) -> None:
+        self.in_rate = int(in_rate)
+        self._stream = soxr.ResampleStream(self.in_rate, ASR_SAMPLE_RATE_HZ, 1, dtype="int16", quality="HQ")
+
+    def process(self, pcm: bytes | np.ndarray) -> bytes:
+        samples = np.frombuffer(pcm, dtype="<i2") if isinstance(pcm, bytes) else pcm
+        return self._stream.resample_chunk(samples).tobytes()
+
+    def flush(self) -> bytes:
+        """Drain the filter tail at the end of a stream."""
+        return self._stream.resample_chunk(_EMPTY, last=True).tobytes()
+
+
+__all__ = ["PcmResampler"]
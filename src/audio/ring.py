@@ -0,0 +1,122 @@
+"""Fixed-capacity PCM16 ring buffer for pending and overlap audio."""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+class PcmRingBuffer:
+    """Array-backed ring of int16 samples; writes past capacity overwrite the oldest samples.
+
+    With ``growable=True`` the storage doubles instead of overwriting (used when the
+    backlog bound is disabled), so the buffer never drops audio on its own.
+
+    ``mark`` records how much of the buffer has been processed (e.g. compacted);
+    ``unmarked`` counts the newest samples written since, still buffered.
+    """
+
+    def __init__(self, capacity_samples: int, *, growable: bool = False) -> None:
+        self._buf: np.ndarray = np.zeros(max(1, int(capacity_samples)), dtype=np.int16)
+        self._growable = bool(growable)
+        self._start: int = 0
+        self._size: int = 0
+        self._unmarked: int = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buf)
+
+    @property
+    def unmarked(self) -> int:
+        return min(self._unmarked, self._size)
+
+    def mark(self, *, unmarked: int = 0) -> None:
+        """Mark all but the newest ``unmarked`` samples as processed."""
+        self._unmarked = max(0, int(unmarked))
+
+    def would_overflow(self, n: int) -> bool:
+        """True when writing ``n`` more samples would overwrite the oldest ones."""
+        return not self._growable and self._size + int(n) > self.capacity
+
+    def clear(self) -> None:
+        self._start = 0
+        self._size = 0
+        self._unmarked = 0
+
+    def write(self, samples: np.ndarray) -> int:
+        """Append samples; return how many of the oldest samples were overwritten."""
+        n = len(samples)
+        if n == 0:
+            return 0
+        self._unmarked = min(self._unmarked, self._size) + n
+        if self._growable and self._size + n > self.capacity:
+            self._grow(self._size + n)
+
+        cap = self.capacity
+        if n >= cap:
+            dropped = self._size + n - cap
+            self._buf[:] = samples[n - cap :]
+            self._start = 0
+            self._size = cap
+            return dropped
+
+        dropped = max(0, self._size + n - cap)
+        if dropped:
+            self.drop_oldest(dropped)
+        end = (self._start + self._size) % cap
+        first = min(n, cap - end)
+        self._buf[end : end + first] = samples[:first]
+        self._buf[: n - first] = samples[first:]
+        self._size += n
+        return dropped
+
+    def drop_oldest(self, n: int) -> int:
+        n = max(0, min(int(n), self._size))
+        self._start = (self._start + n) % self.capacity
+        self._size -= n
+        if self._size == 0:
+            self._start = 0
+        return n
+
+    def drop_newest(self, n: int) -> int:
+        n = max(0, min(int(n), self._size))
+        self._unmarked = max(0, min(self._unmarked, self._size) - n)
+        self._size -= n
+        if self._size == 0:
+            self._start = 0
+        return n
+
+    def read(self, n: int) -> np.ndarray:
+        """Remove and return up to ``n`` of the oldest samples as one contiguous array."""
+        out = self._copy(0, max(0, min(int(n), self._size)))
+        self.drop_oldest(len(out))
+        return out
+
+    def head(self, n: int) -> np.ndarray:
+        """Return a contiguous copy of the oldest ``n`` samples without consuming them."""
+        return self._copy(0, max(0, min(int(n), self._size)))
+
+    def tail(self, n: int) -> np.ndarray:
+        """Return a contiguous copy of the newest ``n`` samples without consuming them."""
+        n = max(0, min(int(n), self._size))
+        return self._copy(self._size - n, n)
+
+    def _copy(self, offset: int, n: int) -> np.ndarray:
+        cap = self.capacity
+        idx = (self._start + offset) % cap
+        first = min(n, cap - idx)
+        if first == n:
+            return self._buf[idx : idx + n].copy()
+        return np.concatenate((self._buf[idx:], self._buf[: n - first]))
+
+    def _grow(self, needed: int) -> None:
+        grown: np.ndarray = np.zeros(max(int(needed), 2 * self.capacity), dtype=np.int16)
+        grown[: self._size] = self._copy(0, self._size)
+        self._buf = grown
+        self._start = 0
+
+
+__all__ = ["PcmRingBuffer"]
@@ -0,0 +1,100 @@
+"""Content-aware choice of where to end an internal vLLM segment."""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.config.limits import ASR_SAMPLE_RATE_HZ
+from src.config.streaming import STT_ROLL_PAUSE_DB, STT_SEGMENT_SECONDS, STT_ROLL_PAUSE_SECONDS
+
+from .vad import frame_levels_db
+
+
+@dataclass(frozen=True, slots=True)
+class RollPlan:
+    # Pending samples to send before rolling (whole frames).
+    cut_samples: int
+    # The cut falls inside a pause: nothing is spoken across it, so overlap replay is skipped.
+    clean: bool
+
+
+class RollPlanner:
+    """Pick a roll point between a soft and a hard segment length.
+
+    Below ``soft_samples`` segments never roll. Past it, the quietest ``pause_frames``
+    window over the recently sent tail plus the pending audio is located; the segment
+    rolls at its centre when it is a real pause (level <= ``pause_db``), or at the
+    quietest point available once pending audio would cross ``hard_samples``.
+    """
+
+    def __init__(
+        self,
+        *,
+        frame_samples: int,
+        soft_samples: int,
+        hard_samples: int,
+        pause_frames: int,
+        pause_db: float,
+    ) -> None:
+        self._frame = max(1, int(frame_samples))
+        self._hard = max(self._frame, int(hard_samples))
+        self._soft = min(max(0, int(soft_samples)), self._hard)
+        self._pause_frames = max(1, int(pause_frames))
+        self._pause_db = float(pause_db)
+        # Levels of the last sent frames, so pauses spanning a feed boundary are seen.
+        self._history: deque[float] = deque(maxlen=self._pause_frames - 1)
+
+    def reset(self) -> None:
+        self._history.clear()
+
+    def observe(self, samples: np.ndarray) -> None:
+        """Record levels of audio sent to the model (whole frames only)."""
+        n_frames = len(samples) // self._frame
+        if n_frames and self._history.maxlen:
+            frames = samples[: n_frames * self._frame].reshape(n_frames, self._frame)
+            self._history.extend(float(level) for level in frame_levels_db(frames))
+
+    def plan(self, sent: int, pending: np.ndarray) -> RollPlan | None:
+        room = max(0, self._hard - int(sent))
+        at_hard = len(pending) >= room
+        if sent + len(pending) < self._soft and not at_hard:
+            return None
+
+        n_frames = min(len(pending), room) // self._frame
+        frames = pending[: n_frames * self._frame].reshape(n_frames, self._frame)
+        levels = np.concatenate((np.asarray(self._history, dtype=np.float64), frame_levels_db(frames)))
+        window = self._pause_frames
+        if len(levels) < window:
+            return RollPlan(cut_samples=n_frames * self._frame, clean=False) if at_hard else None
+
+        # Mean level of every window, and the pending-frame cut at each window's centre.
+        means = np.convolve(levels, np.full(window, 1.0 / window), mode="valid")
+        cuts = np.maximum(np.arange(len(means)) + window - window // 2 - len(self._history), 0)
+        eligible = (sent + cuts * self._frame) >= self._soft
+        if not eligible.any():
+            return RollPlan(cut_samples=n_frames * self._frame, clean=False) if at_hard else None
+
+        best = int(np.argmin(np.where(eligible, means, np.inf)))
+        if means[best] <= self._pause_db:
+            return RollPlan(cut_samples=int(cuts[best]) * self._frame, clean=True)
+        if at_hard:
+            return RollPlan(cut_samples=int(cuts[best]) * self._frame, clean=False)
+        return None
+
+
+def build_roll_planner(*, frame_samples: int, hard_samples: int) -> RollPlanner:
+    """Build the configured planner: soft length STT_SEGMENT_SECONDS, pauses from STT_ROLL_PAUSE_*."""
+    frame_seconds = float(frame_samples) / float(ASR_SAMPLE_RATE_HZ)
+    return RollPlanner(
+        frame_samples=frame_samples,
+        soft_samples=int(max(1.0, float(STT_SEGMENT_SECONDS)) * ASR_SAMPLE_RATE_HZ),
+        hard_samples=hard_samples,
+        pause_frames=max(1, round(float(STT_ROLL_PAUSE_SECONDS) / frame_seconds)),
+        pause_db=float(STT_ROLL_PAUSE_DB),
+    )
+
+
+__all__ = ["RollPlan", "RollPlanner", "build_roll_planner"]
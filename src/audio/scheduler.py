@@ -0,0 +1,156 @@
+"""Process-wide deficit-round-robin scheduling of audio fed into vLLM."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections import deque
+from dataclasses import dataclass
+from collections.abc import AsyncIterator
+
+
+@dataclass(eq=False, slots=True)
+class FeedFlow:
+    """One connection's share of the feed scheduler (plus its queueing-delay stats)."""
+
+    # Quantum multiplier (priority class); a weight-2 flow gets twice the audio per round.
+    weight: float = 1.0
+    want: int = 0
+    deficit: int = 0
+    reserved: int = 0
+    inflight: int = 0
+    requested_at: float = 0.0
+    waiter: asyncio.Future[int] | None = None
+    wait_count: int = 0
+    wait_total_s: float = 0.0
+    wait_max_s: float = 0.0
+
+    def take_wait_stats(self) -> tuple[float, float]:
+        """Return (mean, max) queueing delay in seconds since the last call, and reset."""
+        mean_s = self.wait_total_s / self.wait_count if self.wait_count else 0.0
+        max_s = self.wait_max_s
+        self.wait_count = 0
+        self.wait_total_s = 0.0
+        self.wait_max_s = 0.0
+        return mean_s, max_s
+
+
+class FeedScheduler:
+    """Hand out audio feed grants across all connections in deficit-round-robin order.
+
+    Every connection's feeder asks for the samples it has pending; grants are at most one
+    ``quantum_samples`` per turn (whole frames, except a final sub-frame remainder), so a
+    client that dumps a large backlog gets the same share per round as a live talker
+    (scaled by each flow's ``weight``).
+    With ``max_inflight_samples > 0`` the audio sitting in vLLM input queues across all
+    connections is capped: once the cap is reached, grants wait until vLLM consumes
+    audio. The time each grant waited is recorded on its flow.
+    """
+
+    def __init__(self, *, quantum_samples: int, frame_samples: int, max_inflight_samples: int = 0) -> None:
+        self._frame = max(1, int(frame_samples))
+        self._quantum = max(self._frame, int(quantum_samples) - int(quantum_samples) % self._frame)
+        self._max_inflight = max(0, int(max_inflight_samples))
+        self._inflight: int = 0
+        self._active: deque[FeedFlow] = deque()
+
+    @property
+    def inflight_samples(self) -> int:
+        return self._inflight
+
+    async def acquire(self, flow: FeedFlow, n: int) -> int:
+        """Wait for this flow's turn; return how many of ``n`` samples it may feed now."""
+        if n <= 0:
+            return 0
+        loop = asyncio.get_running_loop()
+        flow.want = int(n)
+        flow.requested_at = loop.time()
+        waiter: asyncio.Future[int] = loop.create_future()
+        flow.waiter = waiter
+        self._active.append(flow)
+        self._dispatch()
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            self._withdraw(flow)
+            self.settle(flow)
+            raise
+
+    @contextlib.asynccontextmanager
+    async def grant(self, flow: FeedFlow, n: int) -> AsyncIterator[int]:
+        """``acquire`` for the body of the block; reserved samples it did not feed are returned."""
+        granted = await self.acquire(flow, n)
+        try:
+            yield granted
+        finally:
+            self.settle(flow)
+
+    def settle(self, flow: FeedFlow) -> None:
+        """Release what is left of the flow's reservation (e.g. audio the VAD gate skipped)."""
+        if flow.reserved:
+            self._inflight = max(0, self._inflight - flow.reserved)
+            flow.reserved = 0
+            self._dispatch()
+
+    def account(self, flow: FeedFlow, delta: int) -> None:
+        """Track audio entering (``delta > 0``) or leaving a flow's vLLM queue (TrackedAudioQueue hook)."""
+        flow.inflight = max(0, flow.inflight + delta)
+        if delta > 0:
+            # Granted audio was already counted when it was reserved; anything else (such as
+            # a segment's overlap replay) is counted as it arrives.
+            covered = min(flow.reserved, delta)
+            flow.reserved -= covered
+            self._inflight += delta - covered
+            return
+        self._inflight = max(0, self._inflight + delta)
+        self._dispatch()
+
+    def _withdraw(self, flow: FeedFlow) -> None:
+        if flow.waiter is not None and not flow.waiter.done():
+            flow.waiter.cancel()
+        flow.waiter = None
+        flow.want = 0
+        with contextlib.suppress(ValueError):
+            self._active.remove(flow)
+
+    def _dispatch(self) -> None:
+        while self._active:
+            flow = self._active[0]
+            if flow.waiter is None or flow.waiter.done():
+                self._active.popleft()
+                continue
+            available = self._max_inflight - self._inflight if self._max_inflight else flow.want
+            # Feed whole frames; only a final remainder shorter than a frame goes as-is.
+            unit = min(flow.want, self._frame)
+            if available < unit:
+                return
+            if flow.deficit < unit:
+                flow.deficit += self._flow_quantum(flow)
+            grant = min(flow.want, flow.deficit, available)
+            if grant < flow.want:
+                grant -= grant % self._frame
+            self._active.popleft()
+            flow.deficit -= grant
+            if grant == flow.want:
+                # Nothing left waiting: like an emptied DRR queue, the flow keeps no credit.
+                flow.deficit = 0
+            flow.reserved += grant
+            self._inflight += grant
+            self._record_wait(flow)
+            flow.want = 0
+            flow.waiter.set_result(grant)
+            flow.waiter = None
+
+    def _flow_quantum(self, flow: FeedFlow) -> int:
+        quantum = int(self._quantum * flow.weight)
+        return max(self._frame, quantum - quantum % self._frame)
+
+    @staticmethod
+    def _record_wait(flow: FeedFlow) -> None:
+        waited_s = max(0.0, asyncio.get_running_loop().time() - flow.requested_at)
+        flow.wait_count += 1
+        flow.wait_total_s += waited_s
+        flow.wait_max_s = max(flow.wait_max_s, waited_s)
+
+
+__all__ = ["FeedFlow", "FeedScheduler"]
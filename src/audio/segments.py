@@ -0,0 +1,28 @@
+"""Split long recordings into overlapping, frame-aligned segments for batch transcription."""
+
+from __future__ import annotations
+
+
+def plan_segments(
+    n_samples: int, *, segment_samples: int, overlap_samples: int, frame_samples: int
+) -> list[tuple[int, int]]:
+    """Return ``(start, end)`` spans covering ``n_samples``, each at most ``segment_samples`` long.
+
+    Lengths are rounded down to whole frames. Consecutive spans share ``overlap_samples``
+    (capped below the segment length) so a word cut at one boundary is whole in a neighbour.
+    """
+    if n_samples <= 0:
+        return []
+    seg = max(frame_samples, segment_samples - segment_samples % frame_samples)
+    overlap = max(0, min(overlap_samples - overlap_samples % frame_samples, seg - frame_samples))
+    spans: list[tuple[int, int]] = []
+    start = 0
+    while True:
+        end = min(n_samples, start + seg)
+        spans.append((start, end))
+        if end >= n_samples:
+            return spans
+        start = end - overlap
+
+
+__all__ = ["plan_segments"]
@@ -0,0 +1,111 @@
+"""vLLM audio queue replacement that tracks buffered audio for backlog control."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from collections.abc import Callable
+
+from src.config.limits import ASR_SAMPLE_RATE_HZ
+
+from .compact import BacklogPolicy, compact_silence
+
+
+class TrackedAudioQueue(asyncio.Queue):
+    """Track total audio samples currently buffered in vLLM's audio_queue.
+
+    ``on_change`` (optional) is called with the signed change in samples whenever the
+    total moves, e.g. so the feed scheduler can account for audio vLLM has consumed.
+    ``asyncio.Queue.put``/``get`` go through ``put_nowait``/``get_nowait``, so only those
+    count samples.
+    """
+
+    def __init__(self, *, on_change: Callable[[int], None] | None = None) -> None:
+        super().__init__()
+        self._on_change = on_change
+        self._total_samples: int = 0
+
+    @property
+    def total_samples(self) -> int:
+        return self._total_samples
+
+    @total_samples.setter
+    def total_samples(self, value: int) -> None:
+        delta = int(value) - self._total_samples
+        self._total_samples = int(value)
+        if delta and self._on_change is not None:
+            self._on_change(delta)
+
+    @staticmethod
+    def _count_samples(item: Any) -> int:
+        if item is None:
+            return 0
+        try:
+            return int(len(item))  # np.ndarray -> num samples
+        except Exception:
+            return 0
+
+    def put_nowait(self, item: Any) -> None:
+        self.total_samples += self._count_samples(item)
+        super().put_nowait(item)
+
+    def get_nowait(self) -> Any:
+        item = super().get_nowait()
+        self.total_samples -= self._count_samples(item)
+        self.total_samples = max(0, int(self.total_samples))
+        return item
+
+    def backlog_seconds(self) -> float:
+        return float(self.total_samples) / float(ASR_SAMPLE_RATE_HZ)
+
+    def enforce_backlog(self, policy: BacklogPolicy) -> tuple[float, float]:
+        """Compact silence, then drop oldest audio; return (compacted_seconds, dropped_seconds)."""
+        compacted_s = self.compact_to_max_backlog(policy)
+        return compacted_s, self.drop_oldest_to_max_backlog(max_backlog_seconds=policy.max_backlog_seconds)
+
+    def compact_to_max_backlog(self, policy: BacklogPolicy) -> float:
+        """Shorten silent runs in every queued chunk once over the backlog; return seconds removed."""
+        if policy.max_backlog_seconds <= 0 or self.backlog_seconds() <= float(policy.max_backlog_seconds):
+            return 0.0
+
+        items = []
+        while not self.empty():
+            items.append(super().get_nowait())
+        removed = 0
+        for item in items:
+            kept = item
+            if item is not None:
+                kept = compact_silence(
+                    item,
+                    frame_samples=policy.frame_samples,
+                    silence_db=policy.silence_db,
+                    keep_frames=policy.keep_frames,
+                )
+                removed += self._count_samples(item) - self._count_samples(kept)
+            if kept is None or len(kept) > 0:
+                super().put_nowait(kept)
+        self.total_samples = max(0, int(self.total_samples - removed))
+        return float(removed) / float(ASR_SAMPLE_RATE_HZ)
+
+    def drop_oldest_to_max_backlog(self, *, max_backlog_seconds: float) -> float:
+        if max_backlog_seconds <= 0:
+            return 0.0
+
+        dropped_samples = 0
+        while not self.empty() and self.backlog_seconds() > float(max_backlog_seconds):
+            try:
+                item = super().get_nowait()
+            except Exception:
+                break
+            if item is None:
+                # Preserve sentinel used to end the stream.
+                super().put_nowait(None)
+                break
+            dropped_samples += self._count_samples(item)
+            self.total_samples -= self._count_samples(item)
+            self.total_samples = max(0, int(self.total_samples))
+
+        return float(dropped_samples) / float(ASR_SAMPLE_RATE_HZ)
+
+
+__all__ = ["TrackedAudioQueue"]
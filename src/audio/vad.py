@@ -0,0 +1,46 @@
+"""Frame-level speech detection for server-side silence gating."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from collections.abc import Callable
+
+import numpy as np
+
+# A detector maps int16 frames shaped (n_frames, frame_samples) to a bool speech mask of
+# length n_frames. EnergyVad is the built-in one; a model-based detector can be swapped in.
+SpeechDetector = Callable[[np.ndarray], np.ndarray]
+
+
+def frame_levels_db(frames: np.ndarray) -> np.ndarray:
+    """RMS level (dBFS) of each row of frames shaped (n_frames, frame_samples).
+
+    int16 frames are scaled to [-1, 1); float frames are assumed to be in that range already.
+    """
+    x: np.ndarray = frames.astype(np.float32)
+    if np.issubdtype(frames.dtype, np.integer):
+        x *= np.float32(1.0 / 32768.0)
+    rms = np.sqrt(np.mean(x * x, axis=1))
+    return 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+
+@dataclass(frozen=True, slots=True)
+class EnergyVad:
+    """Energy + zero-crossing-rate speech detector, vectorized over whole blocks of frames."""
+
+    threshold_db: float = -45.0
+    # Quieter frames still count as speech when they look like unvoiced consonants
+    # (high zero-crossing rate within soft_margin_db of the threshold).
+    soft_margin_db: float = 10.0
+    zcr_min: float = 0.25
+
+    def __call__(self, frames: np.ndarray) -> np.ndarray:
+        level_db = frame_levels_db(frames)
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / max(1, frames.shape[1] - 1)
+        loud = level_db >= self.threshold_db
+        fricative = (level_db >= self.threshold_db - self.soft_margin_db) & (zcr >= self.zcr_min)
+        return loud | fricative
+
+
+__all__ = ["EnergyVad", "SpeechDetector", "frame_levels_db"]
@@ -0,0 +1,48 @@
+"""RIFF/WAVE parsing for uploaded recordings."""
+
+from __future__ import annotations
+
+import io
+import wave
+
+import numpy as np
+
+_RIFF_HEADER_BYTES = 12
+_PCM16_SAMPLE_WIDTH = 2
+
+
+def is_wav(data: bytes) -> bool:
+    return len(data) >= _RIFF_HEADER_BYTES and data[:4] == b"RIFF" and data[8:12] == b"WAVE"
+
+
+def wav_byte_rate(header: bytes) -> int:
+    """Audio bytes per second of a WAV file, read from its header alone; raise ValueError if unreadable."""
+    try:
+        with wave.open(io.BytesIO(header), "rb") as wav:
+            return wav.getnchannels() * wav.getsampwidth() * wav.getframerate()
+    except (wave.Error, EOFError) as exc:
+        raise ValueError(f"invalid WAV file: {exc}") from exc
+
+
+def read_wav(data: bytes) -> tuple[bytes, int]:
+    """Return ``(mono PCM16 LE bytes, sample_rate)``; raise ValueError on unsupported files.
+
+    Only 16-bit PCM is accepted; multi-channel audio is averaged down to mono.
+    """
+    try:
+        with wave.open(io.BytesIO(data), "rb") as wav:
+            channels = wav.getnchannels()
+            width = wav.getsampwidth()
+            rate = wav.getframerate()
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError) as exc:
+        raise ValueError(f"invalid WAV file: {exc}") from exc
+    if width != _PCM16_SAMPLE_WIDTH:
+        raise ValueError("WAV audio must be 16-bit PCM")
+    if channels == 1:
+        return frames, rate
+    samples = np.frombuffer(frames, dtype="<i2").reshape(-1, channels)
+    return samples.mean(axis=1).astype("<i2").tobytes(), rate
+
+
+__all__ = ["is_wav", "read_wav", "wav_byte_rate"]
@@ -1,9 +1,15 @@
 """Configuration module exports (env-resolved constants only)."""
 
 from .limits import (
+    MAX_ACTIVE_UTTERANCES,
     MAX_CONCURRENT_CONNECTIONS,
+    LOW_PRIORITY_UTTERANCE_SHARE,
+    CONNECTIONS_PER_UTTERANCE_SLOT,
 )
 
 __all__ = [
+    "CONNECTIONS_PER_UTTERANCE_SLOT",
+    "LOW_PRIORITY_UTTERANCE_SHARE",
+    "MAX_ACTIVE_UTTERANCES",
     "MAX_CONCURRENT_CONNECTIONS",
 ]
@@ -0,0 +1,28 @@
+"""Audio ingress settings (env-resolved constants only)."""
+
+from __future__ import annotations
+
+import os
+
+
+def _get_int(name: str, default: int) -> int:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return int(default)
+    try:
+        return int(raw)
+    except Exception:
+        return int(default)
+
+
+# Threads in the process-wide pool that decodes compressed client audio (Opus).
+STT_AUDIO_DECODE_WORKERS: int = max(1, _get_int("STT_AUDIO_DECODE_WORKERS", min(4, os.cpu_count() or 1)))
+
+# Max decode jobs queued or running across all connections; further packets wait (backpressure).
+STT_AUDIO_DECODE_MAX_PENDING: int = max(1, _get_int("STT_AUDIO_DECODE_MAX_PENDING", 256))
+
+
+__all__ = [
+    "STT_AUDIO_DECODE_MAX_PENDING",
+    "STT_AUDIO_DECODE_WORKERS",
+]
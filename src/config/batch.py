@@ -0,0 +1,51 @@
+"""Batch (whole-file) transcription settings (env-resolved constants only)."""
+
+from __future__ import annotations
+
+import os
+
+# Server endpoint path (kept in config so it's not duplicated across modules).
+BATCH_ENDPOINT_PATH: str = "/api/asr-batch"
+
+# Error code for uploads longer than STT_BATCH_MAX_SECONDS (others reuse the WS_ERROR_* codes).
+BATCH_ERROR_AUDIO_TOO_LONG = "audio_too_long"
+# Error code for requests whose client disconnected before the transcript was ready.
+BATCH_ERROR_CLIENT_CLOSED = "client_closed"
+
+
+def _get_int(name: str, default: int) -> int:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return int(default)
+    try:
+        return int(raw)
+    except Exception:
+        return int(default)
+
+
+def _get_float(name: str, default: float) -> float:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return float(default)
+    try:
+        return float(raw)
+    except Exception:
+        return float(default)
+
+
+# Segments transcribed concurrently across all batch requests (split across frontend
+# workers); each also needs a low-priority utterance slot.
+STT_BATCH_MAX_CONCURRENCY: int = max(1, _get_int("STT_BATCH_MAX_CONCURRENCY", 16))
+
+# Longest recording one request may upload; also bounds the upload's size in bytes for its
+# format, checked while the body streams in.
+STT_BATCH_MAX_SECONDS: float = max(1.0, _get_float("STT_BATCH_MAX_SECONDS", 3600.0))
+
+
+__all__ = [
+    "BATCH_ENDPOINT_PATH",
+    "BATCH_ERROR_AUDIO_TOO_LONG",
+    "BATCH_ERROR_CLIENT_CLOSED",
+    "STT_BATCH_MAX_CONCURRENCY",
+    "STT_BATCH_MAX_SECONDS",
+]
@@ -0,0 +1,26 @@
+"""Frontend worker process settings (env-resolved constants only)."""
+
+from __future__ import annotations
+
+import os
+
+
+def _get_int(name: str, default: int) -> int:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return int(default)
+    try:
+        return int(raw)
+    except Exception:
+        return int(default)
+
+
+# Frontend processes that accept WebSockets (protocol handling, audio decoding, socket
+# I/O) in front of one shared vLLM engine process. 1 serves everything in-process.
+STT_FRONTEND_WORKERS: int = max(1, _get_int("STT_FRONTEND_WORKERS", 1))
+
+# Where the frontend workers listen (shared socket; the kernel spreads connections).
+SERVER_BIND_HOST: str = (os.getenv("SERVER_BIND_HOST") or "0.0.0.0").strip()  # noqa: S104
+SERVER_PORT: int = _get_int("SERVER_PORT", 8000)
+
+__all__ = ["SERVER_BIND_HOST", "SERVER_PORT", "STT_FRONTEND_WORKERS"]
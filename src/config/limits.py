@@ -4,9 +4,14 @@ from __future__ import annotations
 
 import os
 
-# Server expects PCM16 audio at 16kHz (Voxtral realtime default).
+# Model input rate (Voxtral realtime). Clients may declare another rate per session
+# (session.update input_sample_rate); that audio is resampled server-side.
 ASR_SAMPLE_RATE_HZ: int = 16000
 
+# Voxtral realtime consumes one ~80ms audio frame per model step (token).
+ASR_FRAME_SECONDS: float = 0.08
+ASR_FRAME_SAMPLES: int = int(ASR_SAMPLE_RATE_HZ * ASR_FRAME_SECONDS)  # 1280 for 16kHz
+
 _MAX_CONCURRENT_CONNECTIONS_RAW = (os.getenv("MAX_CONCURRENT_CONNECTIONS") or "").strip()
 try:
     MAX_CONCURRENT_CONNECTIONS: int = int(_MAX_CONCURRENT_CONNECTIONS_RAW) if _MAX_CONCURRENT_CONNECTIONS_RAW else 0
@@ -14,7 +19,55 @@ except Exception:
     MAX_CONCURRENT_CONNECTIONS = 0
 MAX_CONCURRENT_CONNECTIONS = max(0, int(MAX_CONCURRENT_CONNECTIONS))
 
+# Active utterances (commit final=false until done) each hold one vLLM sequence; idle
+# connections hold none. 0 = auto from the tuned max_num_seqs.
+_MAX_ACTIVE_UTTERANCES_RAW = (os.getenv("MAX_ACTIVE_UTTERANCES") or "").strip()
+try:
+    MAX_ACTIVE_UTTERANCES: int = int(_MAX_ACTIVE_UTTERANCES_RAW) if _MAX_ACTIVE_UTTERANCES_RAW else 0
+except Exception:
+    MAX_ACTIVE_UTTERANCES = 0
+MAX_ACTIVE_UTTERANCES = max(0, int(MAX_ACTIVE_UTTERANCES))
+
+# Auto connection cap (MAX_CONCURRENT_CONNECTIONS=0): this many connections per utterance slot.
+_CONNECTIONS_PER_UTTERANCE_SLOT_RAW = (os.getenv("CONNECTIONS_PER_UTTERANCE_SLOT") or "").strip()
+try:
+    CONNECTIONS_PER_UTTERANCE_SLOT: float = (
+        float(_CONNECTIONS_PER_UTTERANCE_SLOT_RAW) if _CONNECTIONS_PER_UTTERANCE_SLOT_RAW else 4.0
+    )
+except Exception:
+    CONNECTIONS_PER_UTTERANCE_SLOT = 4.0
+CONNECTIONS_PER_UTTERANCE_SLOT = max(1.0, float(CONNECTIONS_PER_UTTERANCE_SLOT))
+
+# Priority classes, lowest first. API keys map to a class (see VOXTRAL_API_KEY_PRIORITIES).
+PRIORITY_RANKS: dict[str, int] = {"low": 0, "normal": 1, "high": 2}
+PRIORITY_DEFAULT: str = "normal"
+
+# Per class: share of audio fed into vLLM per feed-scheduler turn (relative to
+# STT_FEED_QUANTUM_SECONDS), and share of STT_MAX_BACKLOG_SECONDS kept before dropping.
+PRIORITY_FEED_WEIGHTS: dict[str, float] = {"low": 0.5, "normal": 1.0, "high": 2.0}
+PRIORITY_BACKLOG_SCALES: dict[str, float] = {"low": 0.5, "normal": 1.0, "high": 1.0}
+
+# Most of the utterance slots low-priority traffic may hold at once, so some always stay
+# free for other classes.
+_LOW_PRIORITY_UTTERANCE_SHARE_RAW = (os.getenv("LOW_PRIORITY_UTTERANCE_SHARE") or "").strip()
+try:
+    LOW_PRIORITY_UTTERANCE_SHARE: float = (
+        float(_LOW_PRIORITY_UTTERANCE_SHARE_RAW) if _LOW_PRIORITY_UTTERANCE_SHARE_RAW else 0.75
+    )
+except Exception:
+    LOW_PRIORITY_UTTERANCE_SHARE = 0.75
+LOW_PRIORITY_UTTERANCE_SHARE = min(1.0, max(0.0, float(LOW_PRIORITY_UTTERANCE_SHARE)))
+
 __all__ = [
+    "ASR_FRAME_SAMPLES",
+    "ASR_FRAME_SECONDS",
     "ASR_SAMPLE_RATE_HZ",
+    "CONNECTIONS_PER_UTTERANCE_SLOT",
+    "LOW_PRIORITY_UTTERANCE_SHARE",
+    "MAX_ACTIVE_UTTERANCES",
     "MAX_CONCURRENT_CONNECTIONS",
+    "PRIORITY_BACKLOG_SCALES",
+    "PRIORITY_DEFAULT",
+    "PRIORITY_FEED_WEIGHTS",
+    "PRIORITY_RANKS",
 ]
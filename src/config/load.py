@@ -0,0 +1,45 @@
+"""Engine-aware load shedding settings (env-resolved constants only)."""
+
+from __future__ import annotations
+
+import os
+
+
+def _get_float(name: str, default: float) -> float:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return float(default)
+    try:
+        return float(raw)
+    except Exception:
+        return float(default)
+
+
+# How often the load controller reads engine stats (seconds). 0 disables it.
+STT_LOAD_POLL_S: float = max(0.0, _get_float("STT_LOAD_POLL_S", 1.0))
+
+# KV cache usage (0..1) that counts as full pressure.
+STT_LOAD_KV_HIGH: float = min(1.0, max(0.1, _get_float("STT_LOAD_KV_HIGH", 0.9)))
+
+# Mean audio waiting in vLLM input queues per active utterance that counts as full
+# pressure (seconds). It grows once engine steps fall behind realtime audio; a segment
+# start briefly queues the transcription delay, so keep this above it.
+STT_LOAD_LAG_BUDGET_S: float = max(0.16, _get_float("STT_LOAD_LAG_BUDGET_S", 1.0))
+
+# Requests waiting in vLLM's scheduler per running request that count as full pressure.
+# Pressure grows in proportion below it, so one request queued for a step is no overload.
+STT_LOAD_WAITING_HIGH: float = max(0.01, _get_float("STT_LOAD_WAITING_HIGH", 0.25))
+
+# At full pressure, the per-connection backlog bound shrinks to this share of
+# STT_MAX_BACKLOG_SECONDS, and new utterances are admitted up to this share of the slots.
+STT_LOAD_MIN_BACKLOG_SCALE: float = min(1.0, max(0.05, _get_float("STT_LOAD_MIN_BACKLOG_SCALE", 0.4)))
+STT_LOAD_MIN_UTTERANCE_SCALE: float = min(1.0, max(0.05, _get_float("STT_LOAD_MIN_UTTERANCE_SCALE", 0.5)))
+
+__all__ = [
+    "STT_LOAD_KV_HIGH",
+    "STT_LOAD_LAG_BUDGET_S",
+    "STT_LOAD_MIN_BACKLOG_SCALE",
+    "STT_LOAD_MIN_UTTERANCE_SCALE",
+    "STT_LOAD_POLL_S",
+    "STT_LOAD_WAITING_HIGH",
+]
@@ -0,0 +1,47 @@
+"""Per-API-key quota defaults (env-resolved constants only).
+
+Each applies to every accepted key that VOXTRAL_API_KEYS_FILE does not override;
+0 disables a limit.
+"""
+
+from __future__ import annotations
+
+import os
+
+
+def _get_int(name: str, default: int) -> int:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return int(default)
+    try:
+        return int(raw)
+    except Exception:
+        return int(default)
+
+
+def _get_float(name: str, default: float) -> float:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return float(default)
+    try:
+        return float(raw)
+    except Exception:
+        return float(default)
+
+
+# Connections and active utterances one key may hold at once on this node.
+KEY_MAX_CONNECTIONS: int = max(0, _get_int("KEY_MAX_CONNECTIONS", 0))
+KEY_MAX_UTTERANCES: int = max(0, _get_int("KEY_MAX_UTTERANCES", 0))
+
+# Audio seconds streamed, and connection attempts, per key per KEY_QUOTA_WINDOW_S.
+KEY_AUDIO_SECONDS_PER_WINDOW: float = max(0.0, _get_float("KEY_AUDIO_SECONDS_PER_WINDOW", 0.0))
+KEY_CONNECTS_PER_WINDOW: int = max(0, _get_int("KEY_CONNECTS_PER_WINDOW", 0))
+KEY_QUOTA_WINDOW_S: float = max(1.0, _get_float("KEY_QUOTA_WINDOW_S", 60.0))
+
+__all__ = [
+    "KEY_AUDIO_SECONDS_PER_WINDOW",
+    "KEY_CONNECTS_PER_WINDOW",
+    "KEY_MAX_CONNECTIONS",
+    "KEY_MAX_UTTERANCES",
+    "KEY_QUOTA_WINDOW_S",
+]
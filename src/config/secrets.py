@@ -4,8 +4,37 @@ from __future__ import annotations
 
 import os
 
+from .limits import PRIORITY_RANKS, PRIORITY_DEFAULT
+
+
+def _priority(raw: str) -> str:
+    name = raw.strip().lower()
+    return name if name in PRIORITY_RANKS else PRIORITY_DEFAULT
+
+
+def _parse_key_priorities(raw: str) -> dict[str, str]:
+    priorities: dict[str, str] = {}
+    for entry in raw.split(","):
+        key, _, priority = entry.strip().rpartition(":")
+        if key.strip():
+            priorities[key.strip()] = _priority(priority)
+    return priorities
+
+
 VOXTRAL_API_KEY: str = (os.getenv("VOXTRAL_API_KEY") or "").strip()
 
+# Priority class of VOXTRAL_API_KEY (low, normal or high).
+VOXTRAL_API_KEY_PRIORITY: str = _priority(os.getenv("VOXTRAL_API_KEY_PRIORITY") or PRIORITY_DEFAULT)
+
+# Additional API keys with their priority classes: "key1:high,key2:low".
+VOXTRAL_API_KEY_PRIORITIES: dict[str, str] = _parse_key_priorities(os.getenv("VOXTRAL_API_KEY_PRIORITIES") or "")
+
+# JSON file of further API keys, each with a priority class and quotas (see ADVANCED.md).
+VOXTRAL_API_KEYS_FILE: str = (os.getenv("VOXTRAL_API_KEYS_FILE") or "").strip()
+
 __all__ = [
     "VOXTRAL_API_KEY",
+    "VOXTRAL_API_KEYS_FILE",
+    "VOXTRAL_API_KEY_PRIORITIES",
+    "VOXTRAL_API_KEY_PRIORITY",
 ]
@@ -29,20 +29,56 @@ def _get_bool(name: str, default: bool) -> bool:
 # Internal rolling: keep vLLM requests bounded and "infinite" from the client POV.
 STT_INTERNAL_ROLL: bool = _get_bool("STT_INTERNAL_ROLL", True)
 
-# How many seconds of audio to send per internal segment before rolling.
+# Soft segment length: past this, a segment rolls at the next pause (or at the
+# max_model_len-derived hard limit if no pause comes first).
 STT_SEGMENT_SECONDS: float = max(1.0, _get_float("STT_SEGMENT_SECONDS", 60.0))
 
+# A roll point counts as a clean pause when a window this long averages at or below
+# STT_ROLL_PAUSE_DB; clean rolls skip the overlap replay.
+STT_ROLL_PAUSE_SECONDS: float = max(0.08, _get_float("STT_ROLL_PAUSE_SECONDS", 0.24))
+STT_ROLL_PAUSE_DB: float = _get_float("STT_ROLL_PAUSE_DB", -45.0)
+
 # How many seconds of audio to replay at the next segment start.
 STT_SEGMENT_OVERLAP_SECONDS: float = max(0.0, _get_float("STT_SEGMENT_OVERLAP_SECONDS", 0.8))
 
 # When inbound audio backlog exceeds this, drop oldest audio to stay live.
 STT_MAX_BACKLOG_SECONDS: float = max(0.0, _get_float("STT_MAX_BACKLOG_SECONDS", 5.0))
 
+# Over the backlog bound, frames at or below this level (dBFS) are compacted out of long
+# pauses first; speech is only dropped if that is not enough.
+STT_BACKLOG_SILENCE_DB: float = _get_float("STT_BACKLOG_SILENCE_DB", -45.0)
+
+# Feed scheduling across all connections: each feeder turn hands at most this much
+# audio to vLLM (deficit round robin), so a client dumping a backlog cannot crowd out
+# live streams.
+STT_FEED_QUANTUM_SECONDS: float = max(0.08, _get_float("STT_FEED_QUANTUM_SECONDS", 0.4))
+
+# Cap on audio waiting in vLLM input queues across all connections, per active utterance
+# slot (0 disables the cap). Past it, feeders wait for vLLM to consume audio.
+STT_FEED_INFLIGHT_SECONDS_PER_UTTERANCE: float = max(0.0, _get_float("STT_FEED_INFLIGHT_SECONDS_PER_UTTERANCE", 1.0))
+
+# Server-side voice-activity gating: skip long silent stretches before they reach vLLM.
+STT_VAD_ENABLED: bool = _get_bool("STT_VAD_ENABLED", False)
+
+# Frame level (dBFS) at or above which audio counts as speech.
+STT_VAD_THRESHOLD_DB: float = _get_float("STT_VAD_THRESHOLD_DB", -45.0)
+
+# Silence kept on each side of speech so word edges (and the transcript) are unchanged.
+STT_VAD_PADDING_SECONDS: float = max(0.0, _get_float("STT_VAD_PADDING_SECONDS", 0.32))
+
 
 __all__ = [
+    "STT_BACKLOG_SILENCE_DB",
+    "STT_FEED_INFLIGHT_SECONDS_PER_UTTERANCE",
+    "STT_FEED_QUANTUM_SECONDS",
     "STT_INTERNAL_ROLL",
     "STT_MAX_BACKLOG_SECONDS",
+    "STT_ROLL_PAUSE_DB",
+    "STT_ROLL_PAUSE_SECONDS",
     "STT_SEGMENT_OVERLAP_SECONDS",
     "STT_SEGMENT_SECONDS",
+    "STT_VAD_ENABLED",
+    "STT_VAD_PADDING_SECONDS",
+    "STT_VAD_THRESHOLD_DB",
 ]
 
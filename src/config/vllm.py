@@ -28,6 +28,10 @@ except Exception:
     VLLM_MAX_MODEL_LEN = 1024
 VLLM_MAX_MODEL_LEN = max(1, int(VLLM_MAX_MODEL_LEN))
 
+# Audio tokens one request can hold: max_model_len minus room for text/system tokens.
+VLLM_AUDIO_TOKEN_HEADROOM: int = 128
+VLLM_MAX_AUDIO_TOKENS: int = max(1, VLLM_MAX_MODEL_LEN - VLLM_AUDIO_TOKEN_HEADROOM)
+
 _MAX_NUM_SEQS_RAW = (os.getenv("VLLM_MAX_NUM_SEQS") or "").strip()
 try:
     VLLM_MAX_NUM_SEQS: int = int(_MAX_NUM_SEQS_RAW) if _MAX_NUM_SEQS_RAW else 128
@@ -35,9 +39,20 @@ except Exception:
     VLLM_MAX_NUM_SEQS = 128
 VLLM_MAX_NUM_SEQS = max(1, int(VLLM_MAX_NUM_SEQS))
 
+# Engine replicas (vLLM data parallelism, one per GPU). Each gets max_num_seqs sequences,
+# and every new vLLM request goes to the least-loaded replica (see ReplicaRouter).
+_DATA_PARALLEL_SIZE_RAW = (os.getenv("VLLM_DATA_PARALLEL_SIZE") or "").strip()
+try:
+    VLLM_DATA_PARALLEL_SIZE: int = int(_DATA_PARALLEL_SIZE_RAW) if _DATA_PARALLEL_SIZE_RAW else 1
+except Exception:
+    VLLM_DATA_PARALLEL_SIZE = 1
+VLLM_DATA_PARALLEL_SIZE = max(1, int(VLLM_DATA_PARALLEL_SIZE))
+# Per-replica load (JSON), for dashboards and for checking the router spreads utterances.
+REPLICAS_ENDPOINT_PATH: str = "/replicas"
+
 # max_num_batched_tokens is a throughput/tail-latency knob.
 #
-# It is selected per-GPU at runtime (see `src/runtime/vllm.py`). This constant is
+# It is selected per-GPU at runtime (see `src/runtime/tuning.py`). This constant is
 # a safe fallback used when GPU detection is unavailable (e.g., CPU-only tests).
 VLLM_MAX_NUM_BATCHED_TOKENS: int = 2048
 
@@ -88,15 +103,19 @@ VLLM_DISABLE_COMPILE_CACHE: bool = (
 )
 
 __all__ = [
+    "REPLICAS_ENDPOINT_PATH",
+    "VLLM_AUDIO_TOKEN_HEADROOM",
     "VLLM_CALCULATE_KV_SCALES",
     "VLLM_COMPILATION_CONFIG",
     "VLLM_CONFIG_FORMAT",
+    "VLLM_DATA_PARALLEL_SIZE",
     "VLLM_DISABLE_COMPILE_CACHE",
     "VLLM_DTYPE",
     "VLLM_ENFORCE_EAGER",
     "VLLM_GPU_MEMORY_UTILIZATION",
     "VLLM_KV_CACHE_DTYPE",
     "VLLM_LOAD_FORMAT",
+    "VLLM_MAX_AUDIO_TOKENS",
     "VLLM_MAX_MODEL_LEN",
     "VLLM_MAX_NUM_BATCHED_TOKENS",
     "VLLM_MAX_NUM_SEQS",
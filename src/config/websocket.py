@@ -73,9 +73,48 @@ except Exception:
     WS_INBOUND_QUEUE_MAX = 256
 WS_INBOUND_QUEUE_MAX = max(1, int(WS_INBOUND_QUEUE_MAX))
 
+# Waiting room: when the connection cap is reached, up to WS_WAITING_ROOM_MAX sockets are
+# accepted and queued FIFO (status frames every WS_WAITING_ROOM_STATUS_S with their position)
+# instead of being refused, and admitted as slots free. 0 disables it (refuse at once).
+_WS_WAITING_ROOM_MAX_RAW = (os.getenv("WS_WAITING_ROOM_MAX") or "").strip()
+try:
+    WS_WAITING_ROOM_MAX: int = int(_WS_WAITING_ROOM_MAX_RAW) if _WS_WAITING_ROOM_MAX_RAW else 0
+except Exception:
+    WS_WAITING_ROOM_MAX = 0
+WS_WAITING_ROOM_MAX = max(0, int(WS_WAITING_ROOM_MAX))
+
+_WS_WAITING_ROOM_MAX_WAIT_S_RAW = (os.getenv("WS_WAITING_ROOM_MAX_WAIT_S") or "").strip()
+try:
+    WS_WAITING_ROOM_MAX_WAIT_S: float = (
+        float(_WS_WAITING_ROOM_MAX_WAIT_S_RAW) if _WS_WAITING_ROOM_MAX_WAIT_S_RAW else 60.0
+    )
+except Exception:
+    WS_WAITING_ROOM_MAX_WAIT_S = 60.0
+WS_WAITING_ROOM_MAX_WAIT_S = max(0.0, float(WS_WAITING_ROOM_MAX_WAIT_S))
+
+_WS_WAITING_ROOM_STATUS_S_RAW = (os.getenv("WS_WAITING_ROOM_STATUS_S") or "").strip()
+try:
+    WS_WAITING_ROOM_STATUS_S: float = float(_WS_WAITING_ROOM_STATUS_S_RAW) if _WS_WAITING_ROOM_STATUS_S_RAW else 2.0
+except Exception:
+    WS_WAITING_ROOM_STATUS_S = 2.0
+if WS_WAITING_ROOM_STATUS_S <= 0:
+    WS_WAITING_ROOM_STATUS_S = 2.0
+
+# Outbound token coalescing: token text is merged and sent at most once per interval
+# (0 sends every model delta as its own frame). Clients can pick their own interval with
+# session.update "partial_interval_ms", up to WS_PARTIAL_INTERVAL_MAX_MS.
+WS_PARTIAL_INTERVAL_MAX_MS = 1000
+_WS_PARTIAL_INTERVAL_MS_RAW = (os.getenv("WS_PARTIAL_INTERVAL_MS") or "").strip()
+try:
+    WS_PARTIAL_INTERVAL_MS: int = int(_WS_PARTIAL_INTERVAL_MS_RAW) if _WS_PARTIAL_INTERVAL_MS_RAW else 0
+except Exception:
+    WS_PARTIAL_INTERVAL_MS = 0
+WS_PARTIAL_INTERVAL_MS = min(max(0, int(WS_PARTIAL_INTERVAL_MS)), WS_PARTIAL_INTERVAL_MAX_MS)
+
 # Errors (payload.code values)
 WS_ERROR_AUTH_FAILED = "authentication_failed"
 WS_ERROR_SERVER_AT_CAPACITY = "server_at_capacity"
+WS_ERROR_RATE_LIMITED = "rate_limited"
 WS_ERROR_INVALID_MESSAGE = "invalid_message"
 WS_ERROR_INVALID_PAYLOAD = "invalid_payload"
 WS_ERROR_INTERNAL = "internal_error"
@@ -92,13 +131,19 @@ __all__ = [
     "WS_IDLE_TIMEOUT_S",
     "WS_INBOUND_QUEUE_MAX",
     "WS_MAX_CONNECTION_DURATION_S",
+    "WS_PARTIAL_INTERVAL_MAX_MS",
+    "WS_PARTIAL_INTERVAL_MS",
     "WS_WATCHDOG_TICK_S",
+    "WS_WAITING_ROOM_MAX",
+    "WS_WAITING_ROOM_MAX_WAIT_S",
+    "WS_WAITING_ROOM_STATUS_S",
     "WS_UNKNOWN_REQUEST_ID",
     "WS_UNKNOWN_SESSION_ID",
     "WS_ERROR_AUTH_FAILED",
     "WS_ERROR_INTERNAL",
     "WS_ERROR_INVALID_MESSAGE",
     "WS_ERROR_INVALID_PAYLOAD",
+    "WS_ERROR_RATE_LIMITED",
     "WS_ERROR_SERVER_AT_CAPACITY",
     "WS_KEY_PAYLOAD",
     "WS_KEY_REQUEST_ID",
@@ -0,0 +1,35 @@
+"""Exceptions shared across handlers."""
+
+from __future__ import annotations
+
+
+class RateLimitError(Exception):
+    """A request exceeded a rate or concurrency limit.
+
+    ``window_seconds`` is 0 for concurrency limits (connections or utterances held at once).
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        limit: float,
+        window_seconds: float,
+        retry_after_s: float = 0.0,
+        reason: str = "rate_limited",
+    ) -> None:
+        super().__init__(message)
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.retry_after_s = retry_after_s
+        self.reason = reason
+
+    def details(self) -> dict[str, float | str]:
+        return {
+            "limit": self.limit,
+            "window_s": self.window_seconds,
+            "retry_after_s": round(self.retry_after_s, 3),
+        }
+
+
+__all__ = ["RateLimitError"]
@@ -0,0 +1,79 @@
+"""Multi-process WebSocket frontends in front of one shared vLLM engine.
+
+``python -m src.frontends`` (used by scripts/steps/05-start-server.sh when
+STT_FRONTEND_WORKERS > 1) starts the engine core once, then STT_FRONTEND_WORKERS
+processes that each serve the regular app on a shared listening socket. JSON parsing,
+audio decoding, envelope assembly and socket I/O thus scale across CPU cores, while
+every frontend submits to the same engine over vLLM's local ZeroMQ IPC sockets (the
+mechanism behind ``vllm serve --api-server-count``). The engine is tuned once here and
+its config handed to the frontends, which never touch the GPU themselves.
+
+Admission state (connection and utterance limits, the feed scheduler, per-key quotas,
+load shedding) lives in each frontend; node-wide limits are split evenly between them.
+"""
+
+from __future__ import annotations
+
+import signal
+import socket
+import logging
+from typing import Any
+
+import uvicorn
+from vllm.v1.executor import Executor
+from vllm.v1.engine.utils import launch_core_engines
+from vllm.entrypoints.openai.api_server import create_server_socket
+from vllm.v1.utils import APIServerProcessManager, wait_for_completion_or_failure
+
+from src.server import app
+from src.runtime.settings import load_settings
+from src.runtime.vllm import SharedEngine, prepare_shared_engine
+from src.config.frontends import SERVER_PORT, SERVER_BIND_HOST, STT_FRONTEND_WORKERS
+
+logger = logging.getLogger(__name__)
+
+
+def _serve_frontend(
+    _listen_address: str, sock: socket.socket, shared_engine: SharedEngine, client_config: dict[str, Any]
+) -> None:
+    """Frontend worker process: the regular app, attached to the shared engine."""
+    app.state.shared_engine = shared_engine
+    app.state.engine_client_config = client_config
+    server = uvicorn.Server(uvicorn.Config(app, log_config=None))
+    server.run(sockets=[sock])
+
+
+def _raise_interrupt(*_: Any) -> None:
+    # Unwind (terminating the engine and the frontends) on SIGTERM, e.g. scripts/stop.sh.
+    raise KeyboardInterrupt("terminated")
+
+
+def run_frontends(workers: int = STT_FRONTEND_WORKERS) -> None:
+    # Tuned once here; the frontends get the result instead of probing the GPU themselves.
+    shared_engine = prepare_shared_engine(load_settings(), frontends=workers)
+    vllm_config = shared_engine.vllm_config
+
+    # Bind before the engine starts, so the port is held while the model loads.
+    sock = create_server_socket((SERVER_BIND_HOST, SERVER_PORT))
+    signal.signal(signal.SIGTERM, _raise_interrupt)
+    logger.info("frontends: starting engine (model=%s) for %s frontend workers", shared_engine.model_dir, workers)
+
+    with launch_core_engines(
+        vllm_config, Executor.get_class(vllm_config), not shared_engine.engine_args.disable_log_stats, workers
+    ) as (engine_manager, coordinator, addresses):
+        frontends = APIServerProcessManager(
+            target_server_fn=_serve_frontend,
+            listen_address=f"http://{SERVER_BIND_HOST}:{SERVER_PORT}",
+            sock=sock,
+            args=shared_engine,
+            num_servers=workers,
+            input_addresses=addresses.inputs,
+            output_addresses=addresses.outputs,
+            stats_update_address=coordinator.get_stats_publish_address() if coordinator else None,
+        )
+
+    wait_for_completion_or_failure(api_server_manager=frontends, engine_manager=engine_manager, coordinator=coordinator)
+
+
+if __name__ == "__main__":
+    run_frontends()
@@ -0,0 +1,201 @@
+"""HTTP handler for whole-file (batch) transcription."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import contextlib
+from typing import Any, TypeVar
+from collections.abc import Awaitable
+
+import numpy as np
+from fastapi import Request
+from fastapi.responses import ORJSONResponse
+
+from src.state import RuntimeDeps
+from src.errors import RateLimitError
+from src.audio.pool import AudioWorkerPool
+from src.audio.g711 import G711_SAMPLE_RATE_HZ
+from src.config.limits import ASR_SAMPLE_RATE_HZ
+from src.audio.wav import is_wav, read_wav, wav_byte_rate
+from src.config.websocket import WS_ERROR_AUTH_FAILED, WS_ERROR_RATE_LIMITED, WS_ERROR_INVALID_PAYLOAD
+from src.config.batch import STT_BATCH_MAX_SECONDS, BATCH_ERROR_CLIENT_CLOSED, BATCH_ERROR_AUDIO_TOO_LONG
+from src.audio.ingress import (
+    OPUS_FORMAT,
+    PCM16_FORMAT,
+    G711_ALAW_FORMAT,
+    G711_ULAW_FORMAT,
+    SUPPORTED_INPUT_SAMPLE_RATES,
+    AudioIngress,
+    available_input_audio_formats,
+)
+
+from .websocket.auth import get_api_key, resolve_priority
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Body read before the upload's size bound is set (enough for a WAV header).
+_UPLOAD_HEAD_BYTES: int = 4096
+# Room for WAV header and metadata chunks on top of the audio itself.
+_WAV_OVERHEAD_BYTES: int = 64 * 1024
+_PCM16_SAMPLE_BYTES: int = 2
+
+
+def _error(status_code: int, code: str, message: str, details: dict[str, Any] | None = None) -> ORJSONResponse:
+    return ORJSONResponse(
+        {"error": {"code": code, "message": message, "details": details or {}}}, status_code=status_code
+    )
+
+
+def batch_input_audio_formats() -> tuple[str, ...]:
+    # Raw Opus packets carry no framing once concatenated into a file.
+    return tuple(fmt for fmt in available_input_audio_formats() if fmt != OPUS_FORMAT)
+
+
+def upload_byte_limit(head: bytes, params: Any) -> int:
+    """Largest body that STT_BATCH_MAX_SECONDS of audio in the upload's format can take.
+
+    WAV uploads are sized from their header (``head`` holds the start of the body); raw
+    audio from its query params. Raise ValueError on an unreadable WAV header.
+    """
+    if is_wav(head):
+        return int(STT_BATCH_MAX_SECONDS * wav_byte_rate(head)) + _WAV_OVERHEAD_BYTES
+    audio_format = params.get("input_audio_format") or PCM16_FORMAT
+    if audio_format in {G711_ULAW_FORMAT, G711_ALAW_FORMAT}:
+        return int(STT_BATCH_MAX_SECONDS * G711_SAMPLE_RATE_HZ)
+    sample_rate = params.get("input_sample_rate") or ""
+    rate = int(sample_rate) if sample_rate.isdigit() else ASR_SAMPLE_RATE_HZ
+    return int(STT_BATCH_MAX_SECONDS * min(rate, max(SUPPORTED_INPUT_SAMPLE_RATES))) * _PCM16_SAMPLE_BYTES
+
+
+async def read_upload(request: Request) -> tuple[bytes | None, int]:
+    """Stream the body in; return ``(body, max_bytes)``, with body None once it is over the bound.
+
+    The bound (``upload_byte_limit``) is set from the first bytes; a larger Content-Length is
+    refused before the rest is read, and the running count stops the read if the header lied.
+    """
+    chunks: list[bytes] = []
+    received = 0
+    max_bytes: int | None = None
+    async for chunk in request.stream():
+        chunks.append(chunk)
+        received += len(chunk)
+        if max_bytes is None and received >= _UPLOAD_HEAD_BYTES:
+            max_bytes = upload_byte_limit(b"".join(chunks), request.query_params)
+            declared = request.headers.get("content-length") or ""
+            if declared.isdigit() and int(declared) > max_bytes:
+                return None, max_bytes
+        if max_bytes is not None and received > max_bytes:
+            return None, max_bytes
+    body = b"".join(chunks)
+    if max_bytes is None:
+        max_bytes = upload_byte_limit(body, request.query_params)
+    return (body if len(body) <= max_bytes else None), max_bytes
+
+
+async def decode_upload(body: bytes, params: Any, *, pool: AudioWorkerPool) -> np.ndarray:
+    """Turn an uploaded file (WAV, or raw audio described by query params) into 16 kHz PCM16."""
+    if not body:
+        raise ValueError("request body is empty")
+    audio_format = params.get("input_audio_format") or PCM16_FORMAT
+    sample_rate = params.get("input_sample_rate") or str(ASR_SAMPLE_RATE_HZ)
+    if is_wav(body):
+        body, rate = read_wav(body)
+        audio_format, sample_rate = PCM16_FORMAT, str(rate)
+    if audio_format not in batch_input_audio_formats():
+        raise ValueError(f"unsupported input_audio_format: {audio_format}")
+    if not sample_rate.isdigit():
+        raise ValueError(f"unsupported input_sample_rate: {sample_rate}")
+
+    ingress = AudioIngress(pool=pool, audio_format=audio_format)
+    if audio_format == PCM16_FORMAT:
+        ingress.set_sample_rate(int(sample_rate))
+    pcm = await ingress.to_pcm16(body) + await ingress.flush()
+    return np.frombuffer(pcm, dtype="<i2")
+
+
+async def wait_for_disconnect(request: Request) -> None:
+    """Return once the client has gone away (the body must already be read)."""
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
+
+
+async def run_until_disconnect(request: Request, job: Awaitable[_T]) -> _T | None:
+    """Await ``job``; cancel it and return None if the client disconnects first."""
+    task = asyncio.ensure_future(job)
+    watcher = asyncio.ensure_future(wait_for_disconnect(request))
+    try:
+        await asyncio.wait((task, watcher), return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
+        if not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+    if task.cancelled():
+        return None
+    return task.result()
+
+
+async def _transcribe(request: Request, runtime_deps: RuntimeDeps, samples: np.ndarray) -> ORJSONResponse:
+    result = await run_until_disconnect(request, runtime_deps.batch_transcriber.transcribe(samples))
+    if result is None:
+        logger.info("batch client disconnected; transcription aborted")
+        return _error(499, BATCH_ERROR_CLIENT_CLOSED, "client disconnected")
+    return ORJSONResponse(result)
+
+
+async def handle_batch_transcription(request: Request, runtime_deps: RuntimeDeps) -> ORJSONResponse:
+    api_key = get_api_key(request)
+    if resolve_priority(api_key, runtime_deps.settings.auth.key_priorities) is None:
+        return _error(
+            401,
+            WS_ERROR_AUTH_FAILED,
+            "Authentication required. Provide valid API key via 'api_key' query parameter or 'X-API-Key' header.",
+        )
+
+    try:
+        body, max_bytes = await read_upload(request)
+        if body is None:
+            return _error(
+                413,
+                BATCH_ERROR_AUDIO_TOO_LONG,
+                "upload is larger than the batch limit allows for its audio format",
+                {"max_bytes": max_bytes, "max_seconds": STT_BATCH_MAX_SECONDS},
+            )
+        samples = await decode_upload(body, request.query_params, pool=runtime_deps.audio_pool)
+    except ValueError as exc:
+        details = {
+            "supported_formats": list(batch_input_audio_formats()),
+            "supported_sample_rates": list(SUPPORTED_INPUT_SAMPLE_RATES),
+        }
+        return _error(400, WS_ERROR_INVALID_PAYLOAD, str(exc), details)
+
+    duration = float(len(samples)) / float(ASR_SAMPLE_RATE_HZ)
+    if duration > STT_BATCH_MAX_SECONDS:
+        return _error(
+            413,
+            BATCH_ERROR_AUDIO_TOO_LONG,
+            "recording is longer than the batch limit",
+            {"duration_seconds": round(duration, 3), "max_seconds": STT_BATCH_MAX_SECONDS},
+        )
+
+    try:
+        runtime_deps.key_quotas.charge_audio(api_key, duration)
+    except RateLimitError as exc:
+        return _error(429, WS_ERROR_RATE_LIMITED, str(exc), {"reason_code": exc.reason, **exc.details()})
+
+    return await _transcribe(request, runtime_deps, samples)
+
+
+__all__ = [
+    "batch_input_audio_formats",
+    "decode_upload",
+    "handle_batch_transcription",
+    "read_upload",
+    "run_until_disconnect",
+    "upload_byte_limit",
+    "wait_for_disconnect",
+]
@@ -2,15 +2,35 @@
 
 from __future__ import annotations
 
+import time
 import asyncio
 from typing import Any
+from collections import deque
+
+from src.config.limits import PRIORITY_RANKS, PRIORITY_DEFAULT
+
+# Weight of the newest connection in the running mean hold time (wait estimates).
+_HOLD_TIME_EMA_ALPHA: float = 0.1
 
 
 class ConnectionManager:
-    def __init__(self, *, max_connections: int) -> None:
+    """Cap concurrent connections, with an optional FIFO waiting room.
+
+    With ``max_waiting > 0``, sockets refused by ``connect`` can join the waiting room;
+    each slot freed by ``disconnect`` is handed straight to the head of the room, so a
+    queued socket is never overtaken by a new one. The room is ordered by priority
+    class, then FIFO within a class.
+    """
+
+    def __init__(self, *, max_connections: int, max_waiting: int = 0) -> None:
         self._max = max(1, int(max_connections))
+        self._max_waiting = max(0, int(max_waiting))
         self._lock = asyncio.Lock()
-        self._active: set[int] = set()
+        # Admitted socket -> admission time (monotonic).
+        self._active: dict[int, float] = {}
+        # (socket key, ticket, priority rank), highest rank first.
+        self._waiting: deque[tuple[int, asyncio.Future[bool], int]] = deque()
+        self._mean_hold_s: float | None = None
 
     async def connect(self, ws: Any) -> bool:
         """Attempt to admit a websocket connection (without accepting it)."""
@@ -18,16 +38,74 @@ class ConnectionManager:
         async with self._lock:
             if len(self._active) >= self._max:
                 return False
-            self._active.add(key)
+            self._active[key] = time.monotonic()
             return True
 
     async def disconnect(self, ws: Any) -> None:
         key = id(ws)
         async with self._lock:
-            self._active.discard(key)
+            admitted_at = self._active.pop(key, None)
+            if admitted_at is None:
+                return
+            now = time.monotonic()
+            held_s = now - admitted_at
+            self._mean_hold_s = (
+                held_s
+                if self._mean_hold_s is None
+                else self._mean_hold_s + _HOLD_TIME_EMA_ALPHA * (held_s - self._mean_hold_s)
+            )
+            while self._waiting:
+                waiter_key, ticket, _ = self._waiting.popleft()
+                if not ticket.done():
+                    self._active[waiter_key] = now
+                    ticket.set_result(True)
+                    break
+
+    def join_waiting_room(self, ws: Any, *, priority: str = PRIORITY_DEFAULT) -> asyncio.Future[bool] | None:
+        """Queue for a slot; the ticket resolves True once a slot is handed over.
+
+        Returns None when the waiting room is disabled or full.
+        """
+        ticket: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        if len(self._active) < self._max:
+            # A slot freed up since connect() was refused.
+            self._active[id(ws)] = time.monotonic()
+            ticket.set_result(True)
+            return ticket
+        if len(self._waiting) >= self._max_waiting:
+            return None
+        rank = PRIORITY_RANKS.get(priority, PRIORITY_RANKS[PRIORITY_DEFAULT])
+        # Behind every waiter of the same or a higher class, ahead of lower classes.
+        position = next((i for i, entry in enumerate(self._waiting) if entry[2] < rank), len(self._waiting))
+        self._waiting.insert(position, (id(ws), ticket, rank))
+        return ticket
+
+    def leave_waiting_room(self, ticket: asyncio.Future[bool]) -> bool:
+        """Stop waiting; True if the slot had already been handed over (the socket is admitted)."""
+        if ticket.done():
+            return not ticket.cancelled() and ticket.result()
+        ticket.cancel()
+        self._waiting = deque(entry for entry in self._waiting if entry[1] is not ticket)
+        return False
+
+    def waiting_position(self, ticket: asyncio.Future[bool]) -> int:
+        """1-based position of ``ticket`` in the waiting room (0 once it has left)."""
+        for i, (_, queued, _) in enumerate(self._waiting, start=1):
+            if queued is ticket:
+                return i
+        return 0
+
+    def estimate_wait_s(self, position: int) -> float | None:
+        """Rough wait for a queue position from the mean connection hold time (None until known)."""
+        if self._mean_hold_s is None:
+            return None
+        return self._mean_hold_s * max(1, int(position)) / self._max
 
     def get_connection_count(self) -> int:
         return len(self._active)
 
+    def get_waiting_count(self) -> int:
+        return len(self._waiting)
+
 
 __all__ = ["ConnectionManager"]
@@ -0,0 +1,93 @@
+"""Sliding-window rate limiting."""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable
+
+from src.errors import RateLimitError
+
+# Spread of the window over ring buckets; usage expires one bucket width at a time.
+_DEFAULT_BUCKETS: int = 10
+
+
+class SlidingWindowRateLimiter:
+    """Allow at most ``limit`` units (events, audio seconds, ...) per ``window_seconds``.
+
+    Usage is counted in a fixed ring of buckets covering the window, with a running
+    total, so each check costs O(1) (clearing at most ``buckets`` stale buckets)
+    regardless of traffic. A unit expires between ``window_seconds`` and one bucket
+    width short of it after it was consumed.
+    """
+
+    def __init__(
+        self,
+        *,
+        limit: float,
+        window_seconds: float,
+        buckets: int = _DEFAULT_BUCKETS,
+        now_fn: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._limit = limit
+        self._window_s = window_seconds
+        self._buckets = max(1, int(buckets))
+        self._width_s = max(1e-6, float(window_seconds) / self._buckets)
+        self._now_fn = now_fn
+        self._counts: list[float] = [0.0] * self._buckets
+        self._total: float = 0.0
+        # Absolute index of the newest bucket (time // width).
+        self._head: int = self._index(now_fn())
+
+    @property
+    def limit(self) -> float:
+        return self._limit
+
+    @property
+    def window_seconds(self) -> float:
+        return self._window_s
+
+    def used(self) -> float:
+        self._advance()
+        return self._total
+
+    def consume(self, amount: float = 1.0) -> None:
+        """Count ``amount`` units, or raise RateLimitError (counting nothing) if it would exceed the limit."""
+        self._advance()
+        if self._total + amount > self._limit:
+            raise RateLimitError(
+                f"rate limit exceeded: {self._limit:g} per {self._window_s:g}s",
+                limit=self._limit,
+                window_seconds=self._window_s,
+                retry_after_s=self._retry_after_s(),
+            )
+        self._counts[self._head % self._buckets] += amount
+        self._total += amount
+
+    def _index(self, now: float) -> int:
+        return math.floor(now / self._width_s)
+
+    def _advance(self) -> None:
+        index = self._index(self._now_fn())
+        if index <= self._head:
+            return
+        stale = min(index - self._head, self._buckets)
+        for offset in range(1, stale + 1):
+            slot = (self._head + offset) % self._buckets
+            self._total -= self._counts[slot]
+            self._counts[slot] = 0.0
+        self._head = index
+        if stale == self._buckets:
+            # Everything expired (also clears float drift in the running total).
+            self._total = 0.0
+
+    def _retry_after_s(self) -> float:
+        # Until the oldest non-empty bucket leaves the window.
+        for age in range(self._buckets - 1, -1, -1):
+            if self._counts[(self._head - age) % self._buckets] > 0:
+                expires_at = (self._head - age + self._buckets) * self._width_s
+                return max(0.0, expires_at - self._now_fn())
+        return 0.0
+
+
+__all__ = ["SlidingWindowRateLimiter"]
@@ -0,0 +1,94 @@
+"""Per-API-key quotas (connections, connection attempts, audio seconds)."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from collections.abc import Callable
+
+from src.errors import RateLimitError
+from src.state.settings import KeyQuotaSettings
+
+from .limits import SlidingWindowRateLimiter
+
+
+@dataclass(slots=True)
+class KeyUsage:
+    """One API key's live usage against its quotas."""
+
+    quota: KeyQuotaSettings
+    connects: SlidingWindowRateLimiter | None = None
+    audio: SlidingWindowRateLimiter | None = None
+    connections: int = 0
+
+
+class KeyQuotas:
+    """Enforce each API key's quotas, so one tenant cannot take every slot on the node.
+
+    Connection attempts and audio seconds are counted per ``window_s`` by sliding-window
+    limiters; concurrent connections are counted here. Concurrent utterances are counted
+    by ``UtteranceSlots`` against ``max_utterances``. Every check is O(1); unknown keys
+    (never admitted) have no quotas.
+    """
+
+    def __init__(
+        self, key_quotas: dict[str, KeyQuotaSettings], *, now_fn: Callable[[], float] = time.monotonic
+    ) -> None:
+        self._usage: dict[str, KeyUsage] = {}
+        for key, quota in key_quotas.items():
+            usage = KeyUsage(quota=quota)
+            if quota.connects_per_window > 0:
+                usage.connects = SlidingWindowRateLimiter(
+                    limit=quota.connects_per_window, window_seconds=quota.window_s, now_fn=now_fn
+                )
+            if quota.audio_seconds_per_window > 0:
+                usage.audio = SlidingWindowRateLimiter(
+                    limit=quota.audio_seconds_per_window, window_seconds=quota.window_s, now_fn=now_fn
+                )
+            self._usage[key] = usage
+
+    def open_connection(self, key: str) -> None:
+        """Count a connection attempt and hold a connection; raise RateLimitError if over quota."""
+        usage = self._usage.get(key)
+        if usage is None:
+            return
+        if usage.connects is not None:
+            try:
+                usage.connects.consume()
+            except RateLimitError as exc:
+                exc.reason = "key_connect_rate"
+                raise
+        limit = usage.quota.max_connections
+        if limit > 0 and usage.connections >= limit:
+            raise RateLimitError(
+                f"API key already holds {limit} connections", limit=limit, window_seconds=0.0, reason="key_connections"
+            )
+        usage.connections += 1
+
+    def close_connection(self, key: str) -> None:
+        usage = self._usage.get(key)
+        if usage is not None:
+            usage.connections = max(0, usage.connections - 1)
+
+    def connection_count(self, key: str) -> int:
+        usage = self._usage.get(key)
+        return 0 if usage is None else usage.connections
+
+    def max_utterances(self, key: str) -> int:
+        """Concurrent utterance limit of the key (0 = none)."""
+        usage = self._usage.get(key)
+        return 0 if usage is None else usage.quota.max_utterances
+
+    def charge_audio(self, key: str, seconds: float) -> None:
+        """Count streamed audio against the key; raise RateLimitError (dropping the audio) if over quota."""
+        usage = self._usage.get(key)
+        if usage is None or usage.audio is None:
+            return
+        try:
+            usage.audio.consume(seconds)
+        except RateLimitError as exc:
+            exc.reason = "key_audio_seconds"
+            raise
+
+
+__all__ = ["KeyQuotas", "KeyUsage"]
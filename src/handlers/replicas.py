@@ -0,0 +1,24 @@
+"""HTTP handler for the per-replica load report."""
+
+from __future__ import annotations
+
+from fastapi import Request
+from fastapi.responses import ORJSONResponse
+
+from src.state import RuntimeDeps
+from src.config.websocket import WS_ERROR_AUTH_FAILED
+
+from .websocket.auth import get_api_key, resolve_priority
+
+
+def handle_replicas(request: Request, runtime_deps: RuntimeDeps) -> ORJSONResponse:
+    # Routing and engine load are operational detail: same API key as the other endpoints.
+    if resolve_priority(get_api_key(request), runtime_deps.settings.auth.key_priorities) is None:
+        message = "Authentication required. Provide valid API key via 'api_key' query parameter or 'X-API-Key' header."
+        return ORJSONResponse(
+            {"error": {"code": WS_ERROR_AUTH_FAILED, "message": message, "details": {}}}, status_code=401
+        )
+    return ORJSONResponse({"replicas": runtime_deps.replica_router.stats()})
+
+
+__all__ = ["handle_replicas"]
@@ -13,15 +13,18 @@ def get_api_key(ws: Any) -> str:
     return (ws.headers.get("x-api-key") or "").strip()
 
 
-def validate_api_key(api_key: str, expected: str) -> bool:
-    if not expected:
-        # Misconfiguration: server has no key set. Treat as locked down.
-        return False
-    return api_key == expected
+def resolve_priority(api_key: str, key_priorities: dict[str, str]) -> str | None:
+    """Priority class of an accepted API key, or None if the key is not accepted."""
+    if not api_key:
+        return None
+    return key_priorities.get(api_key)
 
 
-async def authenticate_websocket(ws: Any, *, expected_api_key: str) -> bool:
-    return validate_api_key(get_api_key(ws), expected_api_key)
+async def authenticate_websocket(ws: Any, *, key_priorities: dict[str, str]) -> tuple[str, str] | None:
+    """(API key, priority class) of the socket's accepted key, or None."""
+    api_key = get_api_key(ws)
+    priority = resolve_priority(api_key, key_priorities)
+    return None if priority is None else (api_key, priority)
 
 
-__all__ = ["authenticate_websocket", "get_api_key", "validate_api_key"]
+__all__ = ["authenticate_websocket", "get_api_key", "resolve_priority"]
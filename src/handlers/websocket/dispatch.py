@@ -7,10 +7,16 @@ from collections.abc import Callable, Awaitable
 
 from fastapi import WebSocket
 
+from src.errors import RateLimitError
 from src.runtime.dependencies import RuntimeDeps
 from src.realtime import EnvelopeState, RealtimeConnectionAdapter
-from src.config.websocket import WS_ERROR_INVALID_PAYLOAD
+from src.config.websocket import (
+    WS_ERROR_RATE_LIMITED,
+    WS_ERROR_INVALID_PAYLOAD,
+    WS_ERROR_SERVER_AT_CAPACITY,
+)
 
+from .session import session_update_error
 from .errors import send_error, safe_send_envelope
 
 HandlerFn = Callable[
@@ -67,28 +73,80 @@ async def _handle_session_update(
     payload: dict[str, Any],
 ) -> RealtimeConnectionAdapter | None:
     allowed_model_name = runtime_deps.settings.model.served_model_name
-    desired = (
-        (payload.get("model") or allowed_model_name).strip()
-        if isinstance(payload.get("model"), str)
-        else allowed_model_name
-    )
-    if desired != allowed_model_name:
+    payload_error = session_update_error(payload, allowed_model_name=allowed_model_name)
+    if payload_error is not None:
+        message, reason_code, details = payload_error
         await send_error(
             ws,
             session_id=session_id,
             request_id=request_id,
             error_code=WS_ERROR_INVALID_PAYLOAD,
-            message="unsupported model",
-            reason_code="unsupported_model",
-            details={"allowed_model": allowed_model_name, "requested": desired},
+            message=message,
+            reason_code=reason_code,
+            details=details,
         )
         return conn
 
     conn = await _ensure_connection(conn, runtime_deps=runtime_deps, ws=ws, state=state, initialize=False)
+    if payload.get("input_audio_format") is not None:
+        conn.set_input_audio_format(payload["input_audio_format"])
+    if payload.get("input_sample_rate") is not None:
+        conn.set_input_sample_rate(payload["input_sample_rate"])
+    if payload.get("partial_interval_ms") is not None:
+        state.partial_interval_ms = payload["partial_interval_ms"]
     await conn.handle_event("session.update", {"model": allowed_model_name})
     return conn
 
 
+def _acquire_utterance_slot(runtime_deps: RuntimeDeps, conn: RealtimeConnectionAdapter, state: EnvelopeState) -> bool:
+    """Take an utterance slot; False if none is free, RateLimitError if the key is at its quota."""
+    slots = runtime_deps.utterance_slots
+    key_limit = runtime_deps.key_quotas.max_utterances(state.api_key)
+    if key_limit > 0 and not slots.holds(conn) and slots.key_count(state.api_key) >= key_limit:
+        raise RateLimitError(
+            f"API key already holds {key_limit} active utterances",
+            limit=key_limit,
+            window_seconds=0.0,
+            reason="key_utterances",
+        )
+    if slots.try_acquire(conn, priority=state.priority, api_key=state.api_key):
+        return True
+    # Full: a lower-priority utterance elsewhere hands its slot over right here; its own message
+    # loop tears it down and tells its client, so this commit never waits on another socket.
+    victim = slots.preempt(conn, priority=state.priority, api_key=state.api_key)
+    if victim is None:
+        return False
+    victim.request_preemption()
+    return True
+
+
+async def _send_slots_full(ws: WebSocket, runtime_deps: RuntimeDeps, *, session_id: str, request_id: str) -> None:
+    # The connection stays open; the client retries the commit once an utterance elsewhere ends.
+    slots = runtime_deps.utterance_slots
+    await send_error(
+        ws,
+        session_id=session_id,
+        request_id=request_id,
+        error_code=WS_ERROR_SERVER_AT_CAPACITY,
+        message="all utterance slots are busy; retry the commit shortly",
+        reason_code="utterance_slots_full",
+        details={"active": slots.get_active_count(), "capacity": slots.capacity, "limit": slots.limit},
+    )
+
+
+async def _send_rate_limited(ws: WebSocket, exc: RateLimitError, *, session_id: str, request_id: str) -> None:
+    # The connection stays open; the client retries once usage drops below the quota.
+    await send_error(
+        ws,
+        session_id=session_id,
+        request_id=request_id,
+        error_code=WS_ERROR_RATE_LIMITED,
+        message=str(exc),
+        reason_code=exc.reason,
+        details=exc.details(),
+    )
+
+
 async def _handle_commit(
     ws: WebSocket,
     runtime_deps: RuntimeDeps,
@@ -109,6 +167,14 @@ async def _handle_commit(
         if state.active_request_id and state.active_request_id != request_id:
             await conn.cancel()
             state.inflight_request_id = None
+        try:
+            acquired = _acquire_utterance_slot(runtime_deps, conn, state)
+        except RateLimitError as exc:
+            await _send_rate_limited(ws, exc, session_id=session_id, request_id=request_id)
+            return conn
+        if not acquired:
+            await _send_slots_full(ws, runtime_deps, session_id=session_id, request_id=request_id)
+            return conn
         state.active_request_id = request_id
     else:
         if state.active_request_id is None:
@@ -154,14 +220,16 @@ async def _handle_append(
     request_id: str,
     payload: dict[str, Any],
 ) -> RealtimeConnectionAdapter | None:
+    # "audio_bytes" is only ever set by the receive loop for binary frames (JSON cannot carry bytes).
+    audio_bytes = payload.get("audio_bytes")
     audio = payload.get("audio")
-    if not isinstance(audio, str) or not audio.strip():
+    if not isinstance(audio_bytes, bytes) and (not isinstance(audio, str) or not audio.strip()):
         await send_error(
             ws,
             session_id=session_id,
             request_id=request_id,
             error_code=WS_ERROR_INVALID_PAYLOAD,
-            message="payload.audio (base64 pcm16) is required",
+            message="payload.audio (base64 audio in the session's input_audio_format) is required",
             reason_code="missing_audio",
         )
         return conn
@@ -178,7 +246,11 @@ async def _handle_append(
         return conn
 
     conn = await _ensure_connection(conn, runtime_deps=runtime_deps, ws=ws, state=state, initialize=True)
-    await conn.handle_event("input_audio_buffer.append", {"audio": audio})
+    event: dict[str, Any] = {"audio_bytes": audio_bytes} if isinstance(audio_bytes, bytes) else {"audio": audio}
+    try:
+        await conn.handle_event("input_audio_buffer.append", event)
+    except RateLimitError as exc:
+        await _send_rate_limited(ws, exc, session_id=session_id, request_id=request_id)
     return conn
 
 
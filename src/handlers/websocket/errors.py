@@ -95,6 +95,8 @@ async def reject_connection(
     error_code: str,
     message: str,
     close_code: int,
+    reason_code: str | None = None,
+    details: dict[str, Any] | None = None,
 ) -> None:
     # Accept so we can send a structured error, then close.
     try:
@@ -108,7 +110,8 @@ async def reject_connection(
         request_id=WS_UNKNOWN_REQUEST_ID,
         error_code=error_code,
         message=message,
-        reason_code=error_code,
+        reason_code=reason_code or error_code,
+        details=details,
     )
     try:
         await ws.close(code=close_code, reason=message)
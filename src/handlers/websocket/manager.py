@@ -2,30 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import functools
 import contextlib
 
 from fastapi import WebSocket
 
 from src.state import EnvelopeState
+from src.errors import RateLimitError
 from src.runtime.dependencies import RuntimeDeps
+from src.handlers.connections import ConnectionManager
 from src.config.websocket import (
     WS_CLOSE_BUSY_CODE,
     WS_ERROR_AUTH_FAILED,
+    WS_ERROR_RATE_LIMITED,
+    WS_UNKNOWN_REQUEST_ID,
+    WS_UNKNOWN_SESSION_ID,
+    WS_WAITING_ROOM_STATUS_S,
     WS_CLOSE_UNAUTHORIZED_CODE,
+    WS_WAITING_ROOM_MAX_WAIT_S,
     WS_ERROR_SERVER_AT_CAPACITY,
 )
 
-from .errors import reject_connection
 from .auth import authenticate_websocket
 from .lifecycle import WebSocketLifecycle
 from .message_loop import run_message_loop
+from .errors import send_error, reject_connection, safe_send_envelope
 
 logger = logging.getLogger(__name__)
 
 
-async def _prepare_connection(ws: WebSocket, runtime_deps: RuntimeDeps) -> bool:
-    if not await authenticate_websocket(ws, expected_api_key=runtime_deps.settings.auth.api_key):
+async def _prepare_connection(ws: WebSocket, runtime_deps: RuntimeDeps) -> tuple[str, str] | None:
+    """Authenticate and admit the socket; return (API key, priority class), or None if it was turned away."""
+    identity = await authenticate_websocket(ws, key_priorities=runtime_deps.settings.auth.key_priorities)
+    if identity is None:
         await reject_connection(
             ws,
             error_code=WS_ERROR_AUTH_FAILED,
@@ -34,16 +45,44 @@ async def _prepare_connection(ws: WebSocket, runtime_deps: RuntimeDeps) -> bool:
             ),
             close_code=WS_CLOSE_UNAUTHORIZED_CODE,
         )
-        return False
+        return None
+    api_key, priority = identity
 
-    if not await runtime_deps.connections.connect(ws):
+    # Per-key quotas first, so one tenant cannot crowd the node or its waiting room.
+    try:
+        runtime_deps.key_quotas.open_connection(api_key)
+    except RateLimitError as exc:
         await reject_connection(
             ws,
-            error_code=WS_ERROR_SERVER_AT_CAPACITY,
-            message="Server cannot accept new connections. Please try again later.",
+            error_code=WS_ERROR_RATE_LIMITED,
+            message=str(exc),
             close_code=WS_CLOSE_BUSY_CODE,
+            reason_code=exc.reason,
+            details=exc.details(),
         )
-        return False
+        return None
+    admitted = False
+    try:
+        admitted = await _admit(ws, runtime_deps, priority)
+    finally:
+        if not admitted:
+            runtime_deps.key_quotas.close_connection(api_key)
+    return identity if admitted else None
+
+
+async def _admit(ws: WebSocket, runtime_deps: RuntimeDeps, priority: str) -> bool:
+    """Take a connection slot (or wait for one) and accept the socket; False if it was turned away."""
+    if not await runtime_deps.connections.connect(ws):
+        ticket = runtime_deps.connections.join_waiting_room(ws, priority=priority)
+        if ticket is None:
+            await reject_connection(
+                ws,
+                error_code=WS_ERROR_SERVER_AT_CAPACITY,
+                message="Server cannot accept new connections. Please try again later.",
+                close_code=WS_CLOSE_BUSY_CODE,
+            )
+            return False
+        return await _wait_in_room(ws, runtime_deps.connections, ticket)
 
     try:
         await ws.accept()
@@ -54,17 +93,79 @@ async def _prepare_connection(ws: WebSocket, runtime_deps: RuntimeDeps) -> bool:
     return True
 
 
+async def _wait_for_ticket(ws: WebSocket, connections: ConnectionManager, ticket: asyncio.Future[bool]) -> float:
+    """Send queue-position updates until the ticket resolves, the wait times out or the socket fails."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + WS_WAITING_ROOM_MAX_WAIT_S
+    started = loop.time()
+    while not ticket.done() and loop.time() < deadline:
+        position = connections.waiting_position(ticket)
+        payload = {"state": "waiting", "queue_position": position, "estimated_wait_s": None}
+        estimate = connections.estimate_wait_s(position)
+        if estimate is not None:
+            payload["estimated_wait_s"] = round(estimate, 1)
+        sent = await safe_send_envelope(
+            ws, msg_type="status", session_id=WS_UNKNOWN_SESSION_ID, request_id=WS_UNKNOWN_REQUEST_ID, payload=payload
+        )
+        if not sent:
+            break
+        await asyncio.wait([ticket], timeout=min(WS_WAITING_ROOM_STATUS_S, max(0.0, deadline - loop.time())))
+    return round(loop.time() - started, 1)
+
+
+async def _wait_in_room(ws: WebSocket, connections: ConnectionManager, ticket: asyncio.Future[bool]) -> bool:
+    """Hold an accepted socket in the waiting room until it is handed a slot or times out."""
+    admitted = False
+    try:
+        await ws.accept()
+        waited_s = await _wait_for_ticket(ws, connections, ticket)
+        if connections.leave_waiting_room(ticket):
+            payload = {"state": "admitted", "waited_s": waited_s}
+            await safe_send_envelope(
+                ws,
+                msg_type="status",
+                session_id=WS_UNKNOWN_SESSION_ID,
+                request_id=WS_UNKNOWN_REQUEST_ID,
+                payload=payload,
+            )
+            admitted = True
+            return True
+    finally:
+        # Cancelled or failed while queued: never leave the ticket behind (a slot handed to it
+        # later would belong to no one), and give back a slot it was already handed.
+        if not admitted and connections.leave_waiting_room(ticket):
+            await connections.disconnect(ws)
+
+    message = "Server is still at capacity after waiting. Please try again later."
+    await send_error(
+        ws,
+        session_id=WS_UNKNOWN_SESSION_ID,
+        request_id=WS_UNKNOWN_REQUEST_ID,
+        error_code=WS_ERROR_SERVER_AT_CAPACITY,
+        message=message,
+        reason_code="waiting_room_timeout",
+        details={"waited_s": waited_s},
+    )
+    with contextlib.suppress(Exception):
+        await ws.close(code=WS_CLOSE_BUSY_CODE, reason=message)
+    return False
+
+
 async def handle_websocket_connection(ws: WebSocket, runtime_deps: RuntimeDeps) -> None:
     lifecycle: WebSocketLifecycle | None = None
     admitted = False
     session_id: str | None = None
     state: EnvelopeState | None = None
+    api_key = ""
     try:
-        if not await _prepare_connection(ws, runtime_deps):
+        identity = await _prepare_connection(ws, runtime_deps)
+        if identity is None:
             return
+        api_key, priority = identity
         admitted = True
 
-        state = EnvelopeState()
+        state = EnvelopeState(priority=priority, api_key=api_key)
+        state.charge_audio = functools.partial(runtime_deps.key_quotas.charge_audio, api_key)
 
         lifecycle = WebSocketLifecycle(
             ws,
@@ -86,6 +187,7 @@ async def handle_websocket_connection(ws: WebSocket, runtime_deps: RuntimeDeps)
         if admitted:
             with contextlib.suppress(Exception):
                 await runtime_deps.connections.disconnect(ws)
+            runtime_deps.key_quotas.close_connection(api_key)
             logger.info(
                 "WebSocket connection closed session_id=%s. Active: %s",
                 session_id,
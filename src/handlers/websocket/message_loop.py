@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import functools
 import contextlib
 from typing import Any, Literal
 
@@ -12,35 +13,50 @@ from fastapi import WebSocket, WebSocketDisconnect
 from src.runtime.dependencies import RuntimeDeps
 from src.realtime import EnvelopeState, RealtimeConnectionAdapter
 from src.config.websocket import (
+    WS_KEY_TYPE,
+    WS_KEY_PAYLOAD,
     WS_ERROR_INTERNAL,
+    WS_KEY_REQUEST_ID,
+    WS_KEY_SESSION_ID,
     WS_CLOSE_BUSY_CODE,
     WS_ERROR_INVALID_MESSAGE,
+    WS_ERROR_INVALID_PAYLOAD,
     WS_CLOSE_CLIENT_REQUEST_CODE,
 )
 
 from .dispatch import HANDLERS
-from .parser import parse_client_message
 from .lifecycle import WebSocketLifecycle
+from .session import track_binary_binding
 from .errors import send_error, safe_send_envelope
+from .parser import parse_client_message, parse_binary_audio_frame
 
 logger = logging.getLogger(__name__)
 
+# Queued by EnvelopeState.wake; carries no client message.
+_WAKE_MESSAGE: dict[str, Any] = {"type": "wake"}
 
-async def _recv_text_with_watchdog(
+
+async def _recv_frame_with_watchdog(
     ws: WebSocket,
     lifecycle: WebSocketLifecycle,
     *,
     watchdog_tick_s: float,
-) -> tuple[str | None, bool]:
+) -> tuple[str | bytes | None, bool]:
     try:
         message = await asyncio.wait_for(
-            ws.receive_text(),
+            ws.receive(),
             timeout=max(1.0, float(watchdog_tick_s) * 2.0),
         )
-        return message, False
     except TimeoutError:
         return None, lifecycle.should_close()
 
+    if message.get("type") == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    text = message.get("text")
+    if text is not None:
+        return text, False
+    return message.get("bytes") or b"", False
+
 
 async def _handle_control_message(
     ws: WebSocket,
@@ -77,6 +93,57 @@ async def _parse_or_send_error(ws: WebSocket, raw: str, state: EnvelopeState) ->
         return None
 
 
+async def _binary_append_or_error(ws: WebSocket, raw: bytes, state: EnvelopeState) -> dict[str, Any] | None:
+    """Turn a binary audio frame into an append message bound to the active utterance."""
+    request_id = state.binary_request_id
+    if request_id is None:
+        await send_error(
+            ws,
+            session_id=state.session_id,
+            request_id=state.request_id,
+            error_code=WS_ERROR_INVALID_PAYLOAD,
+            message="no active request; send input_audio_buffer.commit final=false before binary audio",
+            reason_code="no_active_request",
+        )
+        return None
+    try:
+        audio_bytes = parse_binary_audio_frame(raw, audio_format=state.input_audio_format)
+    except ValueError as exc:
+        await send_error(
+            ws,
+            session_id=state.session_id,
+            request_id=request_id,
+            error_code=WS_ERROR_INVALID_PAYLOAD,
+            message=str(exc),
+            reason_code="invalid_audio_frame",
+        )
+        return None
+    return {
+        WS_KEY_TYPE: "input_audio_buffer.append",
+        WS_KEY_SESSION_ID: state.session_id,
+        WS_KEY_REQUEST_ID: request_id,
+        WS_KEY_PAYLOAD: {"audio_bytes": audio_bytes},
+    }
+
+
+def _wake_processor(inbound_q: asyncio.Queue[dict[str, Any]]) -> None:
+    # A full queue is read again soon anyway, and the processor checks for work before each message.
+    with contextlib.suppress(asyncio.QueueFull):
+        inbound_q.put_nowait(_WAKE_MESSAGE)
+
+
+async def _finish_preemption(conn: RealtimeConnectionAdapter, state: EnvelopeState) -> None:
+    preempted_request_id = state.active_request_id
+    if not await conn.finish_preemption():
+        return
+    # The client must start a new utterance: a final commit or binary frames for the preempted one
+    # are rejected (binary frames after a newer commit, already received, keep their binding).
+    state.active_request_id = None
+    state.inflight_request_id = None
+    if state.binary_request_id == preempted_request_id:
+        state.binary_request_id = None
+
+
 async def _inbound_processor_loop(
     ws: WebSocket,
     runtime_deps: RuntimeDeps,
@@ -86,6 +153,11 @@ async def _inbound_processor_loop(
 ) -> None:
     while True:
         msg = await inbound_q.get()
+        conn = conn_box["conn"]
+        if conn is not None and conn.preempted:
+            await _finish_preemption(conn, state)
+        if msg is _WAKE_MESSAGE:
+            continue
         msg_type = msg["type"]
         session_id = msg["session_id"]
         request_id = msg["request_id"]
@@ -126,7 +198,7 @@ async def _receive_and_enqueue(
     inbound_q: asyncio.Queue[dict[str, Any]],
 ) -> str | None:
     while True:
-        raw, should_exit = await _recv_text_with_watchdog(
+        raw, should_exit = await _recv_frame_with_watchdog(
             ws,
             lifecycle,
             watchdog_tick_s=runtime_deps.settings.websocket.watchdog_tick_s,
@@ -138,22 +210,31 @@ async def _receive_and_enqueue(
 
         lifecycle.touch()
 
-        msg = await _parse_or_send_error(ws, raw, state)
-        if msg is None:
-            continue
+        if isinstance(raw, bytes):
+            # Binary frames skip JSON parsing and control handling entirely.
+            msg = await _binary_append_or_error(ws, raw, state)
+            if msg is None:
+                continue
+            session_id = msg["session_id"]
+            request_id = msg["request_id"]
+        else:
+            msg = await _parse_or_send_error(ws, raw, state)
+            if msg is None:
+                continue
 
-        msg_type = msg["type"]
-        session_id = msg["session_id"]
-        request_id = msg["request_id"]
+            msg_type = msg["type"]
+            session_id = msg["session_id"]
+            request_id = msg["request_id"]
 
-        state.session_id = session_id
-        state.request_id = request_id
+            state.session_id = session_id
+            state.request_id = request_id
 
-        control = await _handle_control_message(ws, msg_type, session_id=session_id, request_id=request_id)
-        if control == "close":
-            return session_id
-        if control == "continue":
-            continue
+            control = await _handle_control_message(ws, msg_type, session_id=session_id, request_id=request_id)
+            if control == "close":
+                return session_id
+            if control == "continue":
+                continue
+            track_binary_binding(msg, state, allowed_model_name=runtime_deps.settings.model.served_model_name)
 
         try:
             inbound_q.put_nowait(msg)
@@ -183,6 +264,7 @@ async def run_message_loop(
         maxsize=max(1, int(runtime_deps.settings.websocket.inbound_queue_max))
     )
     conn_box: dict[str, RealtimeConnectionAdapter | None] = {"conn": None}
+    state.wake = functools.partial(_wake_processor, inbound_q)
 
     processor_task: asyncio.Task | None = None
     try:
@@ -48,4 +48,13 @@ def parse_client_message(raw: str) -> dict[str, Any]:
     return msg
 
 
-__all__ = ["parse_client_message"]
+def parse_binary_audio_frame(raw: bytes, *, audio_format: str = "pcm16") -> bytes:
+    """Validate a binary audio frame (raw PCM16 little-endian samples, or one codec packet)."""
+    if not raw:
+        raise ValueError("binary audio frame is empty")
+    if audio_format == "pcm16" and len(raw) % 2 != 0:
+        raise ValueError("binary audio frame must contain whole PCM16 samples (even byte length)")
+    return raw
+
+
+__all__ = ["parse_binary_audio_frame", "parse_client_message"]
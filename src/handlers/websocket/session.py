@@ -0,0 +1,77 @@
+"""session.update validation, shared by dispatch and the receive loop's binary-frame tracking."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from src.state import EnvelopeState
+from src.config.websocket import WS_PARTIAL_INTERVAL_MAX_MS
+from src.audio.ingress import SUPPORTED_INPUT_SAMPLE_RATES, available_input_audio_formats
+
+
+def _session_payload_error(payload: dict[str, Any]) -> tuple[str, str, dict[str, Any]] | None:
+    audio_format = payload.get("input_audio_format")
+    if audio_format is not None and audio_format not in available_input_audio_formats():
+        return (
+            "unsupported input_audio_format",
+            "unsupported_audio_format",
+            {"supported": list(available_input_audio_formats()), "requested": audio_format},
+        )
+    sample_rate = payload.get("input_sample_rate")
+    if sample_rate is not None and (
+        isinstance(sample_rate, bool)
+        or not isinstance(sample_rate, int)
+        or sample_rate not in SUPPORTED_INPUT_SAMPLE_RATES
+    ):
+        return (
+            "unsupported input_sample_rate",
+            "unsupported_sample_rate",
+            {"supported": list(SUPPORTED_INPUT_SAMPLE_RATES), "requested": sample_rate},
+        )
+    interval = payload.get("partial_interval_ms")
+    if interval is not None and (
+        isinstance(interval, bool) or not isinstance(interval, int) or not 0 <= interval <= WS_PARTIAL_INTERVAL_MAX_MS
+    ):
+        return (
+            "unsupported partial_interval_ms",
+            "unsupported_partial_interval",
+            {"min": 0, "max": WS_PARTIAL_INTERVAL_MAX_MS, "requested": interval},
+        )
+    return None
+
+
+def session_update_error(payload: dict[str, Any], *, allowed_model_name: str) -> tuple[str, str, dict[str, Any]] | None:
+    """(message, reason code, details) a session.update payload is rejected with, or None if accepted."""
+    model = payload.get("model")
+    desired = (model or allowed_model_name).strip() if isinstance(model, str) else allowed_model_name
+    if desired != allowed_model_name:
+        return (
+            "unsupported model",
+            "unsupported_model",
+            {"allowed_model": allowed_model_name, "requested": desired},
+        )
+    return _session_payload_error(payload)
+
+
+def track_binary_binding(msg: dict[str, Any], state: EnvelopeState, *, allowed_model_name: str) -> None:
+    """Apply a queued message's effect on binary frames before dispatch gets to it.
+
+    Binary frames are bound and validated on the receive side, so a frame right after a
+    commit or session.update must already see it. A session.update only switches the
+    frame format if dispatch will accept it.
+    """
+    msg_type = msg["type"]
+    payload = msg["payload"] or {}
+    if msg_type == "input_audio_buffer.commit":
+        state.binary_request_id = None if bool(payload.get("final", False)) else msg["request_id"]
+    elif msg_type == "cancel":
+        state.binary_request_id = None
+    elif (
+        msg_type == "session.update"
+        and payload.get("input_audio_format") is not None
+        and session_update_error(payload, allowed_model_name=allowed_model_name) is None
+    ):
+        state.input_audio_format = payload["input_audio_format"]
+
+
+__all__ = ["session_update_error", "track_binary_binding"]
@@ -4,107 +4,42 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import functools
 import contextlib
 from typing import Any
-from collections import deque
 
+import numpy as np
 from fastapi import WebSocket
-from vllm.entrypoints.openai.realtime.connection import RealtimeConnection
 
 from src.state import EnvelopeState
-from src.config.limits import ASR_SAMPLE_RATE_HZ
-from src.config.vllm import VLLM_MAX_MODEL_LEN
-from src.config.streaming import (
-    STT_INTERNAL_ROLL,
-    STT_MAX_BACKLOG_SECONDS,
-    STT_SEGMENT_OVERLAP_SECONDS,
-    STT_SEGMENT_SECONDS,
+from src.audio.ring import PcmRingBuffer
+from src.audio.ingress import AudioIngress
+from src.audio.pool import AudioWorkerPool
+from src.admission.load import LoadController
+from src.audio.gate import build_silence_gate
+from src.audio.roll import build_roll_planner
+from src.admission.replicas import ReplicaRouter
+from src.config.vllm import VLLM_MAX_AUDIO_TOKENS
+from src.admission.utterances import UtteranceSlots
+from src.audio.tracked_queue import TrackedAudioQueue
+from src.audio.scheduler import FeedFlow, FeedScheduler
+from src.audio.pcm import decode_b64_audio, pcm16_to_float32
+from src.audio.compact import write_compacting, build_backlog_policy
+from src.config.streaming import STT_INTERNAL_ROLL, STT_SEGMENT_OVERLAP_SECONDS
+from src.config.limits import (
+    ASR_FRAME_SAMPLES,
+    ASR_FRAME_SECONDS,
+    ASR_SAMPLE_RATE_HZ,
+    PRIORITY_FEED_WEIGHTS,
+    PRIORITY_BACKLOG_SCALES,
 )
 
 from .envelope import EnvelopeWebSocket
+from .connection import EnvelopeRealtimeConnection
 
 logger = logging.getLogger(__name__)
 
-_ASR_BYTES_PER_SECOND: int = int(ASR_SAMPLE_RATE_HZ * 2)
-_AUDIO_TOKEN_SECONDS: float = 0.08  # Voxtral realtime (~80ms/token)
-_AUDIO_BYTES_PER_TOKEN: int = int(_ASR_BYTES_PER_SECOND * _AUDIO_TOKEN_SECONDS)  # ~2560 for 16kHz PCM16
-_AUDIO_TOKEN_HEADROOM: int = 128  # leave room for text/system tokens
-
-
-def _estimate_b64_decoded_bytes(s: str) -> int:
-    """Estimate decoded byte length of a base64 string without decoding it."""
-    s = (s or "").strip()
-    if not s:
-        return 0
-
-    padding = 0
-    if s.endswith("=="):
-        padding = 2
-    elif s.endswith("="):
-        padding = 1
-
-    # base64 expands 3 bytes -> 4 chars
-    return max(0, (len(s) * 3) // 4 - padding)
-
-
-class _TrackedAudioQueue(asyncio.Queue):
-    """Track total audio samples currently buffered in vLLM's audio_queue."""
-
-    def __init__(self) -> None:
-        super().__init__()
-        self.total_samples: int = 0
-
-    @staticmethod
-    def _count_samples(item: object) -> int:
-        if item is None:
-            return 0
-        try:
-            return int(len(item))  # np.ndarray -> num samples
-        except Exception:
-            return 0
-
-    def put_nowait(self, item) -> None:  # type: ignore[override]
-        self.total_samples += self._count_samples(item)
-        super().put_nowait(item)
-
-    async def put(self, item) -> None:  # type: ignore[override]
-        self.total_samples += self._count_samples(item)
-        await super().put(item)
-
-    def get_nowait(self):  # type: ignore[override]
-        item = super().get_nowait()
-        self.total_samples -= self._count_samples(item)
-        self.total_samples = max(0, int(self.total_samples))
-        return item
-
-    async def get(self):  # type: ignore[override]
-        item = await super().get()
-        self.total_samples -= self._count_samples(item)
-        self.total_samples = max(0, int(self.total_samples))
-        return item
-
-    def backlog_seconds(self) -> float:
-        return float(self.total_samples) / float(ASR_SAMPLE_RATE_HZ)
-
-    def drop_oldest_to_max_backlog(self, *, max_backlog_seconds: float) -> float:
-        if max_backlog_seconds <= 0:
-            return 0.0
-
-        dropped_samples = 0
-        while not self.empty() and self.backlog_seconds() > float(max_backlog_seconds):
-            try:
-                item = super().get_nowait()
-            except Exception:
-                break
-            if item is None:
-                # Preserve sentinel used to end the stream.
-                super().put_nowait(None)
-                break
-            dropped_samples += self._count_samples(item)
-            self.total_samples -= self._count_samples(item)
-            self.total_samples = max(0, int(self.total_samples))
-
-        return float(dropped_samples) / float(ASR_SAMPLE_RATE_HZ)
+_BACKLOG_KEEP_SILENCE_FRAMES: int = 2  # compacted pauses keep 160ms so words stay apart
 
 
 class RealtimeConnectionAdapter:
@@ -115,53 +50,71 @@ class RealtimeConnectionAdapter:
         state: EnvelopeState,
         serving_realtime: Any,
         allowed_model_name: str,
+        audio_pool: AudioWorkerPool,
+        utterance_slots: UtteranceSlots,
+        feed_scheduler: FeedScheduler,
+        load_controller: LoadController,
+        replica_router: ReplicaRouter | None = None,
     ) -> None:
         self._state = state
+        self._load_controller = load_controller
+        self._utterance_slots = utterance_slots
         self._allowed_model_name = allowed_model_name
-
-        self._conn: RealtimeConnection | None = None
-        self._send_ws: EnvelopeWebSocket | None = None
-
-        # Inbound audio buffering/rolling state (per external request_id).
-        self._audio_pending: deque[tuple[str, int]] = deque()  # (audio_b64, decoded_bytes_est)
-        self._audio_pending_bytes: int = 0
-
-        self._overlap_chunks: deque[tuple[str, int]] = deque()
-        self._overlap_bytes: int = 0
-
-        self._segment_bytes_sent: int = 0
-
-        segment_target = int(max(1.0, float(STT_SEGMENT_SECONDS)) * _ASR_BYTES_PER_SECOND)
-        # Even with rolling enabled, vLLM enforces max_model_len. Bound segment size so we
-        # never hit the limit due to audio tokens.
-        max_audio_tokens = max(1, int(VLLM_MAX_MODEL_LEN) - _AUDIO_TOKEN_HEADROOM)
-        safe_max_audio_bytes = max_audio_tokens * _AUDIO_BYTES_PER_TOKEN
-        self._segment_target_bytes = min(segment_target, safe_max_audio_bytes)
-        self._overlap_target_bytes: int = int(max(0.0, float(STT_SEGMENT_OVERLAP_SECONDS)) * _ASR_BYTES_PER_SECOND)
-        self._max_backlog_bytes: int = int(max(0.0, float(STT_MAX_BACKLOG_SECONDS)) * _ASR_BYTES_PER_SECOND)
-
+        self._ingress = AudioIngress(pool=audio_pool)
+
+        # Segments roll at the first pause after STT_SEGMENT_SECONDS (soft), and no later
+        # than vLLM's max_model_len allows for audio tokens (hard). Cuts are on whole model
+        # steps so every append stays frame-aligned.
+        self._roll_planner = build_roll_planner(
+            frame_samples=ASR_FRAME_SAMPLES, hard_samples=VLLM_MAX_AUDIO_TOKENS * ASR_FRAME_SAMPLES
+        )
+        self._segment_samples_sent: int = 0
+
+        # Inbound audio buffering/rolling state (per external request_id), held as PCM16
+        # samples in preallocated rings: the pending backlog is capped at
+        # STT_MAX_BACKLOG_SECONDS, scaled by priority class (oldest samples overwritten), and
+        # the overlap ring keeps the last STT_SEGMENT_OVERLAP_SECONDS for replay. A disabled
+        # backlog cap (0) lets the pending ring grow instead of dropping.
+        self._backlog_policy = build_backlog_policy(
+            frame_samples=ASR_FRAME_SAMPLES,
+            keep_frames=_BACKLOG_KEEP_SILENCE_FRAMES,
+            scale=PRIORITY_BACKLOG_SCALES.get(state.priority, 1.0),
+        )
+        max_backlog_samples = int(self._backlog_policy.max_backlog_seconds * ASR_SAMPLE_RATE_HZ)
+        overlap_samples = int(max(0.0, float(STT_SEGMENT_OVERLAP_SECONDS)) * ASR_SAMPLE_RATE_HZ)
+        pending_size = max(max_backlog_samples, ASR_FRAME_SAMPLES) if max_backlog_samples > 0 else ASR_SAMPLE_RATE_HZ
+        self._audio_pending = PcmRingBuffer(pending_size, growable=max_backlog_samples <= 0)
+        self._overlap = PcmRingBuffer(overlap_samples) if overlap_samples > 0 else None
+
+        # Optional VAD stage between the pending ring and vLLM (silence never costs tokens).
+        self._vad_gate = build_silence_gate(frame_samples=ASR_FRAME_SAMPLES)
+        self._vad_session_skipped_samples: int = 0
+
+        # Audio moves from the pending ring into vLLM only on grants from the shared scheduler.
+        self._feed_scheduler = feed_scheduler
+        self._feed_flow = FeedFlow(weight=PRIORITY_FEED_WEIGHTS.get(state.priority, 1.0))
         self._feed_event = asyncio.Event()
         self._feed_task: asyncio.Task | None = None
 
         self._utterance_active: bool = False
+        # Set from another connection's task when its utterance took this one's slot.
+        self._preempted: bool = False
         self._finalize_requested: bool = False
         self._closing_segment: bool = False
 
         def _mark_disconnected() -> None:
-            if self._conn is not None:
-                try:
-                    self._conn._is_connected = False
-                except Exception:
-                    return
+            self._conn._is_connected = False
 
         # vLLM expects a starlette-style WebSocket for sending; we wrap sends into envelopes.
-        send_ws = EnvelopeWebSocket(ws, state, on_disconnect=_mark_disconnected)
-        self._send_ws = send_ws
-
-        self._conn = RealtimeConnection(send_ws, serving_realtime)
+        # The utterance slot taken at commit (see UtteranceSlots) is released on done/error/cancel.
+        release_slot = functools.partial(utterance_slots.release, self)
+        self._send_ws = EnvelopeWebSocket(ws, state, on_disconnect=_mark_disconnected, on_utterance_end=release_slot)
+        self._conn = EnvelopeRealtimeConnection(self._send_ws, serving_realtime, router=replica_router)
         # Swap in a tracked queue so we can implement "stay live" under overload
-        # by dropping oldest unprocessed audio (Kyutai-like behavior).
-        self._conn.audio_queue = _TrackedAudioQueue()
+        # by dropping oldest unprocessed audio (Kyutai-like behavior). We also feed
+        # decoded samples into it directly, bypassing vLLM's base64 append path.
+        self._audio_queue = TrackedAudioQueue(on_change=functools.partial(feed_scheduler.account, self._feed_flow))
+        self._conn.audio_queue = self._audio_queue
         # We run our own receive loop, so we mark the vLLM connection as active
         # (RealtimeConnection normally flips this in handle_connection()).
         self._conn._is_connected = True
@@ -180,67 +133,52 @@ class RealtimeConnectionAdapter:
 
     def _reset_audio_state(self) -> None:
         self._audio_pending.clear()
-        self._audio_pending_bytes = 0
-        self._overlap_chunks.clear()
-        self._overlap_bytes = 0
-        self._segment_bytes_sent = 0
+        if self._overlap is not None:
+            self._overlap.clear()
+        self._segment_samples_sent = 0
         self._finalize_requested = False
         self._closing_segment = False
+        self._ingress.reset()
+        self._roll_planner.reset()
+        if self._vad_gate is not None:
+            self._vad_gate.reset()
 
-    def _push_overlap_chunk(self, audio_b64: str, decoded_bytes: int) -> None:
-        if self._overlap_target_bytes <= 0 or decoded_bytes <= 0:
-            return
-        self._overlap_chunks.append((audio_b64, decoded_bytes))
-        self._overlap_bytes += decoded_bytes
-        while self._overlap_chunks and self._overlap_bytes > self._overlap_target_bytes:
-            _old, old_bytes = self._overlap_chunks.popleft()
-            self._overlap_bytes -= int(old_bytes)
-        self._overlap_bytes = max(0, int(self._overlap_bytes))
+    def set_input_audio_format(self, audio_format: str) -> None:
+        self._ingress.set_format(audio_format)
+
+    def set_input_sample_rate(self, sample_rate: int) -> None:
+        self._ingress.set_sample_rate(sample_rate)
 
     async def _await_generation_done(self, *, timeout_s: float = 60.0) -> None:
-        if self._conn is None:
-            return
         task = getattr(self._conn, "generation_task", None)
-        if task is None:
-            return
-        if task.done():
-            return
-        await asyncio.wait_for(task, timeout=float(timeout_s))
+        if task is not None and not task.done():
+            await asyncio.wait_for(task, timeout=float(timeout_s))
 
     async def _commit_to_vllm(self, *, final: bool) -> None:
-        if self._conn is None:
-            raise RuntimeError("realtime connection is not initialized")
         await self._conn.handle_event({"type": "input_audio_buffer.commit", "final": bool(final)})
 
-    async def _append_to_vllm(self, *, audio_b64: str) -> None:
-        if self._conn is None:
-            raise RuntimeError("realtime connection is not initialized")
-        await self._conn.handle_event({"type": "input_audio_buffer.append", "audio": audio_b64})
-
-        # Enforce a bounded audio backlog by dropping oldest unprocessed audio.
-        q = getattr(self._conn, "audio_queue", None)
-        if isinstance(q, _TrackedAudioQueue) and self._send_ws is not None:
-            dropped_s = q.drop_oldest_to_max_backlog(max_backlog_seconds=float(STT_MAX_BACKLOG_SECONDS))
-            if dropped_s > 0:
-                await self._send_ws.send_status(
-                    {
-                        "kind": "overload_drop",
-                        "dropped_seconds": float(dropped_s),
-                        "max_backlog_seconds": float(STT_MAX_BACKLOG_SECONDS),
-                        "source": "vllm_audio_queue",
-                    }
-                )
-
-    async def _roll_segment(self) -> None:
-        if not STT_INTERNAL_ROLL:
-            return
-        if self._conn is None:
-            return
-        if self._send_ws is None:
-            return
-        if self._finalize_requested:
-            return
-        if self._closing_segment:
+    async def _append_to_vllm(self, samples: np.ndarray) -> None:
+        # Equivalent to RealtimeConnection's append handling, minus the base64 decode
+        # and the extra float copies: one float32 array straight onto the queue.
+        self._audio_queue.put_nowait(pcm16_to_float32(samples))
+
+        # Enforce a bounded audio backlog: compact silence first, then drop oldest audio.
+        compacted_s, dropped_s = self._audio_queue.enforce_backlog(self._backlog_policy)
+        await self._send_overload_status(compacted_s, dropped_s, source="vllm_audio_queue")
+
+    async def _send_overload_status(self, compacted_s: float, dropped_s: float, *, source: str) -> None:
+        # Silence is compacted first; only what is still over the bound is dropped (speech included).
+        if compacted_s > 0 or dropped_s > 0:
+            await self._send_ws.send_status({
+                "kind": "overload_drop",
+                "compacted_seconds": float(compacted_s),
+                "dropped_seconds": float(dropped_s),
+                "max_backlog_seconds": float(self._backlog_policy.max_backlog_seconds),
+                "source": source,
+            })
+
+    async def _roll_segment(self, *, replay_overlap: bool) -> None:
+        if not STT_INTERNAL_ROLL or self._finalize_requested or self._closing_segment:
             return
 
         self._closing_segment = True
@@ -251,66 +189,93 @@ class RealtimeConnectionAdapter:
         await self._await_generation_done(timeout_s=120.0)
 
         # Start next segment.
-        self._segment_bytes_sent = 0
+        self._segment_samples_sent = 0
         await self._commit_to_vllm(final=False)
 
-        # Replay overlap first for boundary accuracy.
-        for audio_b64, decoded_bytes in list(self._overlap_chunks):
-            await self._append_to_vllm(audio_b64=audio_b64)
-            self._segment_bytes_sent += int(decoded_bytes)
+        # Replay overlap first for boundary accuracy (one contiguous slice). A cut inside a
+        # pause splits no words, so there is nothing to replay or de-duplicate.
+        replay = self._overlap.tail(len(self._overlap)) if replay_overlap and self._overlap is not None else None
+        if replay is None or len(replay) == 0:
+            self._send_ws.expect_overlap(False)
+        else:
+            # The new segment emits each step's text a transcription delay after its audio, just
+            # as the previous one did, so text from the replay's steps is what gets repeated.
+            self._send_ws.expect_overlap(True, repeated_steps=len(replay) // ASR_FRAME_SAMPLES)
+            await self._append_to_vllm(replay)
+            self._segment_samples_sent += len(replay)
 
         self._closing_segment = False
 
-    async def _finalize(self) -> None:
-        if self._conn is None:
-            return
-        if self._send_ws is None:
-            return
-        if self._closing_segment:
-            # If we're already closing, just wait for completion.
-            await self._await_generation_done(timeout_s=120.0)
-            self._utterance_active = False
-            self._reset_audio_state()
+    async def _report_vad_stats(self) -> None:
+        if self._vad_gate is None:
             return
+        skipped = self._vad_gate.finish()
+        self._vad_session_skipped_samples += skipped
+        await self._send_ws.send_status({
+            "kind": "vad",
+            "skipped_seconds": float(skipped) / float(ASR_SAMPLE_RATE_HZ),
+            "session_skipped_seconds": float(self._vad_session_skipped_samples) / float(ASR_SAMPLE_RATE_HZ),
+        })
 
-        await self._commit_to_vllm(final=True)
+    async def _finalize(self) -> None:
+        await self._report_vad_stats()
+        mean_delay_s, max_delay_s = self._feed_flow.take_wait_stats()
+        if max_delay_s >= ASR_FRAME_SECONDS:
+            await self._send_ws.send_status({
+                "kind": "feed_delay",
+                "mean_queue_delay_seconds": mean_delay_s,
+                "max_queue_delay_seconds": max_delay_s,
+            })
+        # If we're already closing a segment, just wait for its completion.
+        if not self._closing_segment:
+            await self._commit_to_vllm(final=True)
         await self._await_generation_done(timeout_s=120.0)
         self._utterance_active = False
         self._reset_audio_state()
 
+    async def _feed_samples(self, samples: np.ndarray) -> None:
+        if self._vad_gate is not None:
+            samples = self._vad_gate.process(samples)
+            if len(samples) == 0:
+                return
+        await self._append_to_vllm(samples)
+        self._segment_samples_sent += len(samples)
+        if self._overlap is not None:
+            self._overlap.write(samples)
+
+    async def _feed_pending(self, n: int) -> None:
+        plan = None
+        if STT_INTERNAL_ROLL and not self._finalize_requested:
+            plan = self._roll_planner.plan(self._segment_samples_sent, self._audio_pending.head(n))
+        cut = n if plan is None else plan.cut_samples
+        if cut > 0:
+            samples = self._audio_pending.read(cut)
+            self._roll_planner.observe(samples)
+            await self._feed_samples(samples)
+        if plan is not None:
+            # Do not hold the rest of the grant while the segment rolls.
+            self._feed_scheduler.settle(self._feed_flow)
+            await self._roll_segment(replay_overlap=not plan.clean)
+
     async def _feed_loop(self) -> None:
         while True:
             await self._feed_event.wait()
             self._feed_event.clear()
 
-            if not self._utterance_active:
+            if not self._utterance_active or self._preempted:
                 continue
 
             try:
-                # Drain pending audio into vLLM as fast as possible.
-                while self._utterance_active and not self._closing_segment:
-                    if self._audio_pending:
-                        audio_b64, decoded_bytes = self._audio_pending.popleft()
-                        self._audio_pending_bytes -= int(decoded_bytes)
-                        self._audio_pending_bytes = max(0, int(self._audio_pending_bytes))
-
-                        await self._append_to_vllm(audio_b64=audio_b64)
-                        self._segment_bytes_sent += int(decoded_bytes)
-                        self._push_overlap_chunk(audio_b64, int(decoded_bytes))
-
-                        if (
-                            STT_INTERNAL_ROLL
-                            and not self._finalize_requested
-                            and self._segment_target_bytes > 0
-                            and self._segment_bytes_sent >= self._segment_target_bytes
-                        ):
-                            await self._roll_segment()
+                # Drain pending audio into vLLM in whole model steps, as the scheduler grants them.
+                while self._utterance_active and not self._closing_segment and not self._preempted:
+                    n = self._next_feed_samples()
+                    if n > 0:
+                        async with self._feed_scheduler.grant(self._feed_flow, n) as granted:
+                            await self._feed_pending(granted)
                         continue
 
                     if self._finalize_requested:
                         await self._finalize()
-                        break
-
                     break
             except asyncio.CancelledError:
                 return
@@ -321,13 +286,32 @@ class RealtimeConnectionAdapter:
                     await self.cancel()
                 return
 
+    def _next_feed_samples(self) -> int:
+        # Coalesce pending audio into whole ~80ms model steps regardless of how the client
+        # chunks it; the sub-step remainder waits for more audio. A final commit flushes
+        # everything left as a single append.
+        n = len(self._audio_pending)
+        if self._finalize_requested:
+            return n
+        return n - n % ASR_FRAME_SAMPLES
+
+    async def _buffer_pcm(self, pcm: bytes) -> None:
+        # The load controller tightens the backlog bound while the engine is overloaded.
+        scale = self._load_controller.backlog_scale
+        samples = np.frombuffer(pcm, dtype="<i2")
+        compacted, dropped = write_compacting(self._audio_pending, samples, self._backlog_policy, scale=scale)
+        rate = float(ASR_SAMPLE_RATE_HZ)
+        await self._send_overload_status(compacted / rate, dropped / rate, source="pending_buffer")
+
+        # Only wake the feeder once there is at least one full model step to send.
+        if len(self._audio_pending) >= ASR_FRAME_SAMPLES:
+            self._ensure_feed_task()
+            self._feed_event.set()
+
     async def handle_event(self, event_type: str, payload: dict[str, Any]) -> None:
         if event_type == "session.update":
             self._initialized = True
-        event: dict[str, Any] = {"type": event_type}
-        event.update(payload)
-        if self._conn is None:
-            raise RuntimeError("realtime connection is not initialized")
+        event: dict[str, Any] = {"type": event_type, **payload}
 
         if event_type == "input_audio_buffer.commit":
             final = bool(payload.get("final", False))
@@ -335,58 +319,71 @@ class RealtimeConnectionAdapter:
                 # Start a new utterance and allow indefinite audio by rolling segments internally.
                 self._reset_audio_state()
                 self._utterance_active = True
-                self._finalize_requested = False
                 self._ensure_feed_task()
                 await self._conn.handle_event(event)
             else:
-                # Flush buffered audio then finalize (commit to vLLM happens in the feeder).
+                # Drain the resampler tail, flush buffered audio, then finalize (commit to
+                # vLLM happens in the feeder).
+                tail = await self._ingress.flush()
+                if tail:
+                    await self._buffer_pcm(tail)
                 self._finalize_requested = True
                 self._ensure_feed_task()
                 self._feed_event.set()
             return
 
         if event_type == "input_audio_buffer.append":
-            audio_b64 = payload.get("audio")
-            if isinstance(audio_b64, str) and audio_b64.strip():
-                decoded_bytes = _estimate_b64_decoded_bytes(audio_b64)
-                self._audio_pending.append((audio_b64, int(decoded_bytes)))
-                self._audio_pending_bytes += int(decoded_bytes)
-
-                if self._max_backlog_bytes > 0 and self._audio_pending_bytes > self._max_backlog_bytes:
-                    dropped = 0
-                    while self._audio_pending and self._audio_pending_bytes > self._max_backlog_bytes:
-                        _old_b64, old_bytes = self._audio_pending.popleft()
-                        self._audio_pending_bytes -= int(old_bytes)
-                        dropped += int(old_bytes)
-                    self._audio_pending_bytes = max(0, int(self._audio_pending_bytes))
-
-                    if dropped > 0 and self._send_ws is not None:
-                        dropped_s = float(dropped) / float(_ASR_BYTES_PER_SECOND)
-                        await self._send_ws.send_status(
-                            {
-                                "kind": "overload_drop",
-                                "dropped_seconds": dropped_s,
-                                "max_backlog_seconds": float(STT_MAX_BACKLOG_SECONDS),
-                                "source": "pending_buffer",
-                            }
-                        )
-
-                self._ensure_feed_task()
-                self._feed_event.set()
+            data = payload.get("audio_bytes")
+            try:
+                if not isinstance(data, bytes):
+                    data = decode_b64_audio(str(payload.get("audio") or ""))
+                pcm = await self._ingress.to_pcm16(data)
+            except ValueError:
+                logger.debug("rejecting undecodable audio chunk", exc_info=True)
+                # Same client-visible error vLLM emits for a bad append.
+                await self._conn.send_error("Invalid audio data", "invalid_audio")
                 return
-
-            # Fall back to vLLM validation error behavior.
-            await self._conn.handle_event(event)
+            if self._state.charge_audio is not None:
+                # Per-key audio quota; RateLimitError drops the chunk (the dispatcher reports it).
+                self._state.charge_audio(len(pcm) / (2.0 * ASR_SAMPLE_RATE_HZ))
+            await self._buffer_pcm(pcm)
             return
 
         await self._conn.handle_event(event)
 
+    async def send_status(self, payload: dict[str, Any]) -> None:
+        await self._send_ws.send_status(payload)
+
+    @property
+    def preempted(self) -> bool:
+        return self._preempted
+
+    def request_preemption(self) -> None:
+        """Mark the utterance preempted; its slot has already gone to higher-priority traffic.
+
+        Called from the preempting connection's task, so it only sets a flag (the feeder stops
+        at once) and wakes this connection's own message loop, which calls ``finish_preemption``.
+        """
+        self._preempted = True
+        if self._state.wake is not None:
+            self._state.wake()
+
+    async def finish_preemption(self) -> bool:
+        """Tear down the preempted utterance and tell the client; False if nothing was torn down."""
+        if not self._preempted:
+            return False
+        self._preempted = False
+        await self._send_ws.send_status({"kind": "preempted", "reason": "higher_priority_utterance"})
+        if self._utterance_slots.holds(self):
+            # A new utterance already took a fresh slot; the commit that started it cancelled this one.
+            return False
+        await self.cancel()
+        return True
+
     async def cancel(self) -> None:
         """Best-effort cancel current generation + clear buffers."""
+        self._utterance_slots.release(self)
         try:
-            if self._conn is None:
-                return
-
             if self._feed_task is not None:
                 self._feed_task.cancel()
                 with contextlib.suppress(Exception):
@@ -394,16 +391,14 @@ class RealtimeConnectionAdapter:
                 self._feed_task = None
 
             self._utterance_active = False
-            self._finalize_requested = False
-            self._closing_segment = False
             self._reset_audio_state()
+            if self._ingress.decoded_packets:
+                logger.debug("audio decode stats: %s", self._ingress.stats())
 
             # Drain queued audio to stop quickly.
-            q = getattr(self._conn, "audio_queue", None)
-            if q is not None:
-                with contextlib.suppress(Exception):
-                    while not q.empty():
-                        q.get_nowait()
+            with contextlib.suppress(Exception):
+                while not self._audio_queue.empty():
+                    self._audio_queue.get_nowait()
 
             # vLLM exposes an async cleanup() that cancels generation task.
             await self._conn.cleanup()
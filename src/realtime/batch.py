@@ -0,0 +1,153 @@
+"""Whole-file transcription by fanning segments out to vLLM as concurrent requests."""
+
+from __future__ import annotations
+
+import time
+import uuid
+import asyncio
+import logging
+from typing import Any
+from dataclasses import dataclass
+from collections.abc import AsyncGenerator
+
+import numpy as np
+from vllm.sampling_params import SamplingParams, RequestOutputKind
+
+from src.audio.pcm import pcm16_to_float32
+from src.audio.segments import plan_segments
+from src.admission.replicas import ReplicaRouter
+from src.config.vllm import VLLM_MAX_AUDIO_TOKENS
+from src.transcript.stitch import stitch_segments
+from src.admission.utterances import UtteranceSlots
+from src.config.streaming import STT_SEGMENT_OVERLAP_SECONDS
+from src.config.limits import ASR_FRAME_SAMPLES, ASR_SAMPLE_RATE_HZ
+
+logger = logging.getLogger(__name__)
+
+
+# Batch segments queue for utterance slots in the lowest class: live utterances of any
+# higher class preempt them, and together with low-priority sessions they are held to
+# LOW_PRIORITY_UTTERANCE_SHARE.
+_BATCH_PRIORITY: str = "low"
+
+
+async def _segment_audio(samples: np.ndarray) -> AsyncGenerator[np.ndarray, None]:
+    # The whole segment is already here; the model slices it into steps itself.
+    yield pcm16_to_float32(samples)
+
+
+def _no_backlog() -> int:
+    # A segment's audio is handed to vLLM whole; nothing queues on the frontend.
+    return 0
+
+
+@dataclass(slots=True, eq=False)
+class _SegmentHolder:
+    """Utterance-slot holder for one attempt at a batch segment."""
+
+    task: asyncio.Task[str] | None = None
+    preempted: bool = False
+
+    def request_preemption(self) -> None:
+        # Cancelling the generation closes its vLLM request; the segment is retried.
+        self.preempted = True
+        if self.task is not None:
+            self.task.cancel()
+
+    @staticmethod
+    async def send_status(payload: dict[str, Any]) -> None:
+        # Load advisories (LoadController) have no client to go to.
+        return
+
+
+class BatchTranscriber:
+    """Transcribe complete recordings with the realtime model, segments in parallel.
+
+    Recordings are split into segments as long as max_model_len allows, overlapping by
+    STT_SEGMENT_OVERLAP_SECONDS, and each segment runs as its own vLLM request. Texts are
+    joined with the same overlap de-duplication as realtime rolls.
+
+    Each segment is admitted like a live utterance: it waits for a low-priority slot in
+    ``utterance_slots`` (so load shedding and the low-priority share apply, and higher
+    classes preempt it, after which it starts over) and is routed by ``replica_router``.
+    ``max_concurrency`` further caps this frontend's batch segments in flight.
+    Cancelling ``transcribe`` aborts every segment's vLLM request.
+    """
+
+    def __init__(self, *, utterance_slots: UtteranceSlots, replica_router: ReplicaRouter, max_concurrency: int) -> None:
+        self._utterance_slots = utterance_slots
+        self._replica_router = replica_router
+        self._segments = asyncio.Semaphore(max(1, int(max_concurrency)))
+
+    async def transcribe(self, samples: np.ndarray) -> dict[str, Any]:
+        """Transcribe 16 kHz PCM16 samples; return the stitched text and job stats."""
+        start = time.perf_counter()
+        spans = plan_segments(
+            len(samples),
+            segment_samples=VLLM_MAX_AUDIO_TOKENS * ASR_FRAME_SAMPLES,
+            overlap_samples=int(float(STT_SEGMENT_OVERLAP_SECONDS) * ASR_SAMPLE_RATE_HZ),
+            frame_samples=ASR_FRAME_SAMPLES,
+        )
+        job_id = uuid.uuid4().hex
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._transcribe_segment(samples[lo:hi], request_id=f"batch-{job_id}-{i}"))
+                for i, (lo, hi) in enumerate(spans)
+            ]
+        elapsed = time.perf_counter() - start
+        duration = float(len(samples)) / float(ASR_SAMPLE_RATE_HZ)
+        logger.info("batch %s: %.1fs audio, %d segments in %.2fs", job_id, duration, len(spans), elapsed)
+        return {
+            "text": stitch_segments(task.result() for task in tasks),
+            "duration_seconds": round(duration, 3),
+            "segments": len(spans),
+            "elapsed_seconds": round(elapsed, 3),
+        }
+
+    async def _transcribe_segment(self, samples: np.ndarray, *, request_id: str) -> str:
+        async with self._segments:
+            attempt = 0
+            while True:
+                text = await self._attempt_segment(samples, request_id=f"{request_id}-{attempt}")
+                if text is not None:
+                    return text
+                attempt += 1
+                logger.info("batch segment %s preempted; retrying", request_id)
+
+    async def _attempt_segment(self, samples: np.ndarray, *, request_id: str) -> str | None:
+        # One admitted vLLM request; None if a higher-priority utterance preempted it.
+        holder = _SegmentHolder()
+        await self._utterance_slots.acquire(holder, priority=_BATCH_PRIORITY)
+        ticket = self._replica_router.acquire(_no_backlog)
+        try:
+            holder.task = asyncio.create_task(self._generate(ticket.serving, samples, request_id=request_id))
+            return await holder.task
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if not holder.preempted or (current is not None and current.cancelling()):
+                raise
+            return None
+        finally:
+            self._replica_router.release(ticket)
+            self._utterance_slots.release(holder)
+
+    @staticmethod
+    async def _generate(serving: Any, samples: np.ndarray, *, request_id: str) -> str:
+        # Same request shape as RealtimeConnection's generation, minus the websocket: generated
+        # token ids are fed back as context for the next audio step.
+        input_stream: asyncio.Queue[list[int]] = asyncio.Queue()
+        prompts = serving.transcribe_realtime(_segment_audio(samples), input_stream)
+        sampling_params = SamplingParams.from_optional(
+            temperature=0.0, max_tokens=1, output_kind=RequestOutputKind.DELTA, skip_clone=True
+        )
+        parts: list[str] = []
+        async for output in serving.engine_client.generate(
+            prompt=prompts, sampling_params=sampling_params, request_id=request_id
+        ):
+            if output.outputs:
+                parts.append(output.outputs[0].text)
+                input_stream.put_nowait(list(output.outputs[0].token_ids))
+        return "".join(parts)
+
+
+__all__ = ["BatchTranscriber"]
@@ -7,14 +7,34 @@ from typing import Any
 from fastapi import WebSocket
 
 from src.state import EnvelopeState
+from src.audio.pool import AudioWorkerPool
+from src.admission.load import LoadController
+from src.audio.scheduler import FeedScheduler
+from src.admission.replicas import ReplicaRouter
+from src.admission.utterances import UtteranceSlots
 
 from .adapter import RealtimeConnectionAdapter
 
 
 class RealtimeBridge:
-    def __init__(self, *, serving_realtime: Any, allowed_model_name: str) -> None:
+    def __init__(
+        self,
+        *,
+        serving_realtime: Any,
+        allowed_model_name: str,
+        audio_pool: AudioWorkerPool,
+        utterance_slots: UtteranceSlots,
+        feed_scheduler: FeedScheduler,
+        load_controller: LoadController,
+        replica_router: ReplicaRouter | None = None,
+    ) -> None:
         self._serving_realtime = serving_realtime
         self._allowed_model_name = allowed_model_name
+        self._audio_pool = audio_pool
+        self._utterance_slots = utterance_slots
+        self._feed_scheduler = feed_scheduler
+        self._load_controller = load_controller
+        self._replica_router = replica_router
 
     def new_connection(self, ws: WebSocket, state: EnvelopeState) -> RealtimeConnectionAdapter:
         return RealtimeConnectionAdapter(
@@ -22,6 +42,11 @@ class RealtimeBridge:
             state=state,
             serving_realtime=self._serving_realtime,
             allowed_model_name=self._allowed_model_name,
+            audio_pool=self._audio_pool,
+            utterance_slots=self._utterance_slots,
+            feed_scheduler=self._feed_scheduler,
+            load_controller=self._load_controller,
+            replica_router=self._replica_router,
         )
 
 
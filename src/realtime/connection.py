@@ -0,0 +1,57 @@
+"""vLLM RealtimeConnection that hands events to the envelope layer as dicts."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from vllm.entrypoints.openai.realtime.protocol import TranscriptionDelta
+from vllm.entrypoints.openai.realtime.connection import RealtimeConnection
+
+from src.admission.replicas import ReplicaRouter
+
+from .envelope import EnvelopeWebSocket
+
+
+class EnvelopeRealtimeConnection(RealtimeConnection):
+    """RealtimeConnection whose events skip JSON text on their way to EnvelopeWebSocket.
+
+    The stock ``send``/``send_error`` serialize each event with ``model_dump_json`` only
+    for the envelope layer to parse it again; here the event goes over as a dict.
+
+    With a ``router``, each generation (one vLLM request per segment) starts on the
+    least-loaded engine replica and holds its route until the request finishes.
+    """
+
+    def __init__(self, websocket: EnvelopeWebSocket, serving: Any, *, router: ReplicaRouter | None = None) -> None:
+        super().__init__(websocket, serving)
+        self._envelope_ws = websocket
+        self._router = router
+
+    async def start_generation(self) -> None:
+        router = self._router
+        if router is None or (self.generation_task is not None and not self.generation_task.done()):
+            await super().start_generation()
+            return
+        ticket = router.acquire(self._queued_samples)
+        self.serving = ticket.serving
+        await super().start_generation()
+        if self.generation_task is None:
+            router.release(ticket)
+            return
+        self.generation_task.add_done_callback(lambda _task: router.release(ticket))
+
+    def _queued_samples(self) -> int:
+        return int(getattr(self.audio_queue, "total_samples", 0))
+
+    async def send(self, event: Any) -> None:
+        # One delta per model step: build the dict by hand instead of through pydantic.
+        if isinstance(event, TranscriptionDelta):
+            await self._envelope_ws.send_event({"type": event.type, "delta": event.delta})
+            return
+        await self._envelope_ws.send_event(event.model_dump(mode="json"))
+
+    async def send_error(self, message: str, code: str | None = None) -> None:
+        await self._envelope_ws.send_event({"type": "error", "error": message, "code": code})
+
+
+__all__ = ["EnvelopeRealtimeConnection"]
@@ -0,0 +1,53 @@
+"""Serialization of outbound JSON envelopes with cached per-request prefixes."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+
+from src.config.websocket import WS_KEY_TYPE, WS_KEY_PAYLOAD, WS_KEY_REQUEST_ID, WS_KEY_SESSION_ID
+
+# Prefixes are per (type, session, request); a connection only ever uses a handful at once.
+_MAX_CACHED_PREFIXES: int = 64
+
+
+class EnvelopeEncoder:
+    """Encode ``{type, session_id, request_id, payload}`` envelopes as JSON bytes.
+
+    The bytes up to the payload only change with the frame type and ids, so they are
+    serialized once and reused; each frame only serializes its payload (for token
+    frames, just the text). Output is byte-identical to ``orjson.dumps`` of the
+    envelope dict.
+    """
+
+    def __init__(self) -> None:
+        self._prefixes: dict[tuple[str, str, str], bytes] = {}
+        self._token_prefixes: dict[tuple[str, str], bytes] = {}
+
+    def encode(self, msg_type: str, session_id: str, request_id: str, payload: Any) -> bytes:
+        return self._prefix(msg_type, session_id, request_id) + orjson.dumps(payload) + b"}"
+
+    def encode_token(self, session_id: str, request_id: str, text: str) -> bytes:
+        """Encode a ``token`` frame with payload ``{"text": text}`` (the per-delta hot path)."""
+        prefix = self._token_prefixes.get((session_id, request_id))
+        if prefix is None:
+            if len(self._token_prefixes) >= _MAX_CACHED_PREFIXES:
+                self._token_prefixes.clear()
+            prefix = self._prefix("token", session_id, request_id) + b'{"text":'
+            self._token_prefixes[(session_id, request_id)] = prefix
+        return prefix + orjson.dumps(text) + b"}}"
+
+    def _prefix(self, msg_type: str, session_id: str, request_id: str) -> bytes:
+        key = (msg_type, session_id, request_id)
+        prefix = self._prefixes.get(key)
+        if prefix is None:
+            if len(self._prefixes) >= _MAX_CACHED_PREFIXES:
+                self._prefixes.clear()
+            head = orjson.dumps({WS_KEY_TYPE: msg_type, WS_KEY_SESSION_ID: session_id, WS_KEY_REQUEST_ID: request_id})
+            prefix = head[:-1] + b"," + orjson.dumps(WS_KEY_PAYLOAD) + b":"
+            self._prefixes[key] = prefix
+        return prefix
+
+
+__all__ = ["EnvelopeEncoder"]
@@ -2,30 +2,20 @@
 
 from __future__ import annotations
 
+import time
+import asyncio
+import contextlib
 from typing import Any
 from collections.abc import Callable
-from dataclasses import dataclass
 
 import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 from src.state import EnvelopeState
-from src.config.websocket import (
-    WS_ERROR_INTERNAL,
-    WS_KEY_TYPE,
-    WS_KEY_PAYLOAD,
-    WS_KEY_REQUEST_ID,
-    WS_KEY_SESSION_ID,
-)
+from src.config.websocket import WS_ERROR_INTERNAL
+from src.transcript.assembly import TranscriptAssembler
 
-
-@dataclass(slots=True)
-class _TranscriptState:
-    request_id: str = "unknown"
-    committed_text: str = ""
-    visible_text: str = ""
-    segment_text: str = ""
-    dedup_prefix_len: int = 0
+from .encoder import EnvelopeEncoder
 
 
 class EnvelopeWebSocket:
@@ -37,12 +27,23 @@ class EnvelopeWebSocket:
         state: EnvelopeState,
         *,
         on_disconnect: Callable[[], None] | None = None,
+        on_utterance_end: Callable[[], None] | None = None,
     ) -> None:
         self._ws = ws
         self._state = state
         self._on_disconnect = on_disconnect
+        self._on_utterance_end = on_utterance_end
         self._suppress_done_count: int = 0
-        self._tx = _TranscriptState()
+        self._tx_request_id = "unknown"
+        self._tx = TranscriptAssembler()
+        # Token text waiting for the session's partial interval to elapse (see _send_token).
+        self._pending_text = ""
+        self._pending_request_id = "unknown"
+        self._last_token_at = 0.0
+        self._flush_task: asyncio.Task[None] | None = None
+        # Timed flushes run outside send_text; keep frames in order.
+        self._send_lock = asyncio.Lock()
+        self._encoder = EnvelopeEncoder()
 
     def suppress_next_done(self) -> None:
         """Suppress the next client-visible completion frames (final/done).
@@ -52,21 +53,29 @@ class EnvelopeWebSocket:
         """
         self._suppress_done_count += 1
 
+    def expect_overlap(self, replayed: bool, *, repeated_steps: int | None = None) -> None:
+        """Declare whether the next segment starts with replayed audio to de-duplicate.
+
+        With ``repeated_steps``, text emitted during that many leading model steps is
+        trimmed by position (time alignment) rather than by matching it against the
+        committed transcript.
+        """
+        self._tx.expect_overlap(replayed, repeated_steps=repeated_steps)
+
     async def send_status(self, payload: dict[str, Any]) -> None:
         if self._state.touch is not None:
             self._state.touch()
         rid = self._state.inflight_request_id or self._state.active_request_id or self._state.request_id
-        envelope = {
-            WS_KEY_TYPE: "status",
-            WS_KEY_SESSION_ID: self._state.session_id,
-            WS_KEY_REQUEST_ID: rid,
-            WS_KEY_PAYLOAD: payload or {},
-        }
-        await self._safe_send_envelope(envelope)
-
-    async def _safe_send_envelope(self, envelope: dict[str, Any]) -> None:
+        await self._send_envelope("status", rid, payload or {})
+
+    async def _send_envelope(self, msg_type: str, request_id: str, payload: Any) -> None:
+        await self._send_frame(self._encoder.encode(msg_type, self._state.session_id, request_id, payload))
+
+    async def _send_frame(self, data: bytes) -> None:
         try:
-            await self._ws.send_text(orjson.dumps(envelope).decode("utf-8"))
+            async with self._send_lock:
+                # ASGI text frames carry str, so the encoded bytes are decoded exactly once here.
+                await self._ws.send_text(data.decode("utf-8"))
         except WebSocketDisconnect:
             if self._on_disconnect is not None:
                 self._on_disconnect()
@@ -76,57 +85,60 @@ class EnvelopeWebSocket:
                 self._on_disconnect()
             raise
 
-    def _reset_transcript_if_needed(self) -> None:
-        rid = self._state.inflight_request_id or self._state.active_request_id or self._state.request_id
-        if self._tx.request_id == rid:
+    async def _send_token(self, text: str) -> None:
+        """Queue token text; send it now or once the session's partial interval has passed."""
+        if self._pending_text and self._pending_request_id != self._tx_request_id:
+            await self._flush_tokens()
+        self._pending_text += text
+        self._pending_request_id = self._tx_request_id
+        if self._flush_task is not None:
             return
-        self._tx = _TranscriptState(request_id=rid)
-
-    @staticmethod
-    def _find_overlap(a_suffix: str, b_prefix: str) -> int:
-        """Return length of the longest suffix of a_suffix that is a prefix of b_prefix."""
-        if not a_suffix or not b_prefix:
-            return 0
-        max_len = min(len(a_suffix), len(b_prefix))
-        # Brute force on a small window; good enough for short overlaps.
-        for i in range(max_len, 0, -1):
-            if a_suffix.endswith(b_prefix[:i]):
-                return i
-        return 0
-
-    def _maybe_update_dedup_prefix(self) -> None:
-        if not self._tx.committed_text or not self._tx.segment_text:
+        wait_s = self._last_token_at + max(0, int(self._state.partial_interval_ms)) / 1000.0 - time.monotonic()
+        if wait_s <= 0:
+            await self._flush_tokens()
+        else:
+            self._flush_task = asyncio.create_task(self._flush_later(wait_s))
+
+    async def _flush_later(self, delay_s: float) -> None:
+        await asyncio.sleep(delay_s)
+        # A failed send has already reported the disconnect.
+        with contextlib.suppress(Exception):
+            await self._flush_tokens()
+
+    async def _flush_tokens(self) -> None:
+        task, self._flush_task = self._flush_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        if not self._pending_text:
             return
+        text, self._pending_text = self._pending_text, ""
+        self._last_token_at = time.monotonic()
+        await self._send_frame(self._encoder.encode_token(self._state.session_id, self._pending_request_id, text))
 
-        # Only look at bounded windows for performance.
-        tail = self._tx.committed_text[-2000:]
-        head = self._tx.segment_text[:2000]
-        overlap = self._find_overlap(tail, head)
-        if overlap <= 0:
-            return
-
-        candidate_cut = int(overlap)
-        if candidate_cut <= int(self._tx.dedup_prefix_len):
+    def _reset_transcript_if_needed(self) -> None:
+        rid = self._state.inflight_request_id or self._state.active_request_id or self._state.request_id
+        if self._tx_request_id == rid:
             return
-        candidate_merged = self._tx.committed_text + self._tx.segment_text[candidate_cut:]
-        if candidate_merged.startswith(self._tx.visible_text):
-            self._tx.dedup_prefix_len = candidate_cut
+        self._tx_request_id = rid
+        self._tx = TranscriptAssembler()
 
     async def send_text(self, text: str) -> None:
-        if self._state.touch is not None:
-            self._state.touch()
+        """Wrap a JSON-serialized realtime event (Starlette WebSocket interface)."""
         try:
             event = orjson.loads(text)
         except Exception:
-            envelope = {
-                WS_KEY_TYPE: "realtime.raw",
-                WS_KEY_SESSION_ID: self._state.session_id,
-                WS_KEY_REQUEST_ID: self._state.request_id,
-                WS_KEY_PAYLOAD: {"raw": text},
-            }
-            await self._safe_send_envelope(envelope)
+            event = None
+        if not isinstance(event, dict):
+            if self._state.touch is not None:
+                self._state.touch()
+            await self._send_envelope("realtime.raw", self._state.request_id, {"raw": text})
             return
+        await self.send_event(event)
 
+    async def send_event(self, event: dict[str, Any]) -> None:
+        """Wrap a realtime event given as a dict, without a JSON round trip."""
+        if self._state.touch is not None:
+            self._state.touch()
         msg_type = event.get("type")
         if not isinstance(msg_type, str):
             msg_type = "realtime.unknown"
@@ -134,72 +146,34 @@ class EnvelopeWebSocket:
         self._reset_transcript_if_needed()
 
         if msg_type == "transcription.delta":
-            delta = event.get("delta") if isinstance(event, dict) else None
-            if isinstance(delta, str) and delta:
-                self._tx.segment_text += delta
-                self._maybe_update_dedup_prefix()
-
-                merged = self._tx.committed_text + self._tx.segment_text[self._tx.dedup_prefix_len :]
-                if merged.startswith(self._tx.visible_text):
-                    out = merged[len(self._tx.visible_text) :]
-                    if out:
-                        envelope = {
-                            WS_KEY_TYPE: "token",
-                            WS_KEY_SESSION_ID: self._state.session_id,
-                            WS_KEY_REQUEST_ID: self._tx.request_id,
-                            WS_KEY_PAYLOAD: {"text": out},
-                        }
-                        await self._safe_send_envelope(envelope)
-                        self._tx.visible_text = merged
+            out = self._tx.add_delta(event.get("delta"))
+            if out:
+                await self._send_token(out)
             return
 
         if msg_type == "transcription.done":
             if self._state.inflight_request_id == self._state.request_id:
                 self._state.inflight_request_id = None
 
-            txt = event.get("text") if isinstance(event, dict) else None
-            if isinstance(txt, str):
-                self._tx.segment_text = txt
-            self._maybe_update_dedup_prefix()
-
-            merged = self._tx.committed_text + self._tx.segment_text[self._tx.dedup_prefix_len :]
-            if merged.startswith(self._tx.visible_text):
-                out = merged[len(self._tx.visible_text) :]
-                if out:
-                    token_env = {
-                        WS_KEY_TYPE: "token",
-                        WS_KEY_SESSION_ID: self._state.session_id,
-                        WS_KEY_REQUEST_ID: self._tx.request_id,
-                        WS_KEY_PAYLOAD: {"text": out},
-                    }
-                    await self._safe_send_envelope(token_env)
-
-            # Segment complete.
-            self._tx.committed_text = merged
-            self._tx.visible_text = merged
-            self._tx.segment_text = ""
-            self._tx.dedup_prefix_len = 0
+            out = self._tx.finish_segment(event.get("text"))
+            if out:
+                await self._send_token(out)
 
             if self._suppress_done_count > 0:
                 self._suppress_done_count -= 1
                 return
 
-            final_env = {
-                WS_KEY_TYPE: "final",
-                WS_KEY_SESSION_ID: self._state.session_id,
-                WS_KEY_REQUEST_ID: self._tx.request_id,
-                WS_KEY_PAYLOAD: {"normalized_text": merged},
-            }
-            done_env = {
-                WS_KEY_TYPE: "done",
-                WS_KEY_SESSION_ID: self._state.session_id,
-                WS_KEY_REQUEST_ID: self._tx.request_id,
-                WS_KEY_PAYLOAD: {"usage": (event.get("usage") if isinstance(event, dict) else {}) or {}},
-            }
-            await self._safe_send_envelope(final_env)
-            await self._safe_send_envelope(done_env)
+            # The engine sequence is finished; free its utterance slot before any send can fail.
+            if self._on_utterance_end is not None:
+                self._on_utterance_end()
+            # Completion frames never wait behind coalesced tokens.
+            await self._flush_tokens()
+
+            usage = event.get("usage") or {}
+            await self._send_envelope("final", self._tx_request_id, {"normalized_text": self._tx.text})
+            await self._send_envelope("done", self._tx_request_id, {"usage": usage})
             # Utterance complete; reset transcript assembly for safety.
-            self._tx = _TranscriptState(request_id=self._tx.request_id)
+            self._tx = TranscriptAssembler()
             return
 
         if msg_type == "error":
@@ -207,38 +181,35 @@ class EnvelopeWebSocket:
                 self._state.inflight_request_id = None
             # Any pending internal-roll suppression is no longer meaningful if vLLM errored.
             self._suppress_done_count = 0
+            if self._on_utterance_end is not None:
+                self._on_utterance_end()
+            await self._flush_tokens()
 
             message = ""
             code = WS_ERROR_INTERNAL
-            if isinstance(event, dict):
-                ev_msg = event.get("error")
-                ev_code = event.get("code")
-                if isinstance(ev_msg, str):
-                    message = ev_msg
-                if isinstance(ev_code, str) and ev_code.strip():
-                    code = ev_code.strip()
-
-            envelope = {
-                WS_KEY_TYPE: "error",
-                WS_KEY_SESSION_ID: self._state.session_id,
-                WS_KEY_REQUEST_ID: self._tx.request_id,
-                WS_KEY_PAYLOAD: {"code": code, "message": message or "error", "details": {"reason_code": code}},
-            }
-            await self._safe_send_envelope(envelope)
-            self._tx = _TranscriptState(request_id=self._tx.request_id)
+            ev_msg = event.get("error")
+            ev_code = event.get("code")
+            if isinstance(ev_msg, str):
+                message = ev_msg
+            if isinstance(ev_code, str) and ev_code.strip():
+                code = ev_code.strip()
+
+            await self._send_envelope(
+                "error",
+                self._tx_request_id,
+                {"code": code, "message": message or "error", "details": {"reason_code": code}},
+            )
+            self._tx = TranscriptAssembler()
             return
 
         # Fall back to forwarding other realtime event types as-is (still wrapped).
-        payload: dict[str, Any] = {k: v for k, v in event.items() if k != "type"} if isinstance(event, dict) else {}
-        envelope = {
-            WS_KEY_TYPE: msg_type,
-            WS_KEY_SESSION_ID: self._state.session_id,
-            WS_KEY_REQUEST_ID: self._tx.request_id,
-            WS_KEY_PAYLOAD: payload,
-        }
-        await self._safe_send_envelope(envelope)
+        await self._flush_tokens()
+        payload: dict[str, Any] = {k: v for k, v in event.items() if k != "type"}
+        await self._send_envelope(msg_type, self._tx_request_id, payload)
 
     async def close(self, *, code: int = 1000, reason: str | None = None) -> None:
+        with contextlib.suppress(Exception):
+            await self._flush_tokens()
         await self._ws.close(code=code, reason=reason or "")
 
 
@@ -2,51 +2,180 @@
 
 from __future__ import annotations
 
+import math
 import logging
+from typing import Any
 
 from src.state import RuntimeDeps
+from src.handlers.quotas import KeyQuotas
+from src.audio.pool import AudioWorkerPool
+from src.audio.scheduler import FeedScheduler
 from src.realtime.bridge import RealtimeBridge
+from src.realtime.batch import BatchTranscriber
+from src.admission.replicas import ReplicaRouter
+from src.admission.utterances import UtteranceSlots
+from src.config.websocket import WS_WAITING_ROOM_MAX
+from src.config.batch import STT_BATCH_MAX_CONCURRENCY
 from src.handlers.connections import ConnectionManager
+from src.admission.load import EngineLoad, LoadController
 from src.state.settings import AppSettings, LimitsSettings
+from src.config.audio import STT_AUDIO_DECODE_WORKERS, STT_AUDIO_DECODE_MAX_PENDING
+from src.config.streaming import STT_FEED_QUANTUM_SECONDS, STT_FEED_INFLIGHT_SECONDS_PER_UTTERANCE
+from src.config.limits import (
+    ASR_FRAME_SAMPLES,
+    ASR_SAMPLE_RATE_HZ,
+    LOW_PRIORITY_UTTERANCE_SHARE,
+    CONNECTIONS_PER_UTTERANCE_SLOT,
+)
+from src.config.load import (
+    STT_LOAD_POLL_S,
+    STT_LOAD_KV_HIGH,
+    STT_LOAD_LAG_BUDGET_S,
+    STT_LOAD_WAITING_HIGH,
+    STT_LOAD_MIN_BACKLOG_SCALE,
+    STT_LOAD_MIN_UTTERANCE_SCALE,
+)
 
 from .settings import load_settings
-from .vllm import build_vllm_realtime
+from .replicas import build_replica_servings
+from .vllm import SharedEngine, build_vllm_realtime
+from .metrics import read_engine_load, read_replica_loads
 
 logger = logging.getLogger(__name__)
 
 
-async def build_runtime_deps() -> RuntimeDeps:
-    settings: AppSettings = load_settings()
+def _engine_stats_usable(client_config: dict[str, Any] | None) -> bool:
+    # With several frontends, vLLM sends each step's scheduler stats to only one of them,
+    # so every frontend's gauges are stale and partial (see src.runtime.metrics).
+    return not client_config or int(client_config["client_count"]) <= 1
 
-    engine_stack, _engine_client, _serving_models, serving_realtime, tuned_settings = await build_vllm_realtime(
-        settings
+
+def _no_engine_load() -> EngineLoad:
+    return EngineLoad(running=0, waiting=0, kv_cache_usage=0.0)
+
+
+def _start_load_controller(
+    utterance_slots: UtteranceSlots, feed_scheduler: FeedScheduler, client_config: dict[str, Any] | None
+) -> LoadController:
+    # Sheds load from engine stats before latency collapses (see LoadController); without
+    # usable engine stats, from this frontend's own feed lag alone.
+    load_controller = LoadController(
+        read_load=read_engine_load if _engine_stats_usable(client_config) else _no_engine_load,
+        utterance_slots=utterance_slots,
+        feed_scheduler=feed_scheduler,
+        poll_s=STT_LOAD_POLL_S,
+        kv_high=STT_LOAD_KV_HIGH,
+        waiting_high=STT_LOAD_WAITING_HIGH,
+        lag_budget_s=STT_LOAD_LAG_BUDGET_S,
+        min_backlog_scale=STT_LOAD_MIN_BACKLOG_SCALE,
+        min_utterance_scale=STT_LOAD_MIN_UTTERANCE_SCALE,
+    )
+    load_controller.start()
+    return load_controller
+
+
+def _build_replica_router(
+    engine_client: Any,
+    serving_models: Any,
+    serving_realtime: Any,
+    tuned_settings: AppSettings,
+    client_config: dict[str, Any] | None,
+) -> ReplicaRouter:
+    # Engine replicas (vLLM data parallelism): each new vLLM request goes to the least loaded,
+    # by this frontend's own requests only when engine stats are not usable.
+    replicas = int(tuned_settings.vllm.data_parallel_size)
+    servings = build_replica_servings(engine_client, serving_models, serving_realtime, replicas)
+    read_loads = read_replica_loads if _engine_stats_usable(client_config) else None
+    return ReplicaRouter(servings, read_loads=read_loads)
+
+
+def _build_feed_scheduler(max_utterances: int) -> FeedScheduler:
+    # One scheduler feeds audio into vLLM for every connection (see FeedScheduler).
+    return FeedScheduler(
+        quantum_samples=int(STT_FEED_QUANTUM_SECONDS * ASR_SAMPLE_RATE_HZ),
+        frame_samples=ASR_FRAME_SAMPLES,
+        max_inflight_samples=int(STT_FEED_INFLIGHT_SECONDS_PER_UTTERANCE * max_utterances * ASR_SAMPLE_RATE_HZ),
+    )
+
+
+def _frontend_share(total: int, client_config: dict[str, Any] | None) -> int:
+    # Frontend workers (see src.frontends) split node-wide limits evenly.
+    workers = int(client_config["client_count"]) if client_config else 1
+    return max(1, math.ceil(total / max(1, workers)))
+
+
+def _max_connections(configured: int, max_utterances: int, client_config: dict[str, Any] | None) -> int:
+    if configured <= 0:
+        # Auto: idle connections hold no sequence, so admit several per utterance slot.
+        return math.ceil(max_utterances * CONNECTIONS_PER_UTTERANCE_SLOT)
+    return _frontend_share(configured, client_config)
+
+
+async def build_runtime_deps(
+    *, shared_engine: SharedEngine | None = None, client_config: dict[str, Any] | None = None
+) -> RuntimeDeps:
+    engine_stack, engine_client, serving_models, serving_realtime, tuned_settings = await build_vllm_realtime(
+        load_settings(), shared_engine=shared_engine, client_config=client_config
+    )
+    replica_router = _build_replica_router(
+        engine_client, serving_models, serving_realtime, tuned_settings, client_config
     )
 
+    audio_pool = AudioWorkerPool(workers=STT_AUDIO_DECODE_WORKERS, max_pending=STT_AUDIO_DECODE_MAX_PENDING)
+
+    max_utterances = tuned_settings.limits.max_active_utterances
+    if max_utterances <= 0:
+        # Auto: one active utterance per vLLM sequence, on every engine replica.
+        max_utterances = int(tuned_settings.vllm.max_num_seqs) * replica_router.replicas
+    max_utterances = _frontend_share(max_utterances, client_config)
+    utterance_slots = UtteranceSlots(capacity=max_utterances, low_priority_share=LOW_PRIORITY_UTTERANCE_SHARE)
+    feed_scheduler = _build_feed_scheduler(max_utterances)
+
+    load_controller = _start_load_controller(utterance_slots, feed_scheduler, client_config)
+
     realtime_bridge = RealtimeBridge(
         serving_realtime=serving_realtime,
         allowed_model_name=tuned_settings.model.served_model_name,
+        audio_pool=audio_pool,
+        utterance_slots=utterance_slots,
+        feed_scheduler=feed_scheduler,
+        load_controller=load_controller,
+        replica_router=replica_router,
     )
 
-    max_connections = tuned_settings.limits.max_concurrent_connections
-    if max_connections <= 0:
-        # Auto: default to vLLM's tuned sequence capacity.
-        max_connections = int(tuned_settings.vllm.max_num_seqs)
+    batch_transcriber = BatchTranscriber(
+        utterance_slots=utterance_slots,
+        replica_router=replica_router,
+        max_concurrency=_frontend_share(STT_BATCH_MAX_CONCURRENCY, client_config),
+    )
+
+    max_connections = _max_connections(tuned_settings.limits.max_concurrent_connections, max_utterances, client_config)
 
     tuned_settings = AppSettings(
         auth=tuned_settings.auth,
         limits=LimitsSettings(
             max_concurrent_connections=max_connections,
+            max_active_utterances=max_utterances,
         ),
         websocket=tuned_settings.websocket,
         model=tuned_settings.model,
         vllm=tuned_settings.vllm,
     )
 
-    connections = ConnectionManager(max_connections=tuned_settings.limits.max_concurrent_connections)
+    connections = ConnectionManager(
+        max_connections=tuned_settings.limits.max_concurrent_connections,
+        max_waiting=WS_WAITING_ROOM_MAX,
+    )
 
     return RuntimeDeps(
         connections=connections,
+        utterance_slots=utterance_slots,
+        load_controller=load_controller,
+        key_quotas=KeyQuotas(tuned_settings.auth.key_quotas),
+        replica_router=replica_router,
         realtime_bridge=realtime_bridge,
+        batch_transcriber=batch_transcriber,
+        audio_pool=audio_pool,
         settings=tuned_settings,
         _engine_stack=engine_stack,
     )
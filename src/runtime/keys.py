@@ -0,0 +1,99 @@
+"""API key registry (accepted keys, their priority classes and quotas).
+
+Keys come from VOXTRAL_API_KEY, VOXTRAL_API_KEY_PRIORITIES and the optional JSON file
+named by VOXTRAL_API_KEYS_FILE::
+
+    {"keys": [{"key": "tenant-a", "priority": "high", "max_connections": 50,
+               "max_utterances": 8, "audio_seconds_per_window": 3600,
+               "connects_per_window": 120, "window_s": 60}]}
+
+Every field but ``key`` is optional; missing quotas use the KEY_* defaults. A file
+entry overrides an env-configured key of the same value.
+"""
+
+from __future__ import annotations
+
+import json
+import dataclasses
+from typing import Any
+from pathlib import Path
+
+from src.state.settings import KeyQuotaSettings
+from src.config.limits import PRIORITY_RANKS, PRIORITY_DEFAULT
+from src.config.quotas import (
+    KEY_MAX_UTTERANCES,
+    KEY_QUOTA_WINDOW_S,
+    KEY_MAX_CONNECTIONS,
+    KEY_CONNECTS_PER_WINDOW,
+    KEY_AUDIO_SECONDS_PER_WINDOW,
+)
+
+_QUOTA_FIELDS: frozenset[str] = frozenset(field.name for field in dataclasses.fields(KeyQuotaSettings))
+
+
+def default_key_quota() -> KeyQuotaSettings:
+    return KeyQuotaSettings(
+        max_connections=KEY_MAX_CONNECTIONS,
+        max_utterances=KEY_MAX_UTTERANCES,
+        audio_seconds_per_window=KEY_AUDIO_SECONDS_PER_WINDOW,
+        connects_per_window=KEY_CONNECTS_PER_WINDOW,
+        window_s=KEY_QUOTA_WINDOW_S,
+    )
+
+
+def _parse_entry(entry: Any, defaults: KeyQuotaSettings) -> tuple[str, str, KeyQuotaSettings]:
+    if not isinstance(entry, dict):
+        raise ValueError("each API key entry must be an object")
+    key = str(entry.get("key") or "").strip()
+    if not key:
+        raise ValueError("API key entry is missing 'key'")
+    priority = str(entry.get("priority") or PRIORITY_DEFAULT).strip().lower()
+    if priority not in PRIORITY_RANKS:
+        raise ValueError(f"unknown priority class {priority!r} (expected one of {sorted(PRIORITY_RANKS)})")
+    unknown = set(entry) - _QUOTA_FIELDS - {"key", "priority"}
+    if unknown:
+        raise ValueError(f"unknown API key fields: {sorted(unknown)}")
+    overrides: dict[str, Any] = {}
+    for name in _QUOTA_FIELDS & set(entry):
+        value = entry[name]
+        if isinstance(value, bool) or not isinstance(value, int | float) or value < 0:
+            raise ValueError(f"{name} must be a non-negative number")
+        overrides[name] = type(getattr(defaults, name))(value)
+    if overrides.get("window_s", defaults.window_s) <= 0:
+        raise ValueError("window_s must be positive")
+    return key, priority, dataclasses.replace(defaults, **overrides)
+
+
+def read_keys_file(path: str | Path, *, defaults: KeyQuotaSettings) -> dict[str, tuple[str, KeyQuotaSettings]]:
+    """Parse a keys file into key -> (priority class, quotas); raise ValueError if it is malformed."""
+    try:
+        document = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise ValueError(f"cannot read API keys file {path}: {exc}") from exc
+    entries = document.get("keys") if isinstance(document, dict) else None
+    if not isinstance(entries, list):
+        raise ValueError(f"API keys file {path} must hold an object with a 'keys' list")
+    registry: dict[str, tuple[str, KeyQuotaSettings]] = {}
+    for entry in entries:
+        key, priority, quota = _parse_entry(entry, defaults)
+        registry[key] = (priority, quota)
+    return registry
+
+
+def build_key_registry(
+    *, api_key: str, api_key_priority: str, key_priorities: dict[str, str], keys_file: str
+) -> tuple[dict[str, str], dict[str, KeyQuotaSettings]]:
+    """Merge the env-configured keys and the keys file into (priorities, quotas) per key."""
+    defaults = default_key_quota()
+    priorities = dict(key_priorities)
+    if api_key:
+        priorities[api_key] = api_key_priority
+    quotas = dict.fromkeys(priorities, defaults)
+    if keys_file:
+        for key, (priority, quota) in read_keys_file(keys_file, defaults=defaults).items():
+            priorities[key] = priority
+            quotas[key] = quota
+    return priorities, quotas
+
+
+__all__ = ["build_key_registry", "default_key_quota", "read_keys_file"]
@@ -0,0 +1,50 @@
+"""Engine load readings from vLLM's in-process Prometheus metrics.
+
+The gauges are recorded from the scheduler stats the engine sends this process. With
+several frontends (``src.frontends``) vLLM sends each step's stats to only one of them,
+so every frontend's readings are stale and partial; runtime dependencies skip them there.
+"""
+
+from __future__ import annotations
+
+from vllm.v1.metrics.reader import Gauge, get_metrics_snapshot
+
+from src.admission.load import EngineLoad
+
+_LOAD_GAUGES: frozenset[str] = frozenset({
+    "vllm:num_requests_running",
+    "vllm:num_requests_waiting",
+    "vllm:kv_cache_usage_perc",
+})
+
+
+def read_replica_loads() -> dict[int, EngineLoad]:
+    """Scheduler state per engine replica (data-parallel rank; the engine client records it every step)."""
+    readings: dict[int, dict[str, float]] = {}
+    for metric in get_metrics_snapshot():
+        if not isinstance(metric, Gauge) or metric.name not in _LOAD_GAUGES:
+            continue
+        engine = str(metric.labels.get("engine") or "0")
+        rank = int(engine) if engine.isdigit() else 0
+        readings.setdefault(rank, {})[metric.name] = metric.value
+    return {
+        rank: EngineLoad(
+            running=int(values.get("vllm:num_requests_running", 0.0)),
+            waiting=int(values.get("vllm:num_requests_waiting", 0.0)),
+            kv_cache_usage=float(values.get("vllm:kv_cache_usage_perc", 0.0)),
+        )
+        for rank, values in readings.items()
+    }
+
+
+def read_engine_load() -> EngineLoad:
+    """Sum scheduler state across replicas (KV cache usage is the fullest replica's)."""
+    loads = read_replica_loads().values()
+    return EngineLoad(
+        running=sum(load.running for load in loads),
+        waiting=sum(load.waiting for load in loads),
+        kv_cache_usage=max((load.kv_cache_usage for load in loads), default=0.0),
+    )
+
+
+__all__ = ["read_engine_load", "read_replica_loads"]
@@ -0,0 +1,40 @@
+"""Realtime serving objects pinned to vLLM data-parallel engine replicas."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from vllm.entrypoints.openai.realtime.serving import OpenAIServingRealtime
+
+
+class PinnedEngineClient:
+    """Engine client whose requests all go to one data-parallel rank.
+
+    vLLM's realtime connection submits through ``serving.engine_client.generate``;
+    pinning the rank here lets ReplicaRouter pick the replica instead of vLLM's own
+    balancer. Everything else is delegated to the shared client.
+    """
+
+    def __init__(self, client: Any, rank: int) -> None:
+        self._client = client
+        self._rank = int(rank)
+
+    def generate(self, *args: Any, **kwargs: Any) -> Any:
+        kwargs["data_parallel_rank"] = self._rank
+        return self._client.generate(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+
+def build_replica_servings(engine_client: Any, serving_models: Any, serving_realtime: Any, replicas: int) -> list[Any]:
+    """One OpenAIServingRealtime per engine replica (the shared one when there is a single replica)."""
+    if replicas <= 1:
+        return [serving_realtime]
+    return [
+        OpenAIServingRealtime(PinnedEngineClient(engine_client, rank), serving_models, request_logger=None)
+        for rank in range(replicas)
+    ]
+
+
+__all__ = ["PinnedEngineClient", "build_replica_servings"]
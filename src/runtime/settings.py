@@ -6,13 +6,22 @@ exposed here as structured dataclasses for the rest of the server.
 
 from __future__ import annotations
 
-from src.config.secrets import VOXTRAL_API_KEY
+from src.config.limits import (
+    MAX_ACTIVE_UTTERANCES,
+    MAX_CONCURRENT_CONNECTIONS,
+)
 from src.config.websocket import (
     WS_IDLE_TIMEOUT_S,
     WS_WATCHDOG_TICK_S,
     WS_INBOUND_QUEUE_MAX,
     WS_MAX_CONNECTION_DURATION_S,
 )
+from src.config.secrets import (
+    VOXTRAL_API_KEY,
+    VOXTRAL_API_KEYS_FILE,
+    VOXTRAL_API_KEY_PRIORITY,
+    VOXTRAL_API_KEY_PRIORITIES,
+)
 from src.state.settings import (
     AppSettings,
     AuthSettings,
@@ -28,9 +37,6 @@ from src.config.models import (
     VOXTRAL_SERVED_MODEL_NAME,
     VOXTRAL_TRANSCRIPTION_DELAY_MS,
 )
-from src.config.limits import (
-    MAX_CONCURRENT_CONNECTIONS,
-)
 from src.config.vllm import (
     VLLM_DTYPE,
     VLLM_LOAD_FORMAT,
@@ -39,20 +45,34 @@ from src.config.vllm import (
     VLLM_ENFORCE_EAGER,
     VLLM_MAX_MODEL_LEN,
     VLLM_KV_CACHE_DTYPE,
-    VLLM_CALCULATE_KV_SCALES,
     VLLM_TOKENIZER_MODE,
     VLLM_COMPILATION_CONFIG,
+    VLLM_DATA_PARALLEL_SIZE,
+    VLLM_CALCULATE_KV_SCALES,
     VLLM_DISABLE_COMPILE_CACHE,
     VLLM_GPU_MEMORY_UTILIZATION,
     VLLM_MAX_NUM_BATCHED_TOKENS,
 )
 
+from .keys import build_key_registry
+
+
+def _auth_settings() -> AuthSettings:
+    key_priorities, key_quotas = build_key_registry(
+        api_key=VOXTRAL_API_KEY,
+        api_key_priority=VOXTRAL_API_KEY_PRIORITY,
+        key_priorities=VOXTRAL_API_KEY_PRIORITIES,
+        keys_file=VOXTRAL_API_KEYS_FILE,
+    )
+    return AuthSettings(api_key=VOXTRAL_API_KEY, key_priorities=key_priorities, key_quotas=key_quotas)
+
 
 def load_settings() -> AppSettings:
     return AppSettings(
-        auth=AuthSettings(api_key=VOXTRAL_API_KEY),
+        auth=_auth_settings(),
         limits=LimitsSettings(
             max_concurrent_connections=MAX_CONCURRENT_CONNECTIONS,
+            max_active_utterances=MAX_ACTIVE_UTTERANCES,
         ),
         websocket=WebSocketSettings(
             idle_timeout_s=WS_IDLE_TIMEOUT_S,
@@ -81,6 +101,7 @@ def load_settings() -> AppSettings:
             load_format=VLLM_LOAD_FORMAT,
             compilation_config=VLLM_COMPILATION_CONFIG,
             disable_compile_cache=VLLM_DISABLE_COMPILE_CACHE,
+            data_parallel_size=VLLM_DATA_PARALLEL_SIZE,
         ),
     )
 
@@ -9,12 +9,16 @@ from contextlib import suppress, asynccontextmanager
 with suppress(RuntimeError):
     multiprocessing.set_start_method("spawn", force=True)
 
-from fastapi import FastAPI, WebSocket  # noqa: E402
 from fastapi.responses import ORJSONResponse  # noqa: E402
+from fastapi import FastAPI, Request, WebSocket  # noqa: E402
 
+from src.config.batch import BATCH_ENDPOINT_PATH  # noqa: E402
 from src.config.websocket import WS_ENDPOINT_PATH  # noqa: E402
+from src.handlers.replicas import handle_replicas  # noqa: E402
 from src.runtime.logging import configure_logging  # noqa: E402
+from src.config.vllm import REPLICAS_ENDPOINT_PATH  # noqa: E402
 from src.runtime.dependencies import build_runtime_deps  # noqa: E402
+from src.handlers.batch import handle_batch_transcription  # noqa: E402
 from src.handlers.websocket.manager import handle_websocket_connection  # noqa: E402
 
 logger = logging.getLogger(__name__)
@@ -24,7 +28,11 @@ configure_logging()
 
 @asynccontextmanager
 async def _lifespan(app: FastAPI):
-    runtime_deps = await build_runtime_deps()
+    # Set by src.frontends when this process is one of several frontend workers.
+    runtime_deps = await build_runtime_deps(
+        shared_engine=getattr(app.state, "shared_engine", None),
+        client_config=getattr(app.state, "engine_client_config", None),
+    )
     app.state.runtime_deps = runtime_deps
     logger.info("runtime: ready")
     try:
@@ -53,9 +61,25 @@ async def healthz() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get(REPLICAS_ENDPOINT_PATH)
+async def replicas(request: Request) -> ORJSONResponse:
+    runtime_deps = getattr(app.state, "runtime_deps", None)
+    if runtime_deps is None:
+        raise RuntimeError("Runtime dependencies are not initialized")
+    return handle_replicas(request, runtime_deps)
+
+
 @app.websocket(WS_ENDPOINT_PATH)
 async def websocket_endpoint(websocket: WebSocket) -> None:
     runtime_deps = getattr(app.state, "runtime_deps", None)
     if runtime_deps is None:
         raise RuntimeError("Runtime dependencies are not initialized")
     await handle_websocket_connection(websocket, runtime_deps)
+
+
+@app.post(BATCH_ENDPOINT_PATH)
+async def batch_endpoint(request: Request) -> ORJSONResponse:
+    runtime_deps = getattr(app.state, "runtime_deps", None)
+    if runtime_deps is None:
+        raise RuntimeError("Runtime dependencies are not initialized")
+    return await handle_batch_transcription(request, runtime_deps)
@@ -5,6 +5,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from collections.abc import Callable
 
+from src.config.limits import PRIORITY_DEFAULT
+from src.config.websocket import WS_PARTIAL_INTERVAL_MS
+
 
 @dataclass(slots=True)
 class EnvelopeState:
@@ -12,7 +15,22 @@ class EnvelopeState:
     request_id: str = "unknown"
     active_request_id: str | None = None
     inflight_request_id: str | None = None
+    # Utterance that binary audio frames are bound to (tracked on the receive side,
+    # ahead of the inbound queue, so frames right after a commit bind correctly).
+    binary_request_id: str | None = None
+    # Negotiated via session.update; also tracked receive-side to validate binary frames.
+    input_audio_format: str = "pcm16"
+    # Outbound token coalescing window (session.update partial_interval_ms; 0 = per delta).
+    partial_interval_ms: int = WS_PARTIAL_INTERVAL_MS
+    # Priority class of the connection's API key (admission, feeding and backlog budgets).
+    priority: str = PRIORITY_DEFAULT
+    # API key the connection authenticated with (per-key quotas).
+    api_key: str = ""
     touch: Callable[[], None] | None = None
+    # Counts decoded audio seconds against the key's quota; raises RateLimitError over it.
+    charge_audio: Callable[[float], None] | None = None
+    # Wakes the connection's own message loop (e.g. to tear down a preempted utterance).
+    wake: Callable[[], None] | None = None
 
 
 __all__ = ["EnvelopeState"]
@@ -9,23 +9,37 @@ from typing import TYPE_CHECKING, Any
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from src.handlers.quotas import KeyQuotas
+    from src.audio.pool import AudioWorkerPool
     from src.state.settings import AppSettings
+    from src.admission.load import LoadController
     from src.realtime.bridge import RealtimeBridge
+    from src.realtime.batch import BatchTranscriber
+    from src.admission.replicas import ReplicaRouter
+    from src.admission.utterances import UtteranceSlots
     from src.handlers.connections import ConnectionManager
 
 
 @dataclass(slots=True)
 class RuntimeDeps:
     connections: ConnectionManager
+    utterance_slots: UtteranceSlots
+    load_controller: LoadController
+    key_quotas: KeyQuotas
+    replica_router: ReplicaRouter
     realtime_bridge: RealtimeBridge
+    batch_transcriber: BatchTranscriber
+    audio_pool: AudioWorkerPool
     settings: AppSettings
     _engine_stack: Any
 
     async def shutdown(self) -> None:
+        await self.load_controller.stop()
         try:
             await self._engine_stack.aclose()
         except Exception:
             logger.exception("runtime shutdown failed")
+        self.audio_pool.shutdown()
 
 
 __all__ = ["RuntimeDeps"]
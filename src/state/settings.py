@@ -7,14 +7,29 @@ from pathlib import Path
 from dataclasses import dataclass
 
 
+@dataclass(frozen=True, slots=True)
+class KeyQuotaSettings:
+    # Per API key; 0 disables a limit.
+    max_connections: int = 0
+    max_utterances: int = 0
+    audio_seconds_per_window: float = 0.0
+    connects_per_window: int = 0
+    window_s: float = 60.0
+
+
 @dataclass(frozen=True, slots=True)
 class AuthSettings:
     api_key: str
+    # Every accepted API key (api_key included) -> its priority class.
+    key_priorities: dict[str, str]
+    # Every accepted API key -> its quotas.
+    key_quotas: dict[str, KeyQuotaSettings]
 
 
 @dataclass(frozen=True, slots=True)
 class LimitsSettings:
     max_concurrent_connections: int
+    max_active_utterances: int
 
 
 @dataclass(frozen=True, slots=True)
@@ -49,6 +64,7 @@ class VllmSettings:
     load_format: str
     compilation_config: dict[str, Any] | None
     disable_compile_cache: bool
+    data_parallel_size: int
 
 
 @dataclass(frozen=True, slots=True)
@@ -63,6 +79,7 @@ class AppSettings:
 __all__ = [
     "AppSettings",
     "AuthSettings",
+    "KeyQuotaSettings",
     "LimitsSettings",
     "ModelSettings",
     "VllmSettings",
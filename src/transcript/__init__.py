@@ -0,0 +1,7 @@
+"""Transcript assembly helpers (overlap de-duplication, segment stitching).
+
+Shared by the realtime and batch paths; keep this package free of vLLM imports so it
+can be unit tested on CPU-only hosts.
+"""
+
+__all__: list[str] = []
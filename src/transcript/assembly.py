@@ -0,0 +1,99 @@
+"""Incremental assembly of one client-visible transcript from rolled vLLM segments."""
+
+from __future__ import annotations
+
+from .overlap import DEDUP_WINDOW_CHARS, find_overlap
+
+
+class TranscriptAssembler:
+    """Merge per-segment model text into a single stream of client token deltas.
+
+    Committed segments are kept as an append-only list plus their last
+    DEDUP_WINDOW_CHARS characters, and the client has always been sent the committed
+    text followed by some prefix of the live segment. Each delta therefore only
+    compares the live segment against what was already sent of it, so its cost does
+    not grow with how long the stream has been running.
+    """
+
+    def __init__(self) -> None:
+        self._committed: list[str] = []
+        self._committed_tail = ""
+        self._segment_text = ""
+        # Part of the live segment (after the de-duplication cut) already sent to the client.
+        self._visible_segment = ""
+        self._dedup_prefix_len = 0
+        # False when the current segment starts without replayed overlap audio.
+        self._dedup_enabled = True
+        # Model steps (one transcription.delta each) seen in the current segment, and how many
+        # leading steps may re-transcribe audio the previous segment already emitted text for
+        # (None: unknown, de-duplicate by text matching alone).
+        self._segment_steps = 0
+        self._repeated_steps: int | None = None
+        # Segment text cut by step position; text matching continues from there.
+        self._step_cut_len = 0
+
+    @property
+    def text(self) -> str:
+        """The committed transcript (every finished segment, de-duplicated)."""
+        if len(self._committed) > 1:
+            self._committed = ["".join(self._committed)]
+        return self._committed[0] if self._committed else ""
+
+    def expect_overlap(self, replayed: bool, *, repeated_steps: int | None = None) -> None:
+        """Declare whether the next segment starts with replayed audio to de-duplicate."""
+        self._dedup_enabled = bool(replayed)
+        self._repeated_steps = repeated_steps
+
+    def add_delta(self, delta: object) -> str:
+        """Account for one model step; return the text newly visible to the client, if any."""
+        self._segment_steps += 1
+        if not isinstance(delta, str) or not delta:
+            return ""
+        self._segment_text += delta
+        self._update_dedup_prefix()
+        live = self._segment_text[self._dedup_prefix_len :]
+        if not live.startswith(self._visible_segment):
+            return ""
+        out = live[len(self._visible_segment) :]
+        if out:
+            self._visible_segment = live
+        return out
+
+    def finish_segment(self, text: object) -> str:
+        """Commit the live segment (``text`` replaces it when given); return any unsent tail."""
+        if isinstance(text, str):
+            self._segment_text = text
+        self._update_dedup_prefix()
+        live = self._segment_text[self._dedup_prefix_len :]
+        out = live[len(self._visible_segment) :] if live.startswith(self._visible_segment) else ""
+        if live:
+            self._committed.append(live)
+            self._committed_tail = (self._committed_tail + live)[-DEDUP_WINDOW_CHARS:]
+        self._visible_segment = ""
+        self._segment_text = ""
+        self._dedup_prefix_len = 0
+        self._segment_steps = 0
+        self._step_cut_len = 0
+        return out
+
+    def _update_dedup_prefix(self) -> None:
+        if not self._dedup_enabled or not self._committed_tail or not self._segment_text:
+            return
+
+        if self._repeated_steps is not None and self._segment_steps <= self._repeated_steps:
+            # Time-aligned: drop whatever the model says while it is still on replayed audio,
+            # however it words it this time.
+            self._dedup_prefix_len = self._step_cut_len = len(self._segment_text)
+            return
+
+        # Past the step window (or without one), words the previous segment already emitted
+        # can still follow, e.g. from its final flush: match them against the committed text.
+        start = self._step_cut_len
+        overlap = start + find_overlap(self._committed_tail, self._segment_text[start : start + DEDUP_WINDOW_CHARS])
+        if overlap <= self._dedup_prefix_len:
+            return
+        if self._segment_text[overlap:].startswith(self._visible_segment):
+            self._dedup_prefix_len = overlap
+
+
+__all__ = ["TranscriptAssembler"]
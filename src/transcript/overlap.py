@@ -0,0 +1,61 @@
+"""Text overlap detection between consecutive transcript segments."""
+
+from __future__ import annotations
+
+import numpy as np
+
+# Only bounded windows of each side are compared, for performance.
+DEDUP_WINDOW_CHARS: int = 2000
+
+# Below this many comparable characters a direct scan beats the vectorised hash setup.
+_SHORT_OVERLAP_CHARS: int = 96
+
+# Polynomial hash over code points, arithmetic mod 2**64 (numpy uint64 wraps). The base
+# is odd, so it is invertible and suffix hashes can be re-based by multiplying.
+_HASH_BASE: int = 0x100000001B3
+
+
+def _hash_powers(base: int, n: int) -> np.ndarray:
+    powers: np.ndarray = np.full(n, base, dtype=np.uint64)
+    powers[0] = 1
+    return np.cumprod(powers, dtype=np.uint64)
+
+
+_POWERS: np.ndarray = _hash_powers(_HASH_BASE, DEDUP_WINDOW_CHARS)
+_INV_POWERS: np.ndarray = _hash_powers(pow(_HASH_BASE, -1, 2**64), DEDUP_WINDOW_CHARS)
+
+
+def _code_points(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+
+
+def _scan_overlap(a_suffix: str, b_prefix: str) -> int:
+    for i in range(min(len(a_suffix), len(b_prefix)), 0, -1):
+        if a_suffix.endswith(b_prefix[:i]):
+            return i
+    return 0
+
+
+def find_overlap(a_suffix: str, b_prefix: str) -> int:
+    """Return length of the longest suffix of a_suffix that is a prefix of b_prefix.
+
+    Linear time: hashes of every prefix of ``b_prefix`` and every suffix of ``a_suffix`` are
+    built with two cumulative sums, and only hash-equal lengths are compared as text
+    (longest first), so a collision can never produce a wrong answer.
+    """
+    n = min(len(a_suffix), len(b_prefix))
+    if n <= _SHORT_OVERLAP_CHARS:
+        return _scan_overlap(a_suffix, b_prefix)
+    a, b = a_suffix[-n:], b_prefix[:n]
+    powers = _POWERS[:n] if n <= len(_POWERS) else _hash_powers(_HASH_BASE, n)
+    inv_powers = _INV_POWERS[:n] if n <= len(_INV_POWERS) else _hash_powers(pow(_HASH_BASE, -1, 2**64), n)
+    # prefix_hash[i - 1] = hash(b[:i]); suffix_hash[i - 1] = hash(a[-i:]) once shifted down by x**(n - i).
+    prefix_hash = np.cumsum(_code_points(b) * powers, dtype=np.uint64)
+    suffix_hash = np.cumsum((_code_points(a) * powers)[::-1], dtype=np.uint64) * inv_powers[::-1]
+    for k in np.flatnonzero(prefix_hash == suffix_hash)[::-1]:
+        if a.endswith(b[: int(k) + 1]):
+            return int(k) + 1
+    return 0
+
+
+__all__ = ["DEDUP_WINDOW_CHARS", "find_overlap"]
@@ -0,0 +1,22 @@
+"""Join independently transcribed, audio-overlapping segments into one transcript."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from .overlap import DEDUP_WINDOW_CHARS, find_overlap
+
+
+def stitch_segments(texts: Iterable[str]) -> str:
+    """Concatenate segment texts in order, dropping text each segment repeats from the previous one.
+
+    Uses the same suffix/prefix de-duplication as realtime segment rolls.
+    """
+    merged = ""
+    for text in texts:
+        cut = find_overlap(merged[-DEDUP_WINDOW_CHARS:], text[:DEDUP_WINDOW_CHARS])
+        merged += text[cut:]
+    return merged
+
+
+__all__ = ["stitch_segments"]
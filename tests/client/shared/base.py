@@ -35,10 +35,12 @@ class WSClientBase:
         server: str,
         secure: bool = False,
         debug: bool = False,
+        binary: bool = False,
     ) -> None:
         self.server = server
         self.secure = secure
         self.debug = debug
+        self.binary = binary
         self.url = build_url(server, secure)
 
         # Timing fields used by printing helpers.
@@ -74,7 +76,7 @@ class WSClientBase:
             self.handshake_elapsed_s = handshake_elapsed
 
     def _create_streamer(self, pcm_bytes: bytes) -> AudioStreamer:
-        return _create_streamer_fn(pcm_bytes, self.debug)
+        return _create_streamer_fn(pcm_bytes, self.debug, binary=self.binary)
 
     async def _stream_audio_with_callback(
         self,
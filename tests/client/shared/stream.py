@@ -5,8 +5,8 @@ from __future__ import annotations
 from tests.utils.audio import AudioStreamer
 
 
-def create_streamer(pcm_bytes: bytes, debug: bool) -> AudioStreamer:
-    return AudioStreamer(pcm_bytes, debug=debug)
+def create_streamer(pcm_bytes: bytes, debug: bool, *, binary: bool = False) -> AudioStreamer:
+    return AudioStreamer(pcm_bytes, debug=debug, binary=binary)
 
 
 async def stream_audio_with_callback(
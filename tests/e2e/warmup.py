@@ -38,6 +38,7 @@ def main() -> int:
     parser.add_argument("--debug", action="store_true", help="Print debug info including raw server messages")
     parser.add_argument("--full-text", action="store_true", help="Print full transcribed text (default: truncate)")
     parser.add_argument("--voxtral-key", type=str, default=None, help="API key (overrides VOXTRAL_API_KEY env)")
+    parser.add_argument("--binary", action="store_true", help="Send audio as binary PCM16 frames (no base64/JSON)")
 
     args = parser.parse_args()
 
@@ -64,7 +65,7 @@ def main() -> int:
     print(dim(f"  file: {audio_path.name}"))
     print()
 
-    client = WarmupClient(args.server, args.secure, debug=args.debug)
+    client = WarmupClient(args.server, args.secure, debug=args.debug, binary=args.binary)
     res = asyncio.run(client.run_stream(pcm_bytes, debug=args.debug))
 
     if res.get("error"):
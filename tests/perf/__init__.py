@@ -0,0 +1,5 @@
+"""Runnable CPU microbenchmarks for server hot paths (not pytest unit tests).
+
+These scripts are intended to be executed from the repo root, e.g.:
+  python -m tests.perf.dedup
+"""
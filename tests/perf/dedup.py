@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Microbenchmark: per-delta cost of segment-boundary de-duplication vs window size."""
+
+from __future__ import annotations
+
+import argparse
+from functools import partial
+
+import numpy as np
+
+from tests.perf.timing import per_call_us, print_cost_table
+from src.transcript.overlap import DEDUP_WINDOW_CHARS, find_overlap
+
+_VOCAB = ["so", "the", "quick", "brown", "fox", "jumps", "over", "lazy", "dog", "and", "then", "we", "talk", "about"]
+
+
+def _brute_overlap(a_suffix: str, b_prefix: str) -> int:
+    # The previous implementation, kept here as the baseline.
+    for i in range(min(len(a_suffix), len(b_prefix)), 0, -1):
+        if a_suffix.endswith(b_prefix[:i]):
+            return i
+    return 0
+
+
+def _text(rng: np.random.Generator, n: int) -> str:
+    out = ""
+    while len(out) < n:
+        out += " " + str(rng.choice(_VOCAB))
+    return out[:n]
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Transcript de-duplication microbenchmark")
+    ap.add_argument("--windows", type=int, nargs="+", default=[50, 100, 250, 500, 1000, DEDUP_WINDOW_CHARS])
+    ap.add_argument("--number", type=int, default=200, help="Calls per timing run")
+    return ap.parse_args()
+
+
+def run(args: argparse.Namespace) -> None:
+    rng = np.random.default_rng(0)
+    rows = []
+    for window in args.windows:
+        # One dedup check as done on a transcription.delta: committed tail vs live segment head,
+        # both `window` chars. The worst case is no overlap, where every length is tried.
+        tail = _text(rng, window)
+        head = (tail[-window // 20 :] + _text(rng, window))[:window]
+        unrelated = _text(rng, window)
+        rows.append((
+            window,
+            f"{per_call_us(partial(_brute_overlap, tail, head), number=args.number):.1f}",
+            f"{per_call_us(partial(find_overlap, tail, head), number=args.number):.1f}",
+            f"{per_call_us(partial(_brute_overlap, tail, unrelated), number=args.number):.1f}",
+            f"{per_call_us(partial(find_overlap, tail, unrelated), number=args.number):.1f}",
+        ))
+    header = ("window", "brute us", "linear us", "brute us (none)", "linear us (none)")
+    print_cost_table("DEDUP COST PER DELTA", header, rows)
+
+
+def main() -> None:
+    run(parse_args())
+
+
+if __name__ == "__main__":
+    main()
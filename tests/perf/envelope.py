@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Microbenchmark: per-event cost of handing vLLM realtime events to the envelope layer.
+
+Needs the server environment (vLLM installed), but no GPU or running server.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+from typing import Any, cast
+from functools import partial
+from collections.abc import Iterator, Coroutine
+
+from fastapi import WebSocket
+from vllm.entrypoints.openai.engine.protocol import UsageInfo
+from vllm.entrypoints.openai.realtime.connection import RealtimeConnection
+from vllm.entrypoints.openai.realtime.protocol import TranscriptionDone, TranscriptionDelta
+
+from src.state import EnvelopeState
+from src.realtime.envelope import EnvelopeWebSocket
+from tests.perf.timing import per_call_us, print_cost_table
+from src.realtime.connection import EnvelopeRealtimeConnection
+
+
+class _SinkWebSocket:
+    """Stands in for the client socket; only counts frames."""
+
+    def __init__(self) -> None:
+        self.frames = 0
+
+    async def send_text(self, data: str) -> None:
+        self.frames += 1
+
+
+def _drive(coro: Coroutine[Any, Any, None]) -> None:
+    # Nothing on this path awaits real I/O, so the coroutine finishes in one step.
+    try:
+        coro.send(None)
+    except StopIteration:
+        return
+    raise RuntimeError("envelope send suspended unexpectedly")
+
+
+def _events(steps_per_segment: int) -> Iterator[TranscriptionDelta | TranscriptionDone]:
+    deltas = [TranscriptionDelta(delta=f" word{i}") for i in range(steps_per_segment)]
+    usage = UsageInfo(prompt_tokens=steps_per_segment, completion_tokens=steps_per_segment, total_tokens=0)
+    done = TranscriptionDone(text="".join(d.delta for d in deltas), usage=usage)
+    return itertools.cycle([*deltas, done])
+
+
+def _connection() -> EnvelopeRealtimeConnection:
+    state = EnvelopeState(session_id="sess-0123456789", request_id="req-0123456789")
+    ews = EnvelopeWebSocket(cast(WebSocket, _SinkWebSocket()), state)
+    return EnvelopeRealtimeConnection(ews, None)
+
+
+def _send_json(conn: EnvelopeRealtimeConnection, events: Iterator[Any]) -> None:
+    # The stock path: model_dump_json, then EnvelopeWebSocket.send_text parses it back.
+    _drive(RealtimeConnection.send(conn, next(events)))
+
+
+def _send_structured(conn: EnvelopeRealtimeConnection, events: Iterator[Any]) -> None:
+    _drive(conn.send(next(events)))
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Envelope hand-off microbenchmark")
+    ap.add_argument("--steps", type=int, nargs="+", default=[25, 250, 750], help="Deltas per segment")
+    ap.add_argument("--number", type=int, default=5000, help="Events per timing run")
+    return ap.parse_args()
+
+
+def run(args: argparse.Namespace) -> None:
+    rows = []
+    for steps in args.steps:
+        json_us = per_call_us(partial(_send_json, _connection(), _events(steps)), number=args.number)
+        structured_us = per_call_us(partial(_send_structured, _connection(), _events(steps)), number=args.number)
+        rows.append((steps, f"{json_us:.2f}", f"{structured_us:.2f}", f"{json_us / structured_us:.2f}x"))
+    print_cost_table("ENVELOPE COST PER EVENT", ("steps/segment", "json us", "structured us", "speedup"), rows)
+
+
+def main() -> None:
+    run(parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""Timing and table helpers shared by the microbenchmarks."""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable, Sequence
+
+from tests.data.printing import dim, section_header
+
+
+def per_call_us(fn: Callable[[], object], *, number: int, repeat: int = 5) -> float:
+    """Best-of-``repeat`` mean cost of one ``fn()`` call, in microseconds."""
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number * 1e6
+
+
+def print_cost_table(title: str, header: Sequence[str], rows: Sequence[Sequence[object]]) -> None:
+    widths = [max(len(str(cell)) for cell in col) for col in zip(header, *rows, strict=True)]
+    print(f"\n{section_header(title)}")
+    print(dim("  " + "  ".join(str(h).rjust(w) for h, w in zip(header, widths, strict=True))))
+    for row in rows:
+        print("  " + "  ".join(str(cell).rjust(w) for cell, w in zip(row, widths, strict=True)))
+    print()
+
+
+__all__ = ["per_call_us", "print_cost_table"]
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import pytest
+import numpy as np
+
+from src.transcript.assembly import TranscriptAssembler
+from src.transcript.overlap import DEDUP_WINDOW_CHARS, find_overlap
+
+
+class _MergedStringAssembler:
+    """The previous algorithm: rebuild and compare the whole transcript on every delta."""
+
+    def __init__(self) -> None:
+        self.committed = ""
+        self.visible = ""
+        self.segment = ""
+        self.cut = 0
+        self.enabled = True
+        self.steps = 0
+        self.repeated: int | None = None
+        self.step_cut = 0
+
+    def _update(self) -> None:
+        if not self.enabled or not self.committed or not self.segment:
+            return
+        if self.repeated is not None and self.steps <= self.repeated:
+            self.cut = self.step_cut = len(self.segment)
+            return
+        rest = self.segment[self.step_cut : self.step_cut + DEDUP_WINDOW_CHARS]
+        overlap = self.step_cut + find_overlap(self.committed[-DEDUP_WINDOW_CHARS:], rest)
+        if overlap > self.cut and (self.committed + self.segment[overlap:]).startswith(self.visible):
+            self.cut = overlap
+
+    def delta(self, delta: str) -> str:
+        self.steps += 1
+        if not delta:
+            return ""
+        self.segment += delta
+        self._update()
+        merged = self.committed + self.segment[self.cut :]
+        if not merged.startswith(self.visible):
+            return ""
+        out = merged[len(self.visible) :]
+        if out:
+            self.visible = merged
+        return out
+
+    def done(self, text: str | None) -> str:
+        if text is not None:
+            self.segment = text
+        self._update()
+        merged = self.committed + self.segment[self.cut :]
+        out = merged[len(self.visible) :] if merged.startswith(self.visible) else ""
+        self.committed = self.visible = merged
+        self.segment, self.cut, self.steps, self.step_cut = "", 0, 0, 0
+        return out
+
+
+def _words(rng: np.random.Generator, n: int) -> list[str]:
+    vocab = [" the", " quick", " brown", " fox", " jumps", " over", " lazy", " dog", " ça", " 日本"]
+    return [str(rng.choice(vocab)) if rng.random() < 0.8 else "" for _ in range(n)]
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_assembler_matches_merged_string_algorithm(seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    new, old = TranscriptAssembler(), _MergedStringAssembler()
+    previous: list[str] = []
+    for _ in range(12):
+        replayed = bool(rng.random() < 0.8)
+        repeated = None if rng.random() < 0.5 else int(rng.integers(0, 4))
+        new.expect_overlap(replayed, repeated_steps=repeated)
+        old.enabled, old.repeated = replayed, repeated
+        # Segments start by re-saying part of the previous one, as after a roll.
+        deltas = previous[-int(rng.integers(0, 6)) :] + _words(rng, int(rng.integers(1, 40)))
+        for delta in deltas:
+            assert new.add_delta(delta) == old.delta(delta)
+        final = None if rng.random() < 0.7 else "".join(deltas[:-1])
+        assert new.finish_segment(final) == old.done(final)
+        assert new.text == old.committed
+        previous = deltas
+
+
+def test_assembler_trims_replayed_steps_by_position() -> None:
+    tx = TranscriptAssembler()
+    assert tx.add_delta("hello") == "hello"
+    assert tx.add_delta(" world") == " world"
+    assert not tx.finish_segment(None)
+    tx.expect_overlap(True, repeated_steps=2)
+    assert not tx.add_delta("hullo")
+    assert not tx.add_delta(" world")
+    assert tx.add_delta(" again") == " again"
+    assert not tx.finish_segment(None)
+    assert tx.text == "hello world again"
+
+
+def _delayed_deltas(words: list[str], *, delay: int, decoded: int) -> list[str]:
+    # One delta per model step: a step's text is the word of the audio ``delay`` steps back.
+    return [words[step - delay] if delay <= step < decoded + delay else "" for step in range(len(words))]
+
+
+@pytest.mark.parametrize("delay", [0, 2, 5])
+def test_rolled_segment_with_transcription_delay_repeats_no_replayed_words(delay: int) -> None:
+    words = [f" w{i}" for i in range(40)]
+    cut, replay = 20, 7
+    tx = TranscriptAssembler()
+    sent = ""
+    # The first segment never decodes its last ``delay`` steps of audio.
+    for delta in _delayed_deltas(words[:cut], delay=delay, decoded=cut - delay):
+        sent += tx.add_delta(delta)
+    sent += tx.finish_segment(None)
+
+    # The next segment replays the last ``replay`` steps of audio, then continues.
+    tx.expect_overlap(True, repeated_steps=replay)
+    second = words[cut - replay :]
+    for delta in _delayed_deltas(second + [""] * delay, delay=delay, decoded=len(second)):
+        sent += tx.add_delta(delta)
+    sent += tx.finish_segment(None)
+
+    assert sent == tx.text == "".join(words)
+
+
+def test_text_matching_trims_repeats_that_follow_the_step_window() -> None:
+    tx = TranscriptAssembler()
+    assert tx.add_delta(" one two three") == " one two three"
+    assert not tx.finish_segment(None)
+    tx.expect_overlap(True, repeated_steps=1)
+    assert not tx.add_delta(" uno")
+    # The previous segment's final words, said again once the step window has passed.
+    assert tx.add_delta(" two three four") == " four"
+    assert not tx.finish_segment(None)
+    assert tx.text == " one two three four"
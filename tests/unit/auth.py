@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from src.handlers.websocket.auth import validate_api_key
+from src.handlers.websocket.auth import resolve_priority
 
 
-def test_validate_api_key_misconfigured() -> None:
-    assert validate_api_key("anything", "") is False
-
-
-def test_validate_api_key_matches() -> None:
-    assert validate_api_key("secret", "secret") is True
-    assert validate_api_key("wrong", "secret") is False
+def test_resolve_priority_maps_accepted_keys_only() -> None:
+    key_priorities = {"premium": "high", "bulk": "low"}
+    assert resolve_priority("premium", key_priorities) == "high"
+    assert resolve_priority("bulk", key_priorities) == "low"
+    assert resolve_priority("other", key_priorities) is None
+    assert resolve_priority("", {"": "normal"}) is None
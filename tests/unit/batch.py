@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import io
+import wave
+import asyncio
+
+import pytest
+import numpy as np
+
+from src.audio.pool import AudioWorkerPool
+from src.audio.segments import plan_segments
+from src.transcript.stitch import stitch_segments
+from src.config.batch import STT_BATCH_MAX_SECONDS
+from src.handlers.batch import read_upload, decode_upload, upload_byte_limit, run_until_disconnect
+
+
+@pytest.fixture
+def pool():
+    pool = AudioWorkerPool(workers=1, max_pending=4)
+    yield pool
+    pool.shutdown()
+
+
+def _wav(samples: np.ndarray, *, rate: int, channels: int) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(samples.astype("<i2").tobytes())
+    return buf.getvalue()
+
+
+class _Upload:
+    """Just enough of a Starlette request for read_upload and run_until_disconnect."""
+
+    def __init__(self, chunks: list[bytes], *, params: dict[str, str], content_length: int | None = None) -> None:
+        self.query_params = params
+        self.headers = {} if content_length is None else {"content-length": str(content_length)}
+        self.chunks = chunks
+        self.reads = 0
+        self.gone = asyncio.Event()
+
+    async def stream(self):
+        for chunk in self.chunks:
+            self.reads += 1
+            yield chunk
+
+    async def receive(self) -> dict[str, str]:
+        await self.gone.wait()
+        return {"type": "http.disconnect"}
+
+
+def test_plan_segments_overlaps_and_covers_the_recording() -> None:
+    spans = plan_segments(10_000, segment_samples=4_100, overlap_samples=1_050, frame_samples=100)
+    assert spans == [(0, 4_100), (3_100, 7_200), (6_200, 10_000)]
+    assert plan_segments(0, segment_samples=4_100, overlap_samples=0, frame_samples=100) == []
+    # Overlap never reaches the segment length, so the split always advances.
+    spans = plan_segments(250, segment_samples=100, overlap_samples=500, frame_samples=100)
+    assert spans == [(0, 100), (100, 200), (200, 250)]
+
+
+def test_stitch_segments_drops_repeated_boundary_text() -> None:
+    texts = ["the quick brown", " brown fox jumps", " jumps over"]
+    assert stitch_segments(texts) == "the quick brown fox jumps over"
+    assert stitch_segments(["a", "", "b"]) == "ab"
+
+
+async def test_decode_upload_reads_stereo_wav_at_model_rate(pool: AudioWorkerPool) -> None:
+    stereo = np.array([[100, 300], [-200, -400], [0, 10]], dtype="<i2")
+    samples = await decode_upload(_wav(stereo.ravel(), rate=16000, channels=2), {}, pool=pool)
+    np.testing.assert_array_equal(samples, [200, -300, 5])
+
+
+async def test_decode_upload_resamples_and_rejects_opus(pool: AudioWorkerPool) -> None:
+    raw = np.zeros(4800, dtype="<i2").tobytes()
+    samples = await decode_upload(raw, {"input_sample_rate": "48000"}, pool=pool)
+    assert abs(len(samples) - 1600) <= 16
+    with pytest.raises(ValueError):
+        await decode_upload(raw, {"input_audio_format": "opus"}, pool=pool)
+    with pytest.raises(ValueError):
+        await decode_upload(raw, {"input_sample_rate": "11025"}, pool=pool)
+
+
+def test_upload_byte_limit_follows_the_audio_format() -> None:
+    seconds = STT_BATCH_MAX_SECONDS
+    assert upload_byte_limit(b"\x00" * 64, {}) == int(seconds * 16000) * 2
+    assert upload_byte_limit(b"", {"input_sample_rate": "48000"}) == int(seconds * 48000) * 2
+    assert upload_byte_limit(b"", {"input_audio_format": "g711_ulaw"}) == int(seconds * 8000)
+    stereo_wav = _wav(np.zeros(8, dtype="<i2"), rate=24000, channels=2)
+    assert upload_byte_limit(stereo_wav, {}) == int(seconds * 24000 * 4) + 64 * 1024
+    with pytest.raises(ValueError):
+        upload_byte_limit(stereo_wav[:20], {})
+
+
+async def test_read_upload_stops_once_over_the_limit() -> None:
+    params = {"input_audio_format": "g711_alaw"}
+    max_bytes = upload_byte_limit(b"", params)
+    chunk = b"\xd5" * 8192
+
+    small = _Upload([chunk, chunk], params=params)
+    assert await read_upload(small) == (chunk * 2, max_bytes)
+
+    # A Content-Length over the bound is refused after the first chunk.
+    declared = _Upload([chunk] * 4, params=params, content_length=max_bytes + 1)
+    assert await read_upload(declared) == (None, max_bytes)
+    assert declared.reads == 1
+
+    # Without one, the read stops at the first chunk past the bound.
+    chunks_to_exceed = max_bytes // len(chunk) + 1
+    undeclared = _Upload([chunk] * (chunks_to_exceed + 10), params=params)
+    assert await read_upload(undeclared) == (None, max_bytes)
+    assert undeclared.reads == chunks_to_exceed
+
+
+async def test_run_until_disconnect_cancels_the_job_when_the_client_leaves() -> None:
+    upload = _Upload([], params={})
+    started = asyncio.Event()
+    cancelled = False
+
+    async def job() -> str:
+        nonlocal cancelled
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        return "text"
+
+    runner = asyncio.create_task(run_until_disconnect(upload, job()))
+    await started.wait()
+    upload.gone.set()
+    assert await asyncio.wait_for(runner, 1.0) is None
+    assert cancelled
+    # A job that finishes first returns its result.
+    assert await run_until_disconnect(_Upload([], params={}), asyncio.sleep(0, result="done")) == "done"
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import numpy as np
+
+from src.audio.ring import PcmRingBuffer
+from src.audio.tracked_queue import TrackedAudioQueue
+from src.audio.compact import BacklogPolicy, compact_silence, write_compacting
+
+_FRAME = 1280  # 80ms at 16kHz
+
+
+def _speech(frames: int) -> np.ndarray:
+    t = np.arange(frames * _FRAME) / 16000
+    return (np.sin(2 * np.pi * 220 * t) * 6000).astype(np.int16)
+
+
+def _silence(frames: int) -> np.ndarray:
+    return np.zeros(frames * _FRAME, dtype=np.int16)
+
+
+def test_compact_silence_shortens_pauses_and_keeps_speech() -> None:
+    audio = np.concatenate([_speech(2), _silence(6), _speech(3), _silence(1), np.ones(5, dtype=np.int16)])
+    out = compact_silence(audio, frame_samples=_FRAME, silence_db=-45.0, keep_frames=2)
+    expected = np.concatenate([_speech(2), _silence(2), _speech(3), _silence(1), np.ones(5, dtype=np.int16)])
+    np.testing.assert_array_equal(out, expected)
+
+
+def test_write_compacting_drops_only_after_silence_is_gone() -> None:
+    ring = PcmRingBuffer(10 * _FRAME)
+    ring.write(np.concatenate([_speech(2), _silence(6), _speech(2)]))
+
+    policy = BacklogPolicy(max_backlog_seconds=0.8, frame_samples=_FRAME, silence_db=-45.0, keep_frames=1)
+    compacted, dropped = write_compacting(ring, _speech(3), policy)
+    assert (compacted, dropped) == (5 * _FRAME, 0)
+    assert len(ring) == 8 * _FRAME
+
+    compacted, dropped = write_compacting(ring, _speech(4), policy)
+    assert (compacted, dropped) == (0, 2 * _FRAME)
+
+
+def test_write_compacting_scale_tightens_the_bound() -> None:
+    ring = PcmRingBuffer(10 * _FRAME)
+    policy = BacklogPolicy(max_backlog_seconds=0.8, frame_samples=_FRAME, silence_db=-45.0, keep_frames=1)
+    ring.write(_speech(4))
+    # Half the bound under load: 5 frames, oldest speech dropped first.
+    assert write_compacting(ring, _speech(3), policy, scale=0.5) == (0, 2 * _FRAME)
+    assert len(ring) == 5 * _FRAME
+    assert write_compacting(ring, _speech(3), policy) == (0, 0)
+
+
+def test_write_compacting_rescans_only_the_uncompacted_tail() -> None:
+    ring = PcmRingBuffer(10 * _FRAME)
+    ring.write(np.concatenate([_speech(2), _silence(6), _speech(2)]))
+    policy = BacklogPolicy(max_backlog_seconds=0.8, frame_samples=_FRAME, silence_db=-45.0, keep_frames=1)
+    assert write_compacting(ring, _speech(3), policy) == (5 * _FRAME, 0)
+    assert ring.unmarked == 0
+
+    # The new pause joins the (already compacted) audio before it and is cut to one frame.
+    assert write_compacting(ring, _silence(3), policy) == (2 * _FRAME, 0)
+    assert write_compacting(ring, _silence(2), policy) == (2 * _FRAME, 0)
+    expected = np.concatenate([_speech(2), _silence(1), _speech(2), _speech(3), _silence(1)])
+    np.testing.assert_array_equal(ring.read(len(ring)), expected)
+
+
+def test_tracked_queue_compacts_before_dropping() -> None:
+    q = TrackedAudioQueue()
+    scale = np.float32(1.0 / 32768.0)
+    for chunk in (np.concatenate([_speech(2), _silence(50)]), _speech(30), _silence(40)):
+        q.put_nowait(chunk.astype(np.float32) * scale)
+    q.put_nowait(None)
+
+    policy = BacklogPolicy(max_backlog_seconds=5.0, frame_samples=_FRAME, silence_db=-45.0, keep_frames=2)
+    assert q.enforce_backlog(policy) == ((48 + 38) * _FRAME / 16000, 0.0)
+    assert q.total_samples == (2 + 2 + 30 + 2) * _FRAME
+    assert q.qsize() == 4
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+
+from src.handlers.connections import ConnectionManager
+
+
+async def test_waiting_room_hands_freed_slots_out_in_fifo_order() -> None:
+    manager = ConnectionManager(max_connections=1, max_waiting=2)
+    first, second, third, fourth = object(), object(), object(), object()
+    assert await manager.connect(first)
+    assert not await manager.connect(second)
+
+    ticket_2 = manager.join_waiting_room(second)
+    ticket_3 = manager.join_waiting_room(third)
+    assert ticket_2 is not None and ticket_3 is not None
+    assert manager.join_waiting_room(fourth) is None  # room full
+    assert [manager.waiting_position(t) for t in (ticket_2, ticket_3)] == [1, 2]
+
+    await manager.disconnect(first)
+    assert ticket_2.done() and ticket_2.result()
+    assert not ticket_3.done()
+    # A fresh socket cannot take the slot that went to the queue.
+    assert not await manager.connect(fourth)
+    assert manager.leave_waiting_room(ticket_2)
+    assert manager.get_connection_count() == 1
+    assert manager.estimate_wait_s(1) is not None
+
+
+async def test_leaving_the_waiting_room_frees_the_position() -> None:
+    manager = ConnectionManager(max_connections=1, max_waiting=2)
+    first, second, third = object(), object(), object()
+    assert await manager.connect(first)
+    ticket_2 = manager.join_waiting_room(second)
+    ticket_3 = manager.join_waiting_room(third)
+    assert ticket_2 is not None and ticket_3 is not None
+
+    assert not manager.leave_waiting_room(ticket_2)
+    assert manager.waiting_position(ticket_3) == 1
+    await manager.disconnect(first)
+    await asyncio.wait_for(ticket_3, timeout=1.0)
+    assert manager.get_waiting_count() == 0
+
+
+async def test_waiting_room_disabled_by_default() -> None:
+    manager = ConnectionManager(max_connections=1)
+    assert await manager.connect(object())
+    assert manager.join_waiting_room(object()) is None
+
+
+async def test_waiting_room_serves_higher_priority_first() -> None:
+    manager = ConnectionManager(max_connections=1, max_waiting=3)
+    first, low, normal, high = object(), object(), object(), object()
+    assert await manager.connect(first)
+    ticket_low = manager.join_waiting_room(low, priority="low")
+    ticket_normal = manager.join_waiting_room(normal, priority="normal")
+    ticket_high = manager.join_waiting_room(high, priority="high")
+    assert ticket_low is not None and ticket_normal is not None and ticket_high is not None
+    assert [manager.waiting_position(t) for t in (ticket_high, ticket_normal, ticket_low)] == [1, 2, 3]
+
+    await manager.disconnect(first)
+    assert ticket_high.done()
+    assert not ticket_normal.done()
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import pytest
+import numpy as np
+
+from src.audio.pool import AudioWorkerPool
+from src.audio.g711 import alaw_to_pcm16, ulaw_to_pcm16
+from src.audio.ingress import G711_ULAW_FORMAT, AudioIngress
+
+audioop = pytest.importorskip("audioop")
+
+_ALL_CODES = bytes(range(256))
+
+
+def test_ulaw_table_matches_reference() -> None:
+    expected = np.frombuffer(audioop.ulaw2lin(_ALL_CODES, 2), dtype="<i2")
+    np.testing.assert_array_equal(ulaw_to_pcm16(_ALL_CODES), expected)
+
+
+def test_alaw_table_matches_reference() -> None:
+    expected = np.frombuffer(audioop.alaw2lin(_ALL_CODES, 2), dtype="<i2")
+    np.testing.assert_array_equal(alaw_to_pcm16(_ALL_CODES), expected)
+
+
+async def test_g711_ingress_upsamples_to_16k() -> None:
+    pool = AudioWorkerPool(workers=1, max_pending=4)
+    try:
+        tone = (np.sin(2 * np.pi * 300 * np.arange(8000) / 8000) * 8000).astype("<i2")
+        ulaw = audioop.lin2ulaw(tone.tobytes(), 2)
+        ingress = AudioIngress(pool=pool)
+        ingress.set_format(G711_ULAW_FORMAT)
+        out = b""
+        for i in range(0, len(ulaw), 160):  # 20ms telephony frames
+            out += await ingress.to_pcm16(ulaw[i : i + 160])
+        out += await ingress.flush()
+        assert len(out) // 2 == 16000
+    finally:
+        pool.shutdown()
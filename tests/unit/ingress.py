@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+import numpy as np
+
+from src.audio import opus
+from src.audio.opus import OPUS_AVAILABLE
+from src.audio.pool import AudioWorkerPool
+from src.audio.resample import PcmResampler
+from src.audio.ingress import OPUS_FORMAT, AudioIngress, available_input_audio_formats
+
+
+@pytest.fixture
+def pool():
+    pool = AudioWorkerPool(workers=2, max_pending=4)
+    yield pool
+    pool.shutdown()
+
+
+async def test_pcm16_passes_through_without_decoding(pool: AudioWorkerPool) -> None:
+    ingress = AudioIngress(pool=pool)
+    pcm = np.arange(8, dtype="<i2").tobytes()
+    assert await ingress.to_pcm16(pcm) is pcm
+    assert ingress.decoded_packets == 0
+    with pytest.raises(ValueError):
+        await ingress.to_pcm16(b"\x01\x02\x03")
+
+
+async def test_pool_runs_jobs_off_the_event_loop(pool: AudioWorkerPool) -> None:
+    main = threading.get_ident()
+    assert await pool.run(threading.get_ident) != main
+
+
+async def test_pool_batches_concurrent_jobs_and_keeps_results_apart(pool: AudioWorkerPool) -> None:
+    def boom(_: int) -> int:
+        raise ValueError("bad chunk")
+
+    jobs = [pool.run(abs, -i) for i in range(10)] + [pool.run(boom, 0)]
+    results = await asyncio.gather(*jobs, return_exceptions=True)
+    assert results[:10] == list(range(10))
+    assert isinstance(results[10], ValueError)
+
+
+@pytest.mark.skipif(OPUS_AVAILABLE, reason="opus is available")
+def test_opus_rejected_when_codec_missing(pool: AudioWorkerPool) -> None:
+    assert OPUS_FORMAT not in available_input_audio_formats()
+    with pytest.raises(ValueError):
+        AudioIngress(pool=pool).set_format(OPUS_FORMAT)
+
+
+@pytest.mark.skipif(not OPUS_AVAILABLE, reason="opuslib/libopus not installed")
+async def test_opus_packets_decode_to_16k_pcm16(pool: AudioWorkerPool) -> None:
+    encoder = opus.opuslib.Encoder(16000, 1, opus.opuslib.APPLICATION_VOIP)
+    frame = (np.sin(np.arange(320) / 8.0) * 8000).astype("<i2").tobytes()  # 20ms
+    ingress = AudioIngress(pool=pool)
+    ingress.set_format(OPUS_FORMAT)
+    pcm = await ingress.to_pcm16(encoder.encode(frame, 320))
+    assert len(pcm) == len(frame)
+    assert ingress.stats()["packets"] == 1
+    assert ingress.decode_seconds > 0
+
+
+async def test_resampling_keeps_state_across_chunks(pool: AudioWorkerPool) -> None:
+    ingress = AudioIngress(pool=pool)
+    ingress.set_sample_rate(48000)
+    tone = (np.sin(2 * np.pi * 440 * np.arange(48000) / 48000) * 8000).astype("<i2")
+    out = b""
+    for chunk in np.array_split(tone, 37):
+        out += await ingress.to_pcm16(chunk.tobytes())
+    out += await ingress.flush()
+
+    samples = np.frombuffer(out, dtype="<i2")
+    assert len(samples) == 16000
+    # Chunk boundaries leave no clicks: the chunked result matches one-shot resampling
+    # up to int16 rounding.
+    oneshot = PcmResampler(48000)
+    expected = np.frombuffer(oneshot.process(tone.tobytes()) + oneshot.flush(), dtype="<i2")
+    np.testing.assert_allclose(samples, expected, atol=2)
+
+
+def test_unsupported_sample_rate_rejected(pool: AudioWorkerPool) -> None:
+    with pytest.raises(ValueError):
+        AudioIngress(pool=pool).set_sample_rate(22050)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from src.admission.utterances import UtteranceSlots
+from src.audio.scheduler import FeedFlow, FeedScheduler
+from src.admission.load import EngineLoad, LoadController
+
+_FRAME = 1280
+
+
+class _Holder:
+    def __init__(self) -> None:
+        self.statuses: list[dict[str, Any]] = []
+
+    async def send_status(self, payload: dict[str, Any]) -> None:
+        self.statuses.append(payload)
+
+
+class _StuckHolder:
+    @staticmethod
+    async def send_status(payload: dict[str, Any]) -> None:
+        await asyncio.Event().wait()
+
+
+def _controller(slots: UtteranceSlots, scheduler: FeedScheduler) -> LoadController:
+    return LoadController(
+        read_load=lambda: EngineLoad(running=0, waiting=0, kv_cache_usage=0.0),
+        utterance_slots=slots,
+        feed_scheduler=scheduler,
+        poll_s=0.0,
+        kv_high=0.9,
+        waiting_high=0.25,
+        lag_budget_s=1.0,
+        min_backlog_scale=0.4,
+        min_utterance_scale=0.5,
+    )
+
+
+async def test_overload_sheds_then_recovers_gradually() -> None:
+    slots = UtteranceSlots(capacity=20)
+    controller = _controller(slots, FeedScheduler(quantum_samples=_FRAME, frame_samples=_FRAME))
+    holder = _Holder()
+    assert slots.try_acquire(_StuckHolder())
+    assert slots.try_acquire(holder)
+
+    # Advisories go out from their own tasks: a stuck socket holds up neither the limits nor other holders.
+    controller.apply(EngineLoad(running=20, waiting=6, kv_cache_usage=0.5))
+    await asyncio.sleep(0)
+    assert controller.level == "overloaded"
+    assert controller.backlog_scale == 0.4
+    assert slots.limit == 10
+    assert holder.statuses == [
+        {"kind": "slow_down", "level": "overloaded", "reason": "requests_waiting", "pressure": 1.2}
+    ]
+
+    # Load gone: the backlog bound is restored at once, the utterance limit ramps back.
+    controller.apply(EngineLoad(running=10, waiting=0, kv_cache_usage=0.3))
+    await asyncio.sleep(0)
+    assert controller.level == "normal"
+    assert controller.backlog_scale == 1.0
+    assert slots.limit == 12
+    assert holder.statuses[-1] == {"kind": "load_normal"}
+    controller.apply(EngineLoad(running=10, waiting=0, kv_cache_usage=0.3))
+    await asyncio.sleep(0)
+    assert slots.limit == 14
+    assert len(holder.statuses) == 2  # no repeat while the level holds
+    await controller.stop()
+
+
+async def test_engine_lag_and_kv_cache_raise_pressure() -> None:
+    slots = UtteranceSlots(capacity=4)
+    scheduler = FeedScheduler(quantum_samples=100 * _FRAME, frame_samples=_FRAME)
+    controller = _controller(slots, scheduler)
+    assert slots.try_acquire(object())
+
+    idle = EngineLoad(running=1, waiting=0, kv_cache_usage=0.0)
+    assert controller.pressure(idle) == (0.0, "requests_waiting")
+    assert controller.pressure(EngineLoad(running=1, waiting=0, kv_cache_usage=0.81))[1] == "kv_cache"
+
+    # 0.9s of audio queued in vLLM for the one active utterance: elevated, halfway to the floor.
+    flow = FeedFlow()
+    assert await scheduler.acquire(flow, int(0.9 * 16000)) > 0
+    controller.apply(idle)
+    assert controller.level == "elevated"
+    assert abs(controller.backlog_scale - 0.7) < 1e-9
+
+
+async def test_one_transient_waiting_request_does_not_shed() -> None:
+    slots = UtteranceSlots(capacity=20)
+    controller = _controller(slots, FeedScheduler(quantum_samples=_FRAME, frame_samples=_FRAME))
+    holder = _Holder()
+    assert slots.try_acquire(holder)
+
+    # A poll that catches one request queued for a step: pressure stays low, nothing changes.
+    blip = EngineLoad(running=20, waiting=1, kv_cache_usage=0.1)
+    pressure, reason = controller.pressure(blip)
+    assert reason == "requests_waiting"
+    assert abs(pressure - 0.2) < 1e-9
+    for load in (blip, EngineLoad(running=20, waiting=0, kv_cache_usage=0.1), blip):
+        controller.apply(load)
+        await asyncio.sleep(0)
+        assert controller.level == "normal"
+        assert slots.limit == 20
+    assert holder.statuses == []
+    await controller.stop()
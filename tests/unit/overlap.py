@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import pytest
+import numpy as np
+
+from src.transcript.overlap import find_overlap
+
+
+def _reference(a: str, b: str) -> int:
+    for i in range(min(len(a), len(b)), 0, -1):
+        if a.endswith(b[:i]):
+            return i
+    return 0
+
+
+def _words(rng: np.random.Generator, n: int) -> str:
+    vocab = ["the", "quick", "brown", "fox", "jumps", "over", "lazy", "dog", "ça", "naïve", "日本", "😀"]
+    out = ""
+    while len(out) < n:
+        out += " " + str(rng.choice(vocab))
+    return out[:n]
+
+
+@pytest.mark.parametrize("window", [0, 1, 40, 300, 2000, 2500])
+def test_find_overlap_matches_brute_force(window: int) -> None:
+    rng = np.random.default_rng(window)
+    for _ in range(20):
+        a = _words(rng, window)
+        cut = int(rng.integers(0, window + 1))
+        b = (a[len(a) - cut :] + _words(rng, window))[:window]
+        assert find_overlap(a, b) == _reference(a, b)
+        unrelated = _words(rng, window)
+        assert find_overlap(a, unrelated) == _reference(a, unrelated)
+
+
+def test_find_overlap_on_periodic_text() -> None:
+    # Many hash-equal candidates; the longest verified one wins.
+    assert find_overlap("ab" * 500, "ba" * 500) == 999
+    assert find_overlap("a" * 400, "a" * 300 + "b") == 300
+    assert find_overlap("a" * 400, "b" * 400) == 0
@@ -4,7 +4,7 @@ import json
 
 import pytest
 
-from src.handlers.websocket.parser import parse_client_message
+from src.handlers.websocket.parser import parse_client_message, parse_binary_audio_frame
 
 
 def test_parse_client_message_ok() -> None:
@@ -35,3 +35,19 @@ def test_parse_client_message_ok() -> None:
 def test_parse_client_message_invalid(raw: str) -> None:
     with pytest.raises(ValueError):
         parse_client_message(raw)
+
+
+def test_parse_binary_audio_frame_ok() -> None:
+    raw = b"\x01\x00\xff\x7f"
+    assert parse_binary_audio_frame(raw) == raw
+
+
+@pytest.mark.parametrize("raw", [b"", b"\x01\x00\x02"])
+def test_parse_binary_audio_frame_invalid(raw: bytes) -> None:
+    with pytest.raises(ValueError):
+        parse_binary_audio_frame(raw)
+
+
+def test_parse_binary_audio_frame_codec_packet_allows_odd_length() -> None:
+    raw = b"\x01\x00\x02"
+    assert parse_binary_audio_frame(raw, audio_format="opus") == raw
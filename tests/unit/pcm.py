@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import base64
+
+import pytest
+import numpy as np
+
+from src.audio.pcm import check_pcm16, decode_b64_audio, pcm16_to_float32
+
+
+def test_decode_b64_audio_roundtrip() -> None:
+    pcm = np.array([0, 16384, -32768, 32767], dtype="<i2").tobytes()
+    assert check_pcm16(decode_b64_audio(base64.b64encode(pcm).decode("ascii"))) == pcm
+
+
+@pytest.mark.parametrize("audio_b64", ["", "   ", "AAE", base64.b64encode(b"\x01\x02\x03").decode("ascii")])
+def test_decode_b64_audio_invalid(audio_b64: str) -> None:
+    with pytest.raises(ValueError):
+        check_pcm16(decode_b64_audio(audio_b64))
+
+
+def test_pcm16_to_float32_matches_vllm_conversion() -> None:
+    pcm = np.array([0, 16384, -32768, 32767], dtype="<i2").tobytes()
+    expected = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+    out = pcm16_to_float32(pcm)
+    assert out.dtype == np.float32
+    np.testing.assert_array_equal(out, expected)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.errors import RateLimitError
+from src.handlers.quotas import KeyQuotas
+from src.state.settings import KeyQuotaSettings
+from src.runtime.keys import read_keys_file, build_key_registry
+
+
+def test_connection_quotas_are_per_key() -> None:
+    t = 0.0
+
+    def now() -> float:
+        return t
+
+    quota = KeyQuotaSettings(max_connections=2, connects_per_window=3, window_s=10.0)
+    quotas = KeyQuotas({"noisy": quota, "quiet": quota}, now_fn=now)
+    quotas.open_connection("noisy")
+    quotas.open_connection("noisy")
+    with pytest.raises(RateLimitError) as exc:
+        quotas.open_connection("noisy")
+    assert exc.value.reason == "key_connections"
+    quotas.open_connection("quiet")  # another tenant is unaffected
+
+    quotas.close_connection("noisy")
+    with pytest.raises(RateLimitError) as exc:
+        quotas.open_connection("noisy")  # a free connection, but the fourth attempt this window
+    assert exc.value.reason == "key_connect_rate"
+    t = 10.0
+    quotas.open_connection("noisy")
+    assert quotas.connection_count("noisy") == 2
+
+
+def test_audio_quota_and_unknown_keys() -> None:
+    quotas = KeyQuotas({"tenant": KeyQuotaSettings(audio_seconds_per_window=1.0, max_utterances=3)})
+    quotas.charge_audio("tenant", 0.6)
+    with pytest.raises(RateLimitError) as exc:
+        quotas.charge_audio("tenant", 0.6)
+    assert exc.value.reason == "key_audio_seconds"
+    assert quotas.max_utterances("tenant") == 3
+
+    quotas.charge_audio("unknown", 100.0)
+    quotas.open_connection("unknown")
+    assert quotas.max_utterances("unknown") == 0
+
+
+def test_keys_file_merges_with_env_keys(tmp_path: Path) -> None:
+    keys_file = tmp_path / "keys.json"
+    entries = [{"key": "tenant-a", "priority": "high", "max_utterances": 4}, {"key": "shared", "priority": "low"}]
+    keys_file.write_text(json.dumps({"keys": entries}))
+
+    priorities, quotas = build_key_registry(
+        api_key="shared", api_key_priority="normal", key_priorities={"env-key": "high"}, keys_file=str(keys_file)
+    )
+    assert priorities == {"env-key": "high", "shared": "low", "tenant-a": "high"}
+    assert quotas["tenant-a"].max_utterances == 4
+    assert quotas["env-key"].window_s > 0
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        {"keys": [{"priority": "high"}]},
+        {"keys": [{"key": "a", "priority": "urgent"}]},
+        {"keys": [{"key": "a", "max_connections": -1}]},
+        {"keys": [{"key": "a", "max_sessions": 1}]},
+        ["a"],
+    ],
+)
+def test_keys_file_rejects_malformed_entries(tmp_path: Path, document: object) -> None:
+    keys_file = tmp_path / "keys.json"
+    keys_file.write_text(json.dumps(document))
+    with pytest.raises(ValueError):
+        read_keys_file(keys_file, defaults=KeyQuotaSettings())
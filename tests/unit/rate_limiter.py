@@ -31,3 +31,24 @@ def test_rate_limiter_rejects_when_saturated() -> None:
         limiter.consume()
     assert exc.value.limit == 2
     assert exc.value.window_seconds == 10
+
+
+def test_rate_limiter_frees_usage_as_the_window_slides() -> None:
+    t = 0.0
+
+    def now() -> float:
+        return t
+
+    limiter = SlidingWindowRateLimiter(limit=10, window_seconds=10, now_fn=now)
+    limiter.consume(6.0)
+    t = 5.0
+    limiter.consume(4.0)
+    with pytest.raises(RateLimitError) as exc:
+        limiter.consume(1.0)
+    assert exc.value.retry_after_s == pytest.approx(5.0)
+
+    t = 10.0  # the first 6 units left the window
+    limiter.consume(6.0)
+    assert limiter.used() == pytest.approx(10.0)
+    t = 100.0
+    assert limiter.used() == 0
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+from typing import cast
+from types import SimpleNamespace
+
+from src.state import RuntimeDeps
+from src.admission.load import EngineLoad
+from src.admission.replicas import ReplicaRouter
+from src.handlers.replicas import handle_replicas
+
+
+def _idle() -> int:
+    return 0
+
+
+def test_routes_to_the_least_loaded_replica_and_releases() -> None:
+    router = ReplicaRouter(["a", "b", "c"], backlog_unit_samples=1000)
+    first, second, third = (router.acquire(_idle) for _ in range(3))
+    assert [first.serving, second.serving, third.serving] == ["a", "b", "c"]
+
+    # Queued audio counts against a replica: a full inflight budget weighs like one request.
+    backlog = [2500]
+    router.release(first)
+    router.acquire(lambda: backlog[0])
+    assert router.acquire(_idle).rank == 1
+    backlog[0] = 0
+    assert router.acquire(_idle).rank == 0
+
+    stats = router.stats()
+    assert [replica["active_requests"] for replica in stats] == [2, 2, 1]
+    assert [replica["routed_total"] for replica in stats] == [3, 2, 1]
+
+
+def test_engine_loads_steer_routing_and_are_cached() -> None:
+    t = 0.0
+    reads: list[dict[int, EngineLoad]] = [
+        {
+            0: EngineLoad(running=4, waiting=2, kv_cache_usage=0.9),
+            1: EngineLoad(running=1, waiting=0, kv_cache_usage=0.1),
+        }
+    ]
+
+    def now() -> float:
+        return t
+
+    def read_loads() -> dict[int, EngineLoad]:
+        return reads[-1]
+
+    router = ReplicaRouter(["a", "b"], read_loads=read_loads, refresh_s=1.0, now_fn=now)
+    assert router.acquire(_idle).rank == 1  # rank 0 carries another frontend's requests
+
+    # Until the next refresh, the cached reading stands and local routes add up.
+    reads.append({})
+    for _ in range(5):
+        router.acquire(_idle)
+    assert [replica["active_requests"] for replica in router.stats()] == [0, 6]
+    assert router.acquire(_idle).rank == 0  # 4 running + 2 waiting vs 6 routed here: a tie, lower rank wins
+
+    t = 2.0
+    reads.append({1: EngineLoad(running=9, waiting=0, kv_cache_usage=0.5)})
+    assert router.acquire(_idle).rank == 0
+    assert router.stats()[1]["running"] == 9
+
+
+def test_failed_load_reads_keep_routing() -> None:
+    def read_loads() -> dict[int, EngineLoad]:
+        raise RuntimeError("metrics unavailable")
+
+    router = ReplicaRouter(["a", "b"], read_loads=read_loads, refresh_s=0.0)
+    assert [router.acquire(_idle).rank for _ in range(3)] == [0, 1, 0]
+
+
+def test_replica_report_requires_an_accepted_api_key() -> None:
+    deps = cast(
+        RuntimeDeps,
+        SimpleNamespace(
+            settings=SimpleNamespace(auth=SimpleNamespace(key_priorities={"k": "normal"})),
+            replica_router=ReplicaRouter(["a"]),
+        ),
+    )
+    anonymous = SimpleNamespace(query_params={}, headers={})
+    assert handle_replicas(anonymous, deps).status_code == 401
+
+    response = handle_replicas(SimpleNamespace(query_params={}, headers={"x-api-key": "k"}), deps)
+    assert response.status_code == 200
+    assert [replica["rank"] for replica in json.loads(response.body)["replicas"]] == [0]
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import numpy as np
+
+from src.audio.ring import PcmRingBuffer
+
+
+def _samples(start: int, n: int) -> np.ndarray:
+    return np.arange(start, start + n, dtype=np.int16)
+
+
+def test_ring_read_is_fifo_across_wraparound() -> None:
+    ring = PcmRingBuffer(8)
+    assert ring.write(_samples(0, 6)) == 0
+    np.testing.assert_array_equal(ring.read(4), _samples(0, 4))
+    assert ring.write(_samples(6, 5)) == 0
+    assert len(ring) == 7
+    np.testing.assert_array_equal(ring.read(100), _samples(4, 7))
+    assert len(ring) == 0
+
+
+def test_ring_overwrites_oldest_sample_exact() -> None:
+    ring = PcmRingBuffer(8)
+    ring.write(_samples(0, 6))
+    assert ring.write(_samples(6, 5)) == 3
+    np.testing.assert_array_equal(ring.read(8), _samples(3, 8))
+    assert ring.write(_samples(0, 20)) == 12
+    np.testing.assert_array_equal(ring.read(8), _samples(12, 8))
+
+
+def test_ring_tail_is_contiguous_and_non_consuming() -> None:
+    ring = PcmRingBuffer(5)
+    ring.write(_samples(0, 4))
+    ring.write(_samples(4, 3))
+    tail = ring.tail(4)
+    assert tail.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(tail, _samples(3, 4))
+    assert len(ring) == 5
+
+
+def test_growable_ring_never_drops() -> None:
+    ring = PcmRingBuffer(4, growable=True)
+    ring.write(_samples(0, 3))
+    ring.read(2)
+    assert ring.write(_samples(3, 10)) == 0
+    assert ring.capacity >= 11
+    np.testing.assert_array_equal(ring.read(len(ring)), _samples(2, 11))
+
+
+def test_ring_unmarked_counts_newest_unprocessed_samples() -> None:
+    ring = PcmRingBuffer(8)
+    ring.write(_samples(0, 6))
+    ring.mark(unmarked=2)
+    ring.write(_samples(6, 1))
+    assert ring.unmarked == 3
+    assert ring.drop_newest(2) == 2
+    assert ring.unmarked == 1
+    np.testing.assert_array_equal(ring.read(4), _samples(0, 4))
+    assert ring.unmarked == 1
+    ring.read(1)
+    assert ring.unmarked == 0
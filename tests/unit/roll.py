@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import numpy as np
+
+from src.audio.roll import RollPlanner
+
+_FRAME = 1280  # 80ms at 16kHz
+
+
+def _speech(frames: int) -> np.ndarray:
+    t = np.arange(frames * _FRAME) / 16000
+    return (np.sin(2 * np.pi * 220 * t) * 6000).astype(np.int16)
+
+
+def _planner(*, soft_frames: int, hard_frames: int) -> RollPlanner:
+    return RollPlanner(
+        frame_samples=_FRAME,
+        soft_samples=soft_frames * _FRAME,
+        hard_samples=hard_frames * _FRAME,
+        pause_frames=3,
+        pause_db=-45.0,
+    )
+
+
+def test_no_roll_before_soft_threshold() -> None:
+    planner = _planner(soft_frames=100, hard_frames=200)
+    pending: np.ndarray = np.zeros(10 * _FRAME, dtype=np.int16)
+    assert planner.plan(10 * _FRAME, pending) is None
+
+
+def test_rolls_cleanly_at_centre_of_pause_after_soft_threshold() -> None:
+    planner = _planner(soft_frames=100, hard_frames=200)
+    pending = np.concatenate([_speech(4), np.zeros(3 * _FRAME, dtype=np.int16), _speech(4)])
+    plan = planner.plan(100 * _FRAME, pending)
+    assert plan is not None
+    assert plan.clean
+    assert plan.cut_samples == 6 * _FRAME  # speech(4) + 2 of the 3 silent frames
+
+
+def test_keeps_feeding_through_speech_until_hard_limit() -> None:
+    planner = _planner(soft_frames=100, hard_frames=110)
+    planner.observe(_speech(4))
+    assert planner.plan(100 * _FRAME, _speech(4)) is None
+
+    quiet = _speech(12)
+    quiet[5 * _FRAME : 8 * _FRAME] //= 8  # quieter, but not a pause
+    plan = planner.plan(104 * _FRAME, quiet)
+    assert plan is not None
+    assert not plan.clean
+    assert 0 < plan.cut_samples <= 6 * _FRAME
+    assert plan.cut_samples % _FRAME == 0
+
+
+def test_pause_spanning_feed_boundary_uses_sent_history() -> None:
+    planner = _planner(soft_frames=10, hard_frames=200)
+    planner.observe(np.concatenate([_speech(2), np.zeros(2 * _FRAME, dtype=np.int16)]))
+    plan = planner.plan(20 * _FRAME, np.concatenate([np.zeros(_FRAME, dtype=np.int16), _speech(2)]))
+    assert plan is not None
+    assert plan.clean
+    assert plan.cut_samples == 0
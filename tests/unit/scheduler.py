@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+
+from src.audio.tracked_queue import TrackedAudioQueue
+from src.audio.scheduler import FeedFlow, FeedScheduler
+
+_FRAME = 1280
+
+
+async def test_grants_are_round_robin_by_quantum_under_the_inflight_cap() -> None:
+    scheduler = FeedScheduler(quantum_samples=2 * _FRAME, frame_samples=_FRAME, max_inflight_samples=4 * _FRAME)
+    backlog, live, other = FeedFlow(), FeedFlow(), FeedFlow()
+
+    # A backlog dump gets one quantum, not everything it asked for.
+    assert await scheduler.acquire(backlog, 50 * _FRAME) == 2 * _FRAME
+    assert await scheduler.acquire(backlog, 48 * _FRAME) == 2 * _FRAME
+    assert scheduler.inflight_samples == 4 * _FRAME
+
+    # Cap reached: everyone queues, the backlog first.
+    waits = [asyncio.ensure_future(scheduler.acquire(f, n)) for f, n in ((backlog, 46 * _FRAME), (live, _FRAME))]
+    waits.append(asyncio.ensure_future(scheduler.acquire(other, 3 * _FRAME)))
+    await asyncio.sleep(0)
+    assert not any(w.done() for w in waits)
+
+    scheduler.account(backlog, -4 * _FRAME)  # vLLM consumed the backlog's audio
+    await asyncio.sleep(0)
+    assert [w.result() for w in waits] == [2 * _FRAME, _FRAME, _FRAME]
+    assert scheduler.inflight_samples == 4 * _FRAME
+    _, max_wait_s = live.take_wait_stats()
+    assert max_wait_s > 0
+
+
+async def test_reservations_track_queue_and_settle_unused_grants() -> None:
+    scheduler = FeedScheduler(quantum_samples=4 * _FRAME, frame_samples=_FRAME, max_inflight_samples=8 * _FRAME)
+    flow = FeedFlow()
+    queue = TrackedAudioQueue(on_change=lambda delta: scheduler.account(flow, delta))
+
+    async with scheduler.grant(flow, 3 * _FRAME) as granted:
+        assert granted == 3 * _FRAME
+        queue.put_nowait(np.zeros(2 * _FRAME, dtype=np.float32))  # one frame never fed (e.g. VAD)
+    assert scheduler.inflight_samples == 2 * _FRAME
+
+    queue.put_nowait(np.zeros(_FRAME, dtype=np.float32))  # ungranted audio (overlap replay)
+    assert scheduler.inflight_samples == 3 * _FRAME
+    await queue.get()
+    queue.get_nowait()
+    assert scheduler.inflight_samples == 0
+
+    # A final sub-frame remainder is granted as-is.
+    assert await scheduler.acquire(flow, 100) == 100
+
+
+async def test_cancelled_waiter_leaves_the_queue() -> None:
+    scheduler = FeedScheduler(quantum_samples=_FRAME, frame_samples=_FRAME, max_inflight_samples=_FRAME)
+    first, second = FeedFlow(), FeedFlow()
+    assert await scheduler.acquire(first, _FRAME) == _FRAME
+
+    waiting = asyncio.ensure_future(scheduler.acquire(second, _FRAME))
+    await asyncio.sleep(0)
+    waiting.cancel()
+    await asyncio.sleep(0)
+    scheduler.settle(first)
+    assert scheduler.inflight_samples == 0
+    assert await scheduler.acquire(first, _FRAME) == _FRAME
+
+
+async def test_flow_weight_scales_its_quantum() -> None:
+    scheduler = FeedScheduler(quantum_samples=2 * _FRAME, frame_samples=_FRAME)
+    assert await scheduler.acquire(FeedFlow(weight=2.0), 10 * _FRAME) == 4 * _FRAME
+    assert await scheduler.acquire(FeedFlow(weight=0.5), 10 * _FRAME) == _FRAME
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pytest
+
+from src.state import EnvelopeState
+from src.handlers.websocket.parser import parse_binary_audio_frame
+from src.handlers.websocket.session import session_update_error, track_binary_binding
+
+_MODEL = "voxtral"
+
+
+def _update(payload: dict) -> dict:
+    return {"type": "session.update", "session_id": "s", "request_id": "r", "payload": payload}
+
+
+@pytest.mark.parametrize(
+    ("extra", "reason_code"),
+    [
+        ({"model": "other"}, "unsupported_model"),
+        ({"input_sample_rate": 11025}, "unsupported_sample_rate"),
+        ({"partial_interval_ms": -1}, "unsupported_partial_interval"),
+    ],
+)
+def test_rejected_session_update_leaves_binary_frame_parsing_unchanged(extra: dict, reason_code: str) -> None:
+    payload = {"input_audio_format": "g711_ulaw", **extra}
+    error = session_update_error(payload, allowed_model_name=_MODEL)
+    assert error is not None
+    assert error[1] == reason_code
+
+    state = EnvelopeState()
+    track_binary_binding(_update(payload), state, allowed_model_name=_MODEL)
+    assert state.input_audio_format == "pcm16"
+    # Still parsed as PCM16: half a sample is refused.
+    with pytest.raises(ValueError, match="PCM16"):
+        parse_binary_audio_frame(b"\x00\x01\x02", audio_format=state.input_audio_format)
+
+
+def test_accepted_session_update_switches_binary_frame_format() -> None:
+    state = EnvelopeState()
+    payload = {"model": _MODEL, "input_audio_format": "g711_ulaw"}
+    assert session_update_error(payload, allowed_model_name=_MODEL) is None
+    track_binary_binding(_update(payload), state, allowed_model_name=_MODEL)
+    assert state.input_audio_format == "g711_ulaw"
+    assert parse_binary_audio_frame(b"\x00\x01\x02", audio_format=state.input_audio_format) == b"\x00\x01\x02"
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+
+from src.admission.utterances import UtteranceSlots
+
+
+def test_slots_cap_active_utterances_not_connections() -> None:
+    slots = UtteranceSlots(capacity=2)
+    a, b, c = object(), object(), object()
+    assert slots.try_acquire(a)
+    assert slots.try_acquire(b)
+    assert not slots.try_acquire(c)
+    # Re-acquiring a held slot (new utterance on the same connection) never fails.
+    assert slots.try_acquire(a)
+    assert slots.get_active_count() == 2
+
+    slots.release(a)
+    assert slots.try_acquire(c)
+    slots.release(a)  # releasing twice is harmless
+    assert slots.get_active_count() == 2
+
+
+def test_low_priority_share_and_preemption_victim() -> None:
+    slots = UtteranceSlots(capacity=4, low_priority_share=0.5)
+    low_a, low_b, low_c, normal, high = object(), object(), object(), object(), object()
+    assert slots.try_acquire(low_a, priority="low")
+    assert slots.try_acquire(low_b, priority="low")
+    assert not slots.try_acquire(low_c, priority="low")  # low share used up, slots still free
+    assert slots.preemption_victim("high") is None  # nothing to preempt while slots are free
+
+    assert slots.try_acquire(normal)
+    assert slots.try_acquire(object(), priority="high")
+    assert not slots.try_acquire(high, priority="high")
+    # The newest holder of the lowest class goes first; equal classes never preempt each other.
+    assert slots.preemption_victim("high") is low_b
+    assert slots.preemption_victim("normal") is low_b
+    assert slots.preemption_victim("low") is None
+
+    # The victim's slot moves to the requester in the same step.
+    assert slots.preempt(high, priority="high", api_key="tenant") is low_b
+    assert slots.holds(high) and not slots.holds(low_b)
+    assert slots.key_count("tenant") == 1
+    assert slots.get_active_count() == 4
+    assert slots.preempt(object(), priority="low") is None
+
+
+def test_slots_are_counted_per_api_key() -> None:
+    slots = UtteranceSlots(capacity=4)
+    a, b, c = object(), object(), object()
+    assert slots.try_acquire(a, api_key="tenant")
+    assert slots.try_acquire(b, api_key="tenant")
+    assert slots.try_acquire(c, api_key="other")
+    assert slots.key_count("tenant") == 2
+    assert slots.holds(a)
+
+    slots.release(a)
+    slots.release(a)
+    assert slots.key_count("tenant") == 1
+    assert not slots.holds(a)
+
+
+async def test_acquire_waits_for_a_released_slot() -> None:
+    slots = UtteranceSlots(capacity=1)
+    live, segment = object(), object()
+    assert slots.try_acquire(live)
+    waiter = asyncio.create_task(slots.acquire(segment, priority="low"))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    slots.release(live)
+    await asyncio.wait_for(waiter, 1.0)
+    assert slots.holds(segment)
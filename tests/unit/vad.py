@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import numpy as np
+
+from src.audio.vad import EnergyVad
+from src.audio.gate import SilenceGate
+
+_FRAME = 1280  # 80ms at 16kHz
+
+
+def _tone(frames: int) -> np.ndarray:
+    t = np.arange(frames * _FRAME) / 16000
+    return (np.sin(2 * np.pi * 220 * t) * 6000).astype(np.int16)
+
+
+def _silence(frames: int) -> np.ndarray:
+    return np.zeros(frames * _FRAME, dtype=np.int16)
+
+
+def test_energy_vad_separates_speech_from_silence() -> None:
+    frames = np.concatenate([_tone(2), _silence(2)]).reshape(4, _FRAME)
+    assert EnergyVad()(frames).tolist() == [True, True, False, False]
+
+
+def test_gate_skips_long_silence_but_keeps_padding() -> None:
+    gate = SilenceGate(EnergyVad(), frame_samples=_FRAME, padding_frames=2)
+    audio = np.concatenate([_silence(10), _tone(3), _silence(10), _tone(1)])
+
+    # Feed in uneven whole-frame blocks, as the feed loop would.
+    out = np.concatenate([gate.process(block) for block in np.split(audio, [5 * _FRAME, 12 * _FRAME, 20 * _FRAME])])
+    skipped = gate.finish()
+
+    # pre-roll(2) + tone(3) + hangover(2) + pre-roll(2) + tone(1)
+    assert len(out) == 10 * _FRAME
+    assert skipped == len(audio) - len(out)
+    np.testing.assert_array_equal(out[2 * _FRAME : 5 * _FRAME], _tone(3))
+
+
+def test_gate_forwards_trailing_partial_frame() -> None:
+    gate = SilenceGate(EnergyVad(), frame_samples=_FRAME, padding_frames=0)
+    out = gate.process(np.zeros(_FRAME + 10, dtype=np.int16))
+    assert len(out) == 10
+    assert gate.finish() == _FRAME
@@ -25,9 +25,11 @@ class AudioStreamer:
         debug: bool = False,
         sr: int = config.ASR_SAMPLE_RATE,
         chunk_samples: int = config.CHUNK_SAMPLES,
+        binary: bool = False,
     ) -> None:
         self.pcm_bytes = pcm_bytes
         self.debug = debug
+        self.binary = bool(binary)
         self.sr = int(sr)
         self.chunk_samples = int(chunk_samples)
         self.chunk_bytes = self.chunk_samples * 2
@@ -57,14 +59,17 @@ class AudioStreamer:
             if not chunk:
                 continue
 
-            audio_b64 = base64.b64encode(chunk).decode("ascii")
-            msg: dict[str, Any] = {
-                config.PROTO_KEY_TYPE: config.PROTO_TYPE_AUDIO_APPEND,
-                config.PROTO_KEY_SESSION_ID: session_id,
-                config.PROTO_KEY_REQUEST_ID: request_id,
-                config.PROTO_KEY_PAYLOAD: {"audio": audio_b64},
-            }
-            await ws.send(json.dumps(msg))
+            if self.binary:
+                await ws.send(chunk)
+            else:
+                audio_b64 = base64.b64encode(chunk).decode("ascii")
+                msg: dict[str, Any] = {
+                    config.PROTO_KEY_TYPE: config.PROTO_TYPE_AUDIO_APPEND,
+                    config.PROTO_KEY_SESSION_ID: session_id,
+                    config.PROTO_KEY_REQUEST_ID: request_id,
+                    config.PROTO_KEY_PAYLOAD: {"audio": audio_b64},
+                }
+                await ws.send(json.dumps(msg))
 
             self.last_chunk_sent_ts = time.perf_counter()
             if first_chunk_sent_ts == config.DEFAULT_ZERO: